@@ -4,31 +4,80 @@
 import argparse
 import asyncio
 import logging
+import queue
 import sys
+import time
+from datetime import timedelta
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Optional
 
-from stable_squirrel.config import load_config
+from stable_squirrel.config import DatabaseConfig, load_config
 from stable_squirrel.database import (
+    SCHEMA_VERSION,
     DatabaseManager,
     create_schema,
+    ensure_rum_index,
     ensure_timescale_setup,
+    record_schema_version,
+    security_rollup_available,
+    set_chunk_time_interval,
 )
-from stable_squirrel.services.transcription import TranscriptionService
-from stable_squirrel.web.app import create_app
 
 logger = logging.getLogger(__name__)
 
 
-def setup_logging(log_level: str = "INFO") -> None:
-    """Configure logging for the application."""
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler("stable_squirrel.log"),
-        ],
-    )
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the date/time part of ``asctime`` at most once per second."""
+
+    def __init__(self, fmt: str) -> None:
+        super().__init__(fmt)
+        self._cached_time: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if second != cached_second:
+            formatted = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_time = (second, formatted)
+        if self.default_msec_format:
+            return self.default_msec_format % (formatted, record.msecs)
+        return formatted
+
+
+def setup_logging(log_level: str = "INFO") -> QueueListener:
+    """
+    Configure logging for the application.
+
+    Records are only enqueued on the calling (event loop) thread; a background
+    listener thread does the blocking stdout/file writes. The returned listener
+    must be stopped on shutdown to flush pending records.
+    """
+    # The format never shows thread/process/task names, so skip collecting them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    if sys.version_info >= (3, 12):
+        setattr(logging, "logAsyncioTasks", False)  # Not in the logging type stubs yet
+
+    formatter = _CachedTimeFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    output_handlers: list[logging.Handler] = [
+        logging.StreamHandler(sys.stdout),
+        logging.FileHandler("stable_squirrel.log"),
+    ]
+    for handler in output_handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    listener = QueueListener(log_queue, *output_handlers)
+
+    # The queue side only merges args into the message; output handlers apply the real format
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    logging.basicConfig(level=getattr(logging, log_level.upper()), handlers=[queue_handler])
+    listener.start()
+    return listener
 
 
 async def main() -> None:
@@ -59,27 +108,66 @@ async def main() -> None:
     )
 
     args = parser.parse_args()
-    setup_logging(args.log_level)
+    log_listener = setup_logging(args.log_level)
+
+    try:
+        await run(args)
+    finally:
+        log_listener.stop()
+
+
+async def setup_schema(db_config: DatabaseConfig, db_manager: DatabaseManager) -> None:
+    """Create the database schema if needed (skipped when already set up for this version)."""
+    if not db_config.create_tables:
+        return
 
+    up_to_date = await db_manager.schema_version() == SCHEMA_VERSION
+    if up_to_date:
+        logger.info(f"Database schema is up to date (version {SCHEMA_VERSION})")
+    else:
+        await create_schema(db_manager)
+
+    # Idempotent, and TimescaleDB may have been installed after the schema version was recorded
+    if db_config.enable_timescale:
+        await ensure_timescale_setup(db_manager)
+
+    if not up_to_date:
+        await record_schema_version(db_manager)
+
+    # Cheap and only affects chunks created from now on, so follow the config on every startup
+    if db_config.enable_timescale:
+        await set_chunk_time_interval(db_manager, timedelta(hours=db_config.chunk_time_interval_hours))
+        db_manager.security_rollup = await security_rollup_available(db_manager)
+
+    # Optional extension, checked on every startup since it can be installed at any time
+    if db_config.enable_rum_index:
+        db_manager.rum_search = await ensure_rum_index(db_manager)
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Start all services and serve until shutdown."""
     logger.info("Starting Stable Squirrel...")
 
     # Load configuration
     config = load_config(args.config)
 
+    # Heavy imports (WhisperX/torch, FastAPI) are deferred until the config is known good
+    from stable_squirrel.services.transcription import TranscriptionService
+    from stable_squirrel.web.app import create_app
+
     # Initialize database
     db_manager = DatabaseManager(config.database)
     await db_manager.initialize()
 
-    # Create database schema if needed
-    if config.database.create_tables:
-        await create_schema(db_manager)
-
-        if config.database.enable_timescale:
-            await ensure_timescale_setup(db_manager)
-
     # Initialize services
     transcription_service = TranscriptionService(config.transcription, db_manager)
 
+    # Schema DDL is I/O-bound and model loading runs in a worker thread, so overlap them
+    await asyncio.gather(
+        setup_schema(config.database, db_manager),
+        transcription_service.preload_model(),
+    )
+
     # Create web application (includes RdioScanner API endpoint)
     app = create_app(config, transcription_service, db_manager)
 
@@ -117,4 +205,10 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        # libuv-based event loop (installed with uvicorn[standard]; unavailable on Windows)
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -1,10 +1,27 @@
 """Configuration management for Stable Squirrel."""
 
+import hashlib
+import ipaddress
+import logging
+import os
+import tempfile
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAMLDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+logger = logging.getLogger(__name__)
+
+
+def api_key_digest(api_key: str) -> bytes:
+    """SHA-256 digest API keys are indexed and compared by."""
+    return hashlib.sha256(api_key.encode()).digest()
 
 
 class APIKeyConfig(BaseModel):
@@ -12,8 +29,38 @@ class APIKeyConfig(BaseModel):
 
     key: str
     description: Optional[str] = None
-    allowed_ips: Optional[list[str]] = None  # If set, only these IPs can use this key
-    allowed_systems: Optional[list[str]] = None  # If set, only these system IDs can use this key
+    # Lists in YAML; stored as frozensets so the per-upload membership checks are O(1)
+    allowed_ips: Optional[frozenset[str]] = None  # If set, only these IPs/CIDR ranges can use this key
+    allowed_systems: Optional[frozenset[str]] = None  # If set, only these system IDs can use this key
+
+    @field_validator("allowed_ips")
+    @classmethod
+    def _check_networks(cls, value: Optional[frozenset[str]]) -> Optional[frozenset[str]]:
+        for entry in value or ():
+            if "/" in entry:
+                ipaddress.ip_network(entry, strict=False)  # ValueError names the bad entry
+        return value
+
+    @cached_property
+    def allowed_networks(self) -> tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...]:
+        """CIDR entries of ``allowed_ips``; plain addresses are matched by the set lookup instead."""
+        return tuple(ipaddress.ip_network(entry, strict=False) for entry in self.allowed_ips or () if "/" in entry)
+
+    def allows_ip(self, client_ip: str) -> bool:
+        """Whether ``client_ip`` may use this key (always True without an allowlist)."""
+        if not self.allowed_ips or client_ip in self.allowed_ips:
+            return True
+        if not self.allowed_networks:
+            return False
+        try:
+            address = ipaddress.ip_address(client_ip)
+        except ValueError:
+            return False
+        return any(address in network for network in self.allowed_networks)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self.__dict__.pop("allowed_networks", None)
 
 
 class IngestionConfig(BaseModel):
@@ -42,6 +89,24 @@ class IngestionConfig(BaseModel):
     log_all_uploads: bool = False  # Log all upload attempts
     security_event_retention_days: int = 365  # Security event retention period
 
+    @cached_property
+    def legacy_api_key_digest(self) -> Optional[bytes]:
+        """Digest of the legacy ``api_key`` (cached until a field is reassigned)."""
+        return api_key_digest(self.api_key) if self.api_key else None
+
+    @cached_property
+    def api_key_index(self) -> dict[bytes, APIKeyConfig]:
+        """``api_keys`` by key digest, first entry winning for duplicates (cached until a field is reassigned)."""
+        index: dict[bytes, APIKeyConfig] = {}
+        for key_config in self.api_keys:
+            index.setdefault(api_key_digest(key_config.key), key_config)
+        return index
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self.__dict__.pop("legacy_api_key_digest", None)
+        self.__dict__.pop("api_key_index", None)
+
 
 class TranscriptionConfig(BaseModel):
     """Configuration for the transcription service."""
@@ -59,7 +124,7 @@ class TranscriptionConfig(BaseModel):
     cleanup_interval_minutes: int = 5  # How often to clean up temp files
 
     # Advanced model settings
-    compute_type: str = "auto"  # float16 for GPU, int8 for CPU
+    compute_type: str = "auto"  # int8_float16 for GPU, int8 for CPU
     chunk_length: int = 30  # Audio chunk length for processing
     use_pipeline_cache: bool = True  # Cache model pipeline for speed
 
@@ -80,12 +145,24 @@ class DatabaseConfig(BaseModel):
     # Schema management
     create_tables: bool = True
     enable_timescale: bool = True
+    # Hypertable chunk size; shorter chunks (e.g. 6) suit high-volume deployments
+    chunk_time_interval_hours: int = 24
+    # Ranked transcript search through a RUM index (needs the rum extension installed)
+    enable_rum_index: bool = False
+
+    # In-process cache for call/transcription/segment lookups by call ID (0 disables)
+    record_cache_size: int = 10000
+    record_cache_ttl_seconds: float = 300.0
 
-    @property
+    @cached_property
     def connection_url(self) -> str:
-        """Build PostgreSQL connection URL."""
+        """Build PostgreSQL connection URL (cached until a field is reassigned)."""
         return f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self.__dict__.pop("connection_url", None)
+
 
 class WebConfig(BaseModel):
     """Configuration for the web interface."""
@@ -116,8 +193,21 @@ class Config(BaseModel):
     alerts: AlertConfig = Field(default_factory=AlertConfig)
 
 
+class _ConfigCacheFile(BaseModel):
+    """On-disk layout of the JSON sidecar cache."""
+
+    source_mtime_ns: int
+    source_size: int
+    config: Config
+
+
 def load_config(config_path: Path | str) -> Config:
-    """Load configuration from a YAML file."""
+    """Load configuration from a YAML file.
+
+    Parsed configs are cached by path, mtime and size, so repeated loads of an
+    unchanged file skip re-parsing. Each call returns its own deep copy, so
+    callers may modify the result without affecting the cache.
+    """
     config_path = Path(config_path)
     if not config_path.exists():
         # Create a default config file
@@ -125,10 +215,61 @@ def load_config(config_path: Path | str) -> Config:
         save_config(default_config, config_path)
         return default_config
 
+    stat = config_path.stat()
+    return _parse_config(str(config_path), stat.st_mtime_ns, stat.st_size).model_copy(deep=True)
+
+
+@lru_cache(maxsize=8)
+def _parse_config(config_path: str, mtime_ns: int, size: int) -> Config:
+    """Parse and validate a config file (cached on path, mtime and size)."""
+    cache_path = _config_cache_path(Path(config_path))
+
+    # Warm start: reuse the JSON sidecar if it was built from this exact file
+    # (decoded by pydantic-core straight into the model tree, no intermediate dicts)
+    try:
+        cached = _ConfigCacheFile.model_validate_json(cache_path.read_bytes())
+        if cached.source_mtime_ns == mtime_ns and cached.source_size == size:
+            return cached.config
+    except (OSError, ValueError):
+        pass
+
     with open(config_path) as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_YAMLLoader) or {}
+
+    config = Config(**data)
+    _write_config_cache(cache_path, config, mtime_ns, size)
+    return config
+
+
+def _config_cache_path(config_path: Path) -> Path:
+    """Get the JSON sidecar cache path for a config file."""
+    return config_path.with_suffix(config_path.suffix + ".cache.json")
+
+
+def _write_config_cache(cache_path: Path, config: Config, mtime_ns: int, size: int) -> None:
+    """Atomically write the parsed config to its JSON sidecar cache."""
+    # Only values the YAML actually set are stored, so defaults always come from the running code
+    cache_file = _ConfigCacheFile(source_mtime_ns=mtime_ns, source_size=size, config=config)
+    payload = cache_file.model_dump_json(exclude_unset=True)
+
+    try:
+        # mkstemp creates the file 0600, which os.replace preserves (the config holds credentials)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        # The cache is only an optimization - read-only config dirs are fine
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+
 
-    return Config(**data)
+def clear_config_cache() -> None:
+    """Drop all cached parsed configurations."""
+    _parse_config.cache_clear()
 
 
 def save_config(config: Config, config_path: Path) -> None:
@@ -136,4 +277,4 @@ def save_config(config: Config, config_path: Path) -> None:
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(config_path, "w") as f:
-        yaml.dump(config.model_dump(), f, default_flow_style=False)
+        yaml.dump(config.model_dump(mode="json"), f, Dumper=_YAMLDumper, default_flow_style=False)
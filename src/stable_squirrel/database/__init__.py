@@ -3,7 +3,15 @@
 from .connection import DatabaseManager
 from .models import RadioCall, SearchQuery, SearchResult, SpeakerSegment, Transcription
 from .operations import DatabaseOperations
-from .schema import create_schema, ensure_timescale_setup
+from .schema import (
+    SCHEMA_VERSION,
+    create_schema,
+    ensure_rum_index,
+    ensure_timescale_setup,
+    record_schema_version,
+    security_rollup_available,
+    set_chunk_time_interval,
+)
 
 __all__ = [
     "DatabaseManager",
@@ -13,6 +21,11 @@ __all__ = [
     "SpeakerSegment",
     "SearchQuery",
     "SearchResult",
+    "SCHEMA_VERSION",
     "create_schema",
+    "ensure_rum_index",
     "ensure_timescale_setup",
+    "record_schema_version",
+    "security_rollup_available",
+    "set_chunk_time_interval",
 ]
@@ -0,0 +1,87 @@
+"""In-process cache for point lookups keyed by call ID."""
+
+import itertools
+import time
+from collections import OrderedDict
+from typing import Any
+from uuid import UUID
+
+# Kinds of cached rows; each call can have one entry per kind
+RADIO_CALL = "radio_call"
+TRANSCRIPTION = "transcription"
+SPEAKER_SEGMENTS = "speaker_segments"
+
+CACHE_KINDS = (RADIO_CALL, TRANSCRIPTION, SPEAKER_SEGMENTS)
+
+
+class RecordCache:
+    """
+    Bounded LRU cache with a per-entry TTL for rows fetched by call ID.
+
+    Entries are keyed by ``(kind, call_id)`` so every cached view of a call can
+    be dropped at once with ``invalidate(call_id)``. Cached values are shared
+    between callers and must be immutable (asyncpg Records, tuples).
+
+    A reader takes ``generation(call_id)`` before querying and hands it to
+    ``set``; an ``invalidate`` in between changes the generation, so a row read
+    before a concurrent write committed is never cached.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, UUID], tuple[float, Any]] = OrderedDict()
+        # Latest invalidation stamp per call, bounded like the entries; forgotten
+        # calls report the newest evicted stamp so their generation still moves on
+        self._generations: OrderedDict[UUID, int] = OrderedDict()
+        self._invalidation_stamps = itertools.count(1)
+        self._forgotten_generation = 0
+
+    def get(self, kind: str, call_id: UUID) -> Any:
+        """Return the cached value, or None when missing or expired."""
+        key = (kind, call_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def generation(self, call_id: UUID) -> int:
+        """Token for a value about to be fetched; changes with every ``invalidate(call_id)``."""
+        return self._generations.get(call_id, self._forgotten_generation)
+
+    def set(self, kind: str, call_id: UUID, value: Any, generation: int) -> None:
+        """Cache a value fetched at ``generation``, unless the call was invalidated since."""
+        if self.max_entries <= 0 or self.generation(call_id) != generation:
+            return
+
+        key = (kind, call_id)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, call_id: UUID) -> None:
+        """Drop every cached entry for a call."""
+        for kind in CACHE_KINDS:
+            self._entries.pop((kind, call_id), None)
+
+        self._generations[call_id] = next(self._invalidation_stamps)
+        self._generations.move_to_end(call_id)
+        if len(self._generations) > max(self.max_entries, 1):
+            _, self._forgotten_generation = self._generations.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries, and keep values already being fetched from being cached."""
+        self._entries.clear()
+        self._generations.clear()
+        self._forgotten_generation = next(self._invalidation_stamps)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -2,16 +2,21 @@
 
 import logging
 from contextlib import asynccontextmanager
-from datetime import datetime
-from typing import Any, AsyncGenerator, Optional, TypedDict, Union
+from datetime import datetime, timedelta
+from typing import Any, AsyncGenerator, AsyncIterator, Optional, TypedDict, Union
 from uuid import UUID
 
 import asyncpg
+from pydantic_core import from_json, to_json
 
 from stable_squirrel.config import DatabaseConfig
 
+from .cache import RecordCache
+from .event_writer import SecurityEventWriter
+from .queries import HOT_QUERIES, HOT_QUERY_RECORD_CLASSES
+
 # Type alias for database query arguments
-DBArg = Union[str, int, float, bool, None, bytes, datetime, UUID]
+DBArg = Union[str, int, float, bool, None, bytes, datetime, timedelta, UUID, dict[str, Any], list[Any]]
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +37,14 @@ class DatabaseManager:
     def __init__(self, config: DatabaseConfig):
         self.config = config
         self._pool: Optional[asyncpg.Pool] = None
+        # Shared by every DatabaseOperations built on this manager
+        self.record_cache = RecordCache(config.record_cache_size, config.record_cache_ttl_seconds)
+        # Batches queued security events into multi-row inserts while the pool is open
+        self.security_event_writer = SecurityEventWriter(self)
+        # Set once the RUM transcript index is confirmed (see ensure_rum_index)
+        self.rum_search = False
+        # Set once the security event continuous aggregate is confirmed (see security_rollup_available)
+        self.security_rollup = False
 
     async def initialize(self) -> None:
         """Initialize database connection pool."""
@@ -47,6 +60,19 @@ class DatabaseManager:
                 min_size=self.config.min_pool_size,
                 max_size=self.config.max_pool_size,
                 command_timeout=60,
+                # Keep parsed statements (including every HOT_QUERIES entry) for the life of the connection
+                statement_cache_size=1024,
+                max_cached_statement_lifetime=0,
+                # Idle connections above min_size are closed after 5 minutes rather than churned per burst
+                max_inactive_connection_lifetime=300,
+                # Startup parameters survive the pool's RESET ALL on release (a SET would not).
+                # Our queries are short OLTP lookups/inserts where JIT compilation only adds latency.
+                server_settings={
+                    "jit": "off",
+                    "plan_cache_mode": "force_generic_plan",
+                    "application_name": "stable-squirrel",
+                },
+                init=self._init_connection,
             )
 
             # Test connection
@@ -69,16 +95,33 @@ class DatabaseManager:
                     except Exception as e:
                         logger.warning(f"Could not check TimescaleDB version: {e}")
 
+            self.security_event_writer.start()
             logger.info("Database connection pool initialized")
 
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}")
             raise
 
+    async def _init_connection(self, conn: asyncpg.Connection) -> None:
+        """Register type codecs once for each new pool connection."""
+        # JSON columns map straight to/from Python objects (parsed in pydantic-core, not per row in Python)
+        for json_type in ("json", "jsonb"):
+            await conn.set_type_codec(
+                json_type, schema="pg_catalog", encoder=lambda value: to_json(value).decode(), decoder=from_json
+            )
+        # Our models carry IP addresses as strings, so skip building ipaddress objects
+        await conn.set_type_codec("inet", schema="pg_catalog", encoder=str, decoder=str, format="text")
+
+    async def fetchrow_hot(self, key: str, *args: DBArg) -> Optional[asyncpg.Record]:
+        """Run a ``HOT_QUERIES`` entry by key and return its first row, via asyncpg's statement cache."""
+        return await self.pool.fetchrow(HOT_QUERIES[key], *args, record_class=HOT_QUERY_RECORD_CLASSES.get(key))
+
     async def close(self) -> None:
         """Close database connection pool."""
         if self._pool:
+            await self.security_event_writer.stop()
             await self._pool.close()
+            self.record_cache.clear()
             logger.info("Database connection pool closed")
 
     @property
@@ -88,27 +131,55 @@ class DatabaseManager:
             raise RuntimeError("Database not initialized - call initialize() first")
         return self._pool
 
+    # Single-shot helpers use the pool's shortcut methods instead of an explicit acquire()
     async def execute(self, query: str, *args: DBArg) -> str:
         """Execute a query and return status."""
-        async with self.pool.acquire() as conn:
-            result = await conn.execute(query, *args)
-            return str(result)
+        return str(await self.pool.execute(query, *args))
 
-    async def fetch(self, query: str, *args: DBArg) -> list[asyncpg.Record]:
-        """Fetch multiple rows."""
-        async with self.pool.acquire() as conn:
-            rows = await conn.fetch(query, *args)
-            return list(rows)
+    async def fetch(
+        self, query: str, *args: DBArg, record_class: Optional[type[asyncpg.Record]] = None
+    ) -> list[asyncpg.Record]:
+        """Fetch multiple rows, optionally as a custom ``record_class``."""
+        return list(await self.pool.fetch(query, *args, record_class=record_class))
 
     async def fetchrow(self, query: str, *args: DBArg) -> Optional[asyncpg.Record]:
         """Fetch single row."""
-        async with self.pool.acquire() as conn:
-            return await conn.fetchrow(query, *args)
+        return await self.pool.fetchrow(query, *args)
 
     async def fetchval(self, query: str, *args: DBArg) -> Any:
         """Fetch single value."""
+        return await self.pool.fetchval(query, *args)
+
+    async def schema_version(self) -> Optional[int]:
+        """Return the schema version recorded in ``schema_meta``, or None if never recorded."""
+        try:
+            version = await self.fetchval("SELECT version FROM schema_meta")
+        except asyncpg.UndefinedTableError:
+            return None
+        return int(version) if version is not None else None
+
+    async def iterate(
+        self,
+        query: str,
+        *args: DBArg,
+        prefetch: int = 500,
+        record_class: Optional[type[asyncpg.Record]] = None,
+    ) -> AsyncIterator[asyncpg.Record]:
+        """Stream rows through a server-side cursor, fetching ``prefetch`` rows per round-trip."""
+        async with self.transaction() as conn:
+            async for row in conn.cursor(query, *args, prefetch=prefetch, record_class=record_class):
+                yield row
+
+    async def execute_session(self, *queries: str) -> None:
+        """
+        Run queries in order on one connection, outside any transaction block.
+
+        Settings made with ``SET`` apply to the queries after them and are reset
+        when the connection returns to the pool.
+        """
         async with self.pool.acquire() as conn:
-            return await conn.fetchval(query, *args)
+            for query in queries:
+                await conn.execute(query)
 
     @asynccontextmanager
     async def transaction(self) -> AsyncGenerator[asyncpg.Connection, None]:
@@ -117,14 +188,17 @@ class DatabaseManager:
             async with conn.transaction():
                 yield conn
 
-    async def execute_transaction(self, operations: list[tuple[str, tuple[DBArg, ...]]]) -> list[str]:
-        """Execute multiple operations in a single transaction."""
+    async def execute_transaction(self, statements: dict[str, list[tuple[DBArg, ...]]]) -> None:
+        """
+        Execute batches of statements in a single transaction.
+
+        Args rows are grouped by query; each group is sent with one executemany()
+        (one parse, N binds, one sync). Groups run in insertion order.
+        """
         async with self.transaction() as conn:
-            results: list[str] = []
-            for query, args in operations:
-                result = await conn.execute(query, *args)
-                results.append(result)
-            return results
+            for query, rows in statements.items():
+                if rows:
+                    await conn.executemany(query, rows)
 
     async def health_check(self) -> bool:
         """Check database health."""
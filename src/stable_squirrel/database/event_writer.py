@@ -0,0 +1,182 @@
+"""Batched background writer for security events."""
+
+import asyncio
+import logging
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+from pydantic_core import to_json
+
+from stable_squirrel.database.models import SecurityEvent
+
+if TYPE_CHECKING:
+    from stable_squirrel.database.connection import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+# Flush whichever comes first: a full batch or this long after the batch's first event
+MAX_BATCH_SIZE = 1000
+FLUSH_INTERVAL_SECONDS = 0.1
+MAX_QUEUED_EVENTS = 10000
+
+# Tallied routine events are written as one summary event per source this often
+TALLY_INTERVAL_SECONDS = 60.0
+
+# (event_type, source_ip, source_system, api_key_used)
+TallyKey = tuple[str, Optional[str], Optional[str], Optional[str]]
+
+
+def security_event_columns(events: Sequence[SecurityEvent]) -> list[list[Any]]:
+    """Transpose events into the per-column arrays bound by INSERT_SECURITY_EVENTS."""
+    return [
+        [event.event_id for event in events],
+        [event.timestamp for event in events],
+        [event.event_type for event in events],
+        [event.severity for event in events],
+        [event.source_ip for event in events],
+        [event.source_system for event in events],
+        [event.api_key_used for event in events],
+        [event.user_agent for event in events],
+        [event.description for event in events],
+        # Serialized here and cast to JSONB in SQL, since the array is bound as text[]
+        [to_json(event.metadata).decode() if event.metadata else None for event in events],
+        [event.related_call_id for event in events],
+        [event.related_file_path for event in events],
+    ]
+
+
+class SecurityEventWriter:
+    """
+    Queue security events and insert them in batches from a background task.
+
+    ``submit()`` never waits on the database, so callers on the request path pay
+    no round-trip per event. A batch is one multi-row INSERT of up to
+    ``MAX_BATCH_SIZE`` events. High-volume routine events can instead be
+    ``tally()``-ed: only counted, then summarized every ``TALLY_INTERVAL_SECONDS``.
+    """
+
+    def __init__(
+        self,
+        db_manager: "DatabaseManager",
+        max_queued: int = MAX_QUEUED_EVENTS,
+        tally_interval: float = TALLY_INTERVAL_SECONDS,
+    ):
+        self.db = db_manager
+        self._queue: asyncio.Queue[SecurityEvent] = asyncio.Queue(maxsize=max_queued)
+        self._task: Optional[asyncio.Task[None]] = None
+        self._tally_task: Optional[asyncio.Task[None]] = None
+        # Events taken off the queue for the batch being collected, and the insert in flight;
+        # kept here so stop() can still write them after cancelling the flush task
+        self._batch: list[SecurityEvent] = []
+        self._flush: Optional[asyncio.Task[None]] = None
+        self._tallies: Counter[TallyKey] = Counter()
+        self.tally_interval = tally_interval
+        self.written = 0
+        self.dropped = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background flush task."""
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run(), name="security-event-writer")
+            self._tally_task = asyncio.create_task(self._run_tallies(), name="security-event-tallies")
+
+    async def stop(self) -> None:
+        """Stop the flush task and write whatever is still queued or tallied."""
+        for task in (self._task, self._tally_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = self._tally_task = None
+
+        if self._flush is not None:
+            await self._flush
+            self._flush = None
+        if self._batch:
+            batch, self._batch = self._batch, []
+            await self._write(batch)
+
+        self._submit_tallies()
+        while not self._queue.empty():
+            await self._write(self._take(MAX_BATCH_SIZE))
+
+    def submit(self, event: SecurityEvent) -> bool:
+        """Queue an event for the next batch; returns False if the queue is full and it was dropped."""
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+
+    def tally(
+        self,
+        event_type: str,
+        source_ip: Optional[str] = None,
+        source_system: Optional[str] = None,
+        api_key_used: Optional[str] = None,
+    ) -> None:
+        """Count a routine event without building or storing it individually."""
+        self._tallies[(event_type, source_ip, source_system, api_key_used)] += 1
+
+    def _submit_tallies(self) -> None:
+        """Queue one info event per tallied source carrying its count, and reset the counts."""
+        tallies, self._tallies = self._tallies, Counter()
+        for (event_type, source_ip, source_system, api_key_used), count in tallies.items():
+            self.submit(
+                SecurityEvent.model_construct(
+                    event_type=event_type,
+                    severity="info",
+                    source_ip=source_ip,
+                    source_system=source_system,
+                    api_key_used=api_key_used,
+                    description=f"{count} {event_type} events from system {source_system}",
+                    metadata={"count": count, "interval_seconds": self.tally_interval},
+                )
+            )
+
+    async def _run_tallies(self) -> None:
+        while True:
+            await asyncio.sleep(self.tally_interval)
+            self._submit_tallies()
+
+    def _take(self, limit: int) -> list[SecurityEvent]:
+        """Dequeue up to ``limit`` already-queued events without waiting."""
+        batch: list[SecurityEvent] = []
+        while len(batch) < limit and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._batch.append(await self._queue.get())
+            deadline = loop.time() + FLUSH_INTERVAL_SECONDS
+            while len(self._batch) < MAX_BATCH_SIZE:
+                self._batch.extend(self._take(MAX_BATCH_SIZE - len(self._batch)))
+                remaining = deadline - loop.time()
+                if len(self._batch) >= MAX_BATCH_SIZE or remaining <= 0:
+                    break
+                try:
+                    self._batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            batch, self._batch = self._batch, []
+            self._flush = asyncio.create_task(self._write(batch))
+            # Shielded so cancelling this task lets an insert in progress finish
+            await asyncio.shield(self._flush)
+            self._flush = None
+
+    async def _write(self, batch: list[SecurityEvent]) -> None:
+        try:
+            await self.db.fetchrow_hot("insert_security_events", *security_event_columns(batch))
+            self.written += len(batch)
+        except Exception as e:
+            # Audit events are best-effort; never let a failed batch stop the writer
+            logger.warning(f"Failed to write {len(batch)} security events: {e}")
@@ -1,16 +1,32 @@
-"""Pydantic models for radio call data."""
-
+"""Pydantic models for radio call data.
+
+Input models (``*Create``, ``SearchQuery``) are fully validated. Models hydrated
+from database rows are built with ``model_construct()`` since the schema already
+guarantees their types. Read-only result types (``SearchResult``,
+``TranscriptionResponse``) are slotted frozen dataclasses: they are created in
+bulk per request, never mutated, and Pydantic serializes them without
+revalidating.
+"""
+
+import sys
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, List, Optional
-from uuid import UUID, uuid4
+from typing import Annotated, Any, List, Literal, Optional
+from uuid import UUID
+
+from pydantic import AfterValidator, BaseModel, Field
+
+from stable_squirrel.utils.uuid_pool import next_uuid
 
-from pydantic import BaseModel, Field
+# Low-cardinality strings repeated across many records (speaker labels, formats, statuses).
+# Interning makes equal values share one object instead of allocating per record.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
 
 
 class RadioCallCreate(BaseModel):
     """Model for creating a new radio call record."""
 
-    call_id: UUID = Field(default_factory=uuid4)
+    call_id: UUID = Field(default_factory=next_uuid)
     timestamp: datetime
     frequency: int  # Hz
     talkgroup_id: Optional[int] = None
@@ -18,15 +34,15 @@ class RadioCallCreate(BaseModel):
     system_id: Optional[int] = None
 
     # Labels and aliases
-    system_label: Optional[str] = None
+    system_label: Optional[InternedStr] = None
     talkgroup_label: Optional[str] = None
-    talkgroup_group: Optional[str] = None
+    talkgroup_group: Optional[InternedStr] = None
     talker_alias: Optional[str] = None
 
     # Audio file info
     audio_file_path: str
     audio_duration_seconds: Optional[float] = None
-    audio_format: str = "wav"
+    audio_format: InternedStr = "wav"
 
     # Security tracking (enhanced security)
     upload_source_ip: Optional[str] = None
@@ -38,8 +54,7 @@ class RadioCallCreate(BaseModel):
 class RadioCall(RadioCallCreate):
     """Complete radio call record with database fields."""
 
-    call_id: UUID = Field(default_factory=uuid4)
-    transcription_status: str = "pending"  # pending, processing, completed, failed
+    transcription_status: InternedStr = "pending"  # pending, processing, completed, failed
     transcribed_at: Optional[datetime] = None
 
 
@@ -47,14 +62,14 @@ class SpeakerSegment(BaseModel):
     """Individual speaker segment from diarization."""
 
     call_id: UUID
-    segment_id: UUID = Field(default_factory=uuid4)
+    segment_id: UUID = Field(default_factory=next_uuid)
 
     # Timing within the call
     start_time_seconds: float
     end_time_seconds: float
 
     # Speaker identification
-    speaker_id: str  # Speaker label from diarization
+    speaker_id: InternedStr  # Speaker label from diarization
 
     # Segment content
     text: str
@@ -68,7 +83,7 @@ class TranscriptionCreate(BaseModel):
 
     # WhisperX results
     full_transcript: str
-    language: Optional[str] = None
+    language: Optional[InternedStr] = None
     confidence_score: Optional[float] = None
 
     # Speaker diarization
@@ -102,8 +117,12 @@ class SearchQuery(BaseModel):
     limit: int = Field(default=50, ge=1, le=1000)
     offset: int = Field(default=0, ge=0)
 
+    # "list" returns a short highlighted snippet instead of the full transcript
+    projection: Literal["full", "list"] = "full"
+
 
-class SearchResult(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class SearchResult:
     """Search result with call and transcription data."""
 
     # Radio call data
@@ -117,8 +136,9 @@ class SearchResult(BaseModel):
     audio_file_path: str
     audio_duration_seconds: Optional[float] = None
 
-    # Transcription data
+    # Transcription data (list projection fills snippet instead of full_transcript)
     full_transcript: Optional[str] = None
+    snippet: Optional[str] = None
     speaker_count: Optional[int] = None
     confidence_score: Optional[float] = None
 
@@ -126,7 +146,8 @@ class SearchResult(BaseModel):
     search_rank: Optional[float] = None
 
 
-class TranscriptionResponse(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class TranscriptionResponse:
     """Response model for transcription queries."""
 
     id: str
@@ -159,7 +180,7 @@ class PaginatedSearchResponse(BaseModel):
 class SecurityEvent(BaseModel):
     """Security audit log entry."""
 
-    event_id: UUID = Field(default_factory=uuid4)
+    event_id: UUID = Field(default_factory=next_uuid)
     timestamp: datetime = Field(default_factory=datetime.now)
     event_type: str  # "upload_blocked", "invalid_api_key", "rate_limit_exceeded", etc.
     severity: str = "info"  # "low", "medium", "high", "critical"
@@ -1,12 +1,16 @@
 """Database CRUD operations for radio calls and transcriptions."""
 
-import json
 import logging
 from datetime import datetime
-from typing import Any, List, Optional, TypedDict
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterable, List, Optional, TypedDict
 from uuid import UUID
 
+import asyncpg
+
+from stable_squirrel.database.cache import RADIO_CALL, SPEAKER_SEGMENTS, TRANSCRIPTION, RecordCache
 from stable_squirrel.database.connection import DatabaseManager
+from stable_squirrel.database.event_writer import security_event_columns
 from stable_squirrel.database.models import (
     RadioCall,
     RadioCallCreate,
@@ -17,6 +21,15 @@ from stable_squirrel.database.models import (
     Transcription,
     TranscriptionCreate,
 )
+from stable_squirrel.database.queries import (
+    HOT_QUERIES,
+    SELECT_RADIO_CALLS,
+    SELECT_SPEAKER_SEGMENTS,
+    SELECT_TRANSCRIPTIONS,
+    SPEAKER_SEGMENT_COLUMNS,
+    TRANSCRIPTION_RESULT_COLUMNS,
+)
+from stable_squirrel.database.records import RadioCallRecord
 
 
 class TranscriptionStoreResult(TypedDict):
@@ -39,6 +52,251 @@ class UploadSourceAnalysis(TypedDict):
 
 logger = logging.getLogger(__name__)
 
+# Below this many rows a single unnest() INSERT is cheaper than setting up a COPY
+SEGMENT_COPY_THRESHOLD = 32
+
+# Snippet length for list-projection searches that have no query text to highlight
+SNIPPET_FALLBACK_CHARS = 160
+
+# Optional search filters as (input name, SQL condition); "{}" receives the bind placeholder
+RADIO_CALL_FILTERS = (
+    ("frequency", "frequency = {}"),
+    ("talkgroup_id", "talkgroup_id = {}"),
+    ("system_id", "system_id = {}"),
+    ("start_time", "timestamp >= {}"),
+    ("end_time", "timestamp <= {}"),
+)
+
+TRANSCRIPTION_SEARCH_FILTERS = (
+    ("frequency", "rc.frequency = {}"),
+    ("talkgroup_id", "rc.talkgroup_id = {}"),
+    ("system_id", "rc.system_id = {}"),
+    ("start_time", "rc.timestamp >= {}"),
+    ("end_time", "rc.timestamp <= {}"),
+)
+
+SECURITY_EVENT_FILTERS = (
+    ("event_type", "event_type = {}"),
+    ("severity", "severity = {}"),
+    ("source_ip", "source_ip = {}"),
+    ("source_system", "source_system = {}"),
+    ("start_time", "timestamp >= {}"),
+    ("end_time", "timestamp <= {}"),
+    # Containment, answerable from the jsonb_path_ops GIN index
+    ("metadata_contains", "metadata @> {}"),
+)
+
+
+def _filter_mask(filters: tuple[tuple[str, str], ...], values: dict[str, Any], params: list[Any]) -> int:
+    """Append the bind parameter of every filter that has a value and return the set filters as a bitmask."""
+    mask = 0
+    for bit, (name, _) in enumerate(filters):
+        value = values[name]
+        if value:
+            mask |= 1 << bit
+            params.append(value)
+    return mask
+
+
+def _filter_conditions(filters: tuple[tuple[str, str], ...], mask: int, first_param: int) -> list[str]:
+    """Render the conditions selected by ``mask`` with placeholders numbered from ``first_param``."""
+    conditions: list[str] = []
+    for bit, (_, condition) in enumerate(filters):
+        if mask >> bit & 1:
+            conditions.append(condition.format(f"${first_param + len(conditions)}"))
+    return conditions
+
+
+# Search statements are rendered once per filter combination (at most 2^6 shapes) and
+# reused, so identical requests hit asyncpg's statement cache with the same SQL text.
+
+
+@lru_cache(maxsize=None)
+def _radio_calls_sql(mask: int) -> str:
+    """Radio call search statement for one combination of set filters."""
+    conditions = _filter_conditions(RADIO_CALL_FILTERS, mask, 1)
+    limit_index = len(conditions) + 1
+
+    # No filters ("latest calls" dashboard) renders without any WHERE clause
+    where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+
+    return f"""
+        SELECT call_id, timestamp, frequency, talkgroup_id, source_radio_id,
+               system_id, system_label, talkgroup_label, talkgroup_group,
+               talker_alias, audio_file_path, audio_duration_seconds,
+               audio_format, transcription_status, transcribed_at
+        FROM radio_calls
+        {where_clause}
+        ORDER BY timestamp DESC
+        LIMIT ${limit_index} OFFSET ${limit_index + 1}
+    """
+
+
+def _radio_calls_query(search_query: SearchQuery) -> tuple[str, list[Any]]:
+    """Build the radio call search statement and its parameters."""
+    params: list[Any] = []
+    # vars() reads the model's field dict without copying it
+    mask = _filter_mask(RADIO_CALL_FILTERS, vars(search_query), params)
+    params.extend([search_query.limit, search_query.offset])
+    return _radio_calls_sql(mask), params
+
+
+@lru_cache(maxsize=None)
+def _search_transcriptions_sql(mask: int, has_text: bool, projection: str, rum: bool = False) -> str:
+    """Transcription search statement for one combination of text query, filters, projection and index."""
+    conditions: list[str] = []
+
+    # Text search against the indexed tsv column (always $1), then radio call filters
+    if has_text:
+        conditions.append("t.tsv @@ plainto_tsquery('english', $1)")
+    conditions.extend(_filter_conditions(TRANSCRIPTION_SEARCH_FILTERS, mask, 2 if has_text else 1))
+    limit_index = len(conditions) + 1
+    where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+
+    # List views only need a short snippet, so skip shipping multi-KB transcripts
+    if projection == "list":
+        if has_text:
+            transcript_columns = (
+                "ts_headline('english', t.full_transcript, plainto_tsquery('english', $1), "
+                "'MaxWords=20, MinWords=10') AS snippet, t.speaker_count"
+            )
+        else:
+            transcript_columns = f"left(t.full_transcript, {SNIPPET_FALLBACK_CHARS}) AS snippet, t.speaker_count"
+    else:
+        transcript_columns = "t.full_transcript, t.speaker_count, t.confidence_score"
+
+    # Add ranking for text search
+    if has_text:
+        rank_clause = ", ts_rank(t.tsv, plainto_tsquery('english', $1)) as search_rank"
+        if rum:
+            # The RUM index returns matches nearest-first, so only the page's rows are ranked
+            order_clause = "ORDER BY t.tsv <=> plainto_tsquery('english', $1), rc.timestamp DESC"
+        else:
+            order_clause = "ORDER BY search_rank DESC, rc.timestamp DESC"
+    else:
+        rank_clause = ", NULL as search_rank"
+        order_clause = "ORDER BY rc.timestamp DESC"
+
+    return f"""
+        SELECT rc.call_id, rc.timestamp, rc.frequency, rc.talkgroup_id,
+               rc.talkgroup_label, rc.system_label, rc.talker_alias,
+               rc.audio_file_path, rc.audio_duration_seconds,
+               {transcript_columns}
+               {rank_clause}
+        FROM radio_calls rc
+        JOIN transcriptions t ON rc.call_id = t.call_id
+        {where_clause}
+        {order_clause}
+        LIMIT ${limit_index} OFFSET ${limit_index + 1}
+    """
+
+
+@lru_cache(maxsize=None)
+def _security_events_sql(mask: int) -> str:
+    """Security event listing statement for one combination of set filters."""
+    where_conditions = _filter_conditions(SECURITY_EVENT_FILTERS, mask, 1)
+    param_index = len(where_conditions) + 1
+
+    where_clause = " WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+
+    return f"""
+        SELECT event_id, timestamp, event_type, severity, source_ip,
+               source_system, api_key_used, user_agent, description,
+               metadata, related_call_id, related_file_path
+        FROM security_events
+        {where_clause}
+        ORDER BY timestamp DESC
+        LIMIT ${param_index} OFFSET ${param_index + 1}
+    """
+
+
+def _security_events_query(limit: int, offset: int, filter_values: dict[str, Any]) -> tuple[str, list[Any]]:
+    """Build the security event listing statement and its parameters."""
+    params: list[Any] = []
+    mask = _filter_mask(SECURITY_EVENT_FILTERS, filter_values, params)
+    params.extend([limit, offset])
+    return _security_events_sql(mask), params
+
+
+@lru_cache(maxsize=None)
+def _upload_source_analysis_sql(rollup: bool) -> str:
+    """Upload statistics, security statistics, per-IP counts and recent events in one round-trip."""
+    if rollup:
+        # Hourly per-system counts from the continuous aggregate instead of every raw event
+        security_statistics = """
+            SELECT json_build_object(
+                'total_events', COALESCE(SUM(event_count), 0),
+                'violations', COALESCE(SUM(event_count) FILTER (WHERE severity IN ('high', 'critical')), 0),
+                'upload_events', COALESCE(SUM(event_count) FILTER (WHERE event_type LIKE '%upload%'), 0)
+            )
+            FROM security_events_by_system
+            WHERE source_system = $1
+        """
+    else:
+        security_statistics = """
+            SELECT json_build_object(
+                'total_events', COUNT(*),
+                'violations', COUNT(*) FILTER (WHERE severity IN ('high', 'critical')),
+                'upload_events', COUNT(*) FILTER (WHERE event_type LIKE '%upload%')
+            )
+            FROM security_events
+            WHERE source_system = $1
+        """
+
+    return f"""
+        WITH calls AS (
+            SELECT timestamp, upload_source_ip
+            FROM radio_calls
+            WHERE upload_source_system = $1
+        )
+        SELECT json_build_object(
+            'upload_statistics', (
+                SELECT json_build_object(
+                    'total_uploads', COUNT(*),
+                    'unique_ips', COUNT(DISTINCT upload_source_ip),
+                    'first_seen', MIN(timestamp),
+                    'last_seen', MAX(timestamp)
+                )
+                FROM calls
+            ),
+            'security_statistics', ({security_statistics}),
+            'ip_addresses', (
+                SELECT COALESCE(json_agg(ips ORDER BY ips.upload_count DESC), '[]'::json)
+                FROM (
+                    SELECT upload_source_ip, COUNT(*) AS upload_count
+                    FROM calls
+                    WHERE upload_source_ip IS NOT NULL
+                    GROUP BY upload_source_ip
+                ) ips
+            ),
+            'recent_events', (
+                SELECT COALESCE(json_agg(recent ORDER BY recent.timestamp DESC), '[]'::json)
+                FROM (
+                    SELECT event_id, timestamp, event_type, severity, source_ip,
+                           source_system, api_key_used, user_agent, description,
+                           metadata, related_call_id, related_file_path
+                    FROM security_events
+                    WHERE source_system = $1
+                    ORDER BY timestamp DESC
+                    LIMIT 10
+                ) recent
+            )
+        )
+    """
+
+
+def _cached_rows(cache: RecordCache, kind: str, call_ids: Iterable[UUID]) -> tuple[dict[UUID, Any], dict[UUID, int]]:
+    """Split call IDs into rows already in the record cache and the IDs still to fetch (with their cache generation)."""
+    rows: dict[UUID, Any] = {}
+    missing: dict[UUID, int] = {}
+    for call_id in dict.fromkeys(call_ids):
+        row = cache.get(kind, call_id)
+        if row is None:
+            missing[call_id] = cache.generation(call_id)
+        else:
+            rows[call_id] = row
+    return rows, missing
+
 
 class RadioCallOperations:
     """Database operations for radio calls."""
@@ -48,24 +306,9 @@ class RadioCallOperations:
 
     async def create_radio_call(self, radio_call: RadioCallCreate) -> RadioCall:
         """Create a new radio call record."""
-        query = """
-            INSERT INTO radio_calls (
-                timestamp, frequency, talkgroup_id, source_radio_id, system_id,
-                system_label, talkgroup_label, talkgroup_group, talker_alias,
-                audio_file_path, audio_duration_seconds, audio_format,
-                transcription_status, upload_source_ip, upload_source_system,
-                upload_api_key_id, upload_user_agent
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17)
-            RETURNING call_id, timestamp, frequency, talkgroup_id, source_radio_id,
-                     system_id, system_label, talkgroup_label, talkgroup_group,
-                     talker_alias, audio_file_path, audio_duration_seconds,
-                     audio_format, transcription_status, transcribed_at,
-                     upload_source_ip, upload_source_system, upload_api_key_id,
-                     upload_user_agent
-        """
-
-        row = await self.db.fetchrow(
-            query,
+        row = await self.db.fetchrow_hot(
+            "insert_radio_call",
+            radio_call.call_id,
             radio_call.timestamp,
             radio_call.frequency,
             radio_call.talkgroup_id,
@@ -88,90 +331,41 @@ class RadioCallOperations:
         if not row:
             raise RuntimeError("Failed to create radio call")
 
-        return RadioCall(**dict(row))
+        return RadioCall.model_construct(**row)
 
     async def get_radio_call(self, call_id: UUID) -> Optional[RadioCall]:
         """Get a radio call by ID."""
-        query = """
-            SELECT call_id, timestamp, frequency, talkgroup_id, source_radio_id,
-                   system_id, system_label, talkgroup_label, talkgroup_group,
-                   talker_alias, audio_file_path, audio_duration_seconds,
-                   audio_format, transcription_status, transcribed_at,
-                   upload_source_ip, upload_source_system, upload_api_key_id,
-                   upload_user_agent
-            FROM radio_calls
-            WHERE call_id = $1
-        """
-
-        row = await self.db.fetchrow(query, call_id)
-        return RadioCall(**dict(row)) if row else None
+        row = self.db.record_cache.get(RADIO_CALL, call_id)
+        if row is None:
+            generation = self.db.record_cache.generation(call_id)
+            row = await self.db.fetchrow_hot("select_radio_call", call_id)
+            if row:
+                self.db.record_cache.set(RADIO_CALL, call_id, row, generation)
+        return row.to_model() if row else None
+
+    async def get_radio_calls(self, call_ids: Iterable[UUID]) -> dict[UUID, RadioCall]:
+        """Get several radio calls by ID in one round-trip; missing IDs are left out."""
+        rows, missing = _cached_rows(self.db.record_cache, RADIO_CALL, call_ids)
+        if missing:
+            for row in await self.db.fetch(SELECT_RADIO_CALLS, list(missing), record_class=RadioCallRecord):
+                rows[row["call_id"]] = row
+                self.db.record_cache.set(RADIO_CALL, row["call_id"], row, missing[row["call_id"]])
+        return {call_id: row.to_model() for call_id, row in rows.items()}
 
     async def update_transcription_status(
         self, call_id: UUID, status: str, transcribed_at: Optional[datetime] = None
     ) -> None:
-        """Update the transcription status of a radio call."""
-        query = """
-            UPDATE radio_calls
-            SET transcription_status = $2, transcribed_at = $3
-            WHERE call_id = $1
-        """
-
-        await self.db.execute(query, call_id, status, transcribed_at or datetime.now())
+        """Update the transcription status of a radio call (transcribed_at defaults to the database time)."""
+        await self.db.fetchrow_hot("update_transcription_status", call_id, status, transcribed_at)
+        self.db.record_cache.invalidate(call_id)
 
     async def search_radio_calls(self, search_query: SearchQuery) -> List[RadioCall]:
         """Search radio calls with filters."""
-        conditions = ["1=1"]  # Base condition
-        params: list[Any] = []
-        param_count = 0
-
-        # Build dynamic WHERE clause
-        if search_query.frequency:
-            param_count += 1
-            conditions.append(f"frequency = ${param_count}")
-            params.append(search_query.frequency)
-
-        if search_query.talkgroup_id:
-            param_count += 1
-            conditions.append(f"talkgroup_id = ${param_count}")
-            params.append(search_query.talkgroup_id)
-
-        if search_query.system_id:
-            param_count += 1
-            conditions.append(f"system_id = ${param_count}")
-            params.append(search_query.system_id)
-
-        if search_query.start_time:
-            param_count += 1
-            conditions.append(f"timestamp >= ${param_count}")
-            params.append(search_query.start_time)
-
-        if search_query.end_time:
-            param_count += 1
-            conditions.append(f"timestamp <= ${param_count}")
-            params.append(search_query.end_time)
-
-        # Add LIMIT and OFFSET
-        param_count += 1
-        limit_param = f"${param_count}"
-        params.append(search_query.limit)
-
-        param_count += 1
-        offset_param = f"${param_count}"
-        params.append(search_query.offset)
-
-        query = f"""
-            SELECT call_id, timestamp, frequency, talkgroup_id, source_radio_id,
-                   system_id, system_label, talkgroup_label, talkgroup_group,
-                   talker_alias, audio_file_path, audio_duration_seconds,
-                   audio_format, transcription_status, transcribed_at
-            FROM radio_calls
-            WHERE {' AND '.join(conditions)}
-            ORDER BY timestamp DESC
-            LIMIT {limit_param} OFFSET {offset_param}
-        """
+        query, params = _radio_calls_query(search_query)
 
-        rows = await self.db.fetch(query, *params)
-        return [RadioCall(**dict(row)) for row in rows]
+        # Rows come straight from our own schema, so skip per-field re-validation
+        rows = await self.db.fetch(query, *params, record_class=RadioCallRecord)
+        return [row.to_model() for row in rows]
 
 
 class TranscriptionOperations:
@@ -182,16 +376,8 @@ class TranscriptionOperations:
 
     async def create_transcription(self, transcription: TranscriptionCreate) -> Transcription:
         """Create a new transcription record."""
-        query = """
-            INSERT INTO transcriptions (
-                call_id, full_transcript, language, confidence_score,
-                speaker_count, model_name, processing_time_seconds
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7)
-            RETURNING *
-        """
-
-        row = await self.db.fetchrow(
-            query,
+        row = await self.db.fetchrow_hot(
+            "insert_transcription",
             transcription.call_id,
             transcription.full_transcript,
             transcription.language,
@@ -204,95 +390,39 @@ class TranscriptionOperations:
         if not row:
             raise RuntimeError("Failed to create transcription")
 
-        return Transcription(**dict(row))
+        return Transcription.model_construct(**row)
 
     async def get_transcription(self, call_id: UUID) -> Optional[Transcription]:
         """Get a transcription by call ID."""
-        query = """
-            SELECT call_id, full_transcript, language, confidence_score,
-                   speaker_count, model_name, processing_time_seconds
-            FROM transcriptions
-            WHERE call_id = $1
-        """
-
-        row = await self.db.fetchrow(query, call_id)
-        return Transcription(**dict(row)) if row else None
+        row = self.db.record_cache.get(TRANSCRIPTION, call_id)
+        if row is None:
+            generation = self.db.record_cache.generation(call_id)
+            row = await self.db.fetchrow_hot("select_transcription", call_id)
+            if row:
+                self.db.record_cache.set(TRANSCRIPTION, call_id, row, generation)
+        return Transcription.model_construct(**row) if row else None
+
+    async def get_transcriptions(self, call_ids: Iterable[UUID]) -> dict[UUID, Transcription]:
+        """Get the transcriptions of several calls in one round-trip; calls without one are left out."""
+        rows, missing = _cached_rows(self.db.record_cache, TRANSCRIPTION, call_ids)
+        if missing:
+            for row in await self.db.fetch(SELECT_TRANSCRIPTIONS, list(missing)):
+                rows[row["call_id"]] = row
+                self.db.record_cache.set(TRANSCRIPTION, row["call_id"], row, missing[row["call_id"]])
+        return {call_id: Transcription.model_construct(**row) for call_id, row in rows.items()}
 
     async def search_transcriptions(self, search_query: SearchQuery) -> List[SearchResult]:
         """Search transcriptions with full-text search."""
-        conditions = ["rc.call_id = t.call_id"]
         params: list[Any] = []
-        param_count = 0
-
-        # Text search using PostgreSQL full-text search
-        if search_query.query_text:
-            param_count += 1
-            conditions.append((f"to_tsvector('english', t.full_transcript) " f"@@ plainto_tsquery(${param_count})"))
+        has_text = bool(search_query.query_text)
+        if has_text:
             params.append(search_query.query_text)
-
-        # Add radio call filters
-        if search_query.frequency:
-            param_count += 1
-            conditions.append(f"rc.frequency = ${param_count}")
-            params.append(search_query.frequency)
-
-        if search_query.talkgroup_id:
-            param_count += 1
-            conditions.append(f"rc.talkgroup_id = ${param_count}")
-            params.append(search_query.talkgroup_id)
-
-        if search_query.system_id:
-            param_count += 1
-            conditions.append(f"rc.system_id = ${param_count}")
-            params.append(search_query.system_id)
-
-        if search_query.start_time:
-            param_count += 1
-            conditions.append(f"rc.timestamp >= ${param_count}")
-            params.append(search_query.start_time)
-
-        if search_query.end_time:
-            param_count += 1
-            conditions.append(f"rc.timestamp <= ${param_count}")
-            params.append(search_query.end_time)
-
-        # Add ranking for text search
-        rank_clause = ""
-        if search_query.query_text:
-            rank_clause = (
-                f", ts_rank(to_tsvector('english', t.full_transcript), "
-                f"plainto_tsquery(${params.index(search_query.query_text) + 1})) "
-                f"as search_rank"
-            )
-            order_clause = "ORDER BY search_rank DESC, rc.timestamp DESC"
-        else:
-            rank_clause = ", NULL as search_rank"
-            order_clause = "ORDER BY rc.timestamp DESC"
-
-        # Add LIMIT and OFFSET
-        param_count += 1
-        limit_param = f"${param_count}"
-        params.append(search_query.limit)
-
-        param_count += 1
-        offset_param = f"${param_count}"
-        params.append(search_query.offset)
-
-        query = f"""
-            SELECT rc.call_id, rc.timestamp, rc.frequency, rc.talkgroup_id,
-                   rc.talkgroup_label, rc.system_label, rc.talker_alias,
-                   rc.audio_file_path, rc.audio_duration_seconds,
-                   t.full_transcript, t.speaker_count, t.confidence_score
-                   {rank_clause}
-            FROM radio_calls rc
-            JOIN transcriptions t ON rc.call_id = t.call_id
-            WHERE {' AND '.join(conditions)}
-            {order_clause}
-            LIMIT {limit_param} OFFSET {offset_param}
-        """
+        mask = _filter_mask(TRANSCRIPTION_SEARCH_FILTERS, vars(search_query), params)
+        params.extend([search_query.limit, search_query.offset])
+        query = _search_transcriptions_sql(mask, has_text, search_query.projection, self.db.rum_search)
 
         rows = await self.db.fetch(query, *params)
-        return [SearchResult(**dict(row)) for row in rows]
+        return [SearchResult(**row) for row in rows]
 
 
 class SpeakerSegmentOperations:
@@ -302,55 +432,41 @@ class SpeakerSegmentOperations:
         self.db = db_manager
 
     async def create_speaker_segments(self, segments: List[SpeakerSegment]) -> List[SpeakerSegment]:
-        """Create multiple speaker segment records."""
+        """Create multiple speaker segment records in one batch."""
         if not segments:
             return []
 
-        # Build bulk insert query
-        value_placeholders = []
-        params: list[Any] = []
-        param_count = 0
-
-        for segment in segments:
-            param_count += 1
-            call_id_param = f"${param_count}"
-            param_count += 1
-            start_param = f"${param_count}"
-            param_count += 1
-            end_param = f"${param_count}"
-            param_count += 1
-            speaker_param = f"${param_count}"
-            param_count += 1
-            text_param = f"${param_count}"
-            param_count += 1
-            confidence_param = f"${param_count}"
-
-            value_placeholders.append(
-                f"({call_id_param}, {start_param}, {end_param}, " f"{speaker_param}, {text_param}, {confidence_param})"
+        records = [
+            (
+                segment.call_id,
+                segment.segment_id,
+                segment.start_time_seconds,
+                segment.end_time_seconds,
+                segment.speaker_id,
+                segment.text,
+                segment.confidence_score,
             )
+            for segment in segments
+        ]
 
-            params.extend(
-                [
-                    segment.call_id,
-                    segment.start_time_seconds,
-                    segment.end_time_seconds,
-                    segment.speaker_id,
-                    segment.text,
-                    segment.confidence_score,
-                ]
-            )
+        async with self.db.transaction() as conn:
+            await self.insert_records(conn, records)
+
+        for call_id in {segment.call_id for segment in segments}:
+            self.db.record_cache.invalidate(call_id)
+        return segments
 
-        query = f"""
-            INSERT INTO speaker_segments (
-                call_id, start_time_seconds, end_time_seconds,
-                speaker_id, text, confidence_score
-            ) VALUES {', '.join(value_placeholders)}
-            RETURNING segment_id, call_id, start_time_seconds, end_time_seconds,
-                     speaker_id, text, confidence_score
+    async def insert_records(self, conn: asyncpg.Connection, records: List[tuple[Any, ...]]) -> None:
         """
+        Insert speaker segment rows (ordered as SPEAKER_SEGMENT_COLUMNS) on the given connection.
 
-        rows = await self.db.fetch(query, *params)
-        return [SpeakerSegment(**dict(row)) for row in rows]
+        Small batches go through the hot unnest() INSERT as one array per column (a
+        single bind and execute); larger ones use binary COPY.
+        """
+        if len(records) < SEGMENT_COPY_THRESHOLD:
+            await conn.fetch(HOT_QUERIES["insert_speaker_segments"], *(list(column) for column in zip(*records)))
+        else:
+            await conn.copy_records_to_table("speaker_segments", records=records, columns=list(SPEAKER_SEGMENT_COLUMNS))
 
     async def get_speaker_segments(self, call_id: UUID) -> List[SpeakerSegment]:
         """Get all speaker segments for a call."""
@@ -362,8 +478,24 @@ class SpeakerSegmentOperations:
             ORDER BY start_time_seconds
         """
 
-        rows = await self.db.fetch(query, call_id)
-        return [SpeakerSegment(**dict(row)) for row in rows]
+        rows = self.db.record_cache.get(SPEAKER_SEGMENTS, call_id)
+        if rows is None:
+            generation = self.db.record_cache.generation(call_id)
+            rows = tuple(await self.db.fetch(query, call_id))
+            self.db.record_cache.set(SPEAKER_SEGMENTS, call_id, rows, generation)
+        return [SpeakerSegment.model_construct(**row) for row in rows]
+
+    async def get_speaker_segments_for_calls(self, call_ids: Iterable[UUID]) -> dict[UUID, List[SpeakerSegment]]:
+        """Get the speaker segments of several calls in one round-trip, keyed by call ID."""
+        cached, missing = _cached_rows(self.db.record_cache, SPEAKER_SEGMENTS, call_ids)
+        if missing:
+            fetched: dict[UUID, list[asyncpg.Record]] = {call_id: [] for call_id in missing}
+            for row in await self.db.fetch(SELECT_SPEAKER_SEGMENTS, list(missing)):
+                fetched[row["call_id"]].append(row)
+            for call_id, call_rows in fetched.items():
+                cached[call_id] = tuple(call_rows)
+                self.db.record_cache.set(SPEAKER_SEGMENTS, call_id, cached[call_id], missing[call_id])
+        return {call_id: [SpeakerSegment.model_construct(**row) for row in rows] for call_id, rows in cached.items()}
 
 
 class DatabaseOperations:
@@ -388,19 +520,9 @@ class DatabaseOperations:
                 # Create radio call first
                 call_id = radio_call.call_id
 
-                # Insert radio call
-                radio_call_sql = """
-                    INSERT INTO radio_calls (
-                        call_id, timestamp, frequency, talkgroup_id, source_radio_id, system_id,
-                        system_label, talkgroup_label, talkgroup_group, talker_alias,
-                        audio_file_path, audio_duration_seconds, audio_format,
-                        transcription_status, upload_source_ip, upload_source_system,
-                        upload_api_key_id, upload_user_agent
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18)
-                    RETURNING *
-                """
-                stored_call_row = await conn.fetchrow(
-                    radio_call_sql,
+                # Insert radio call and transcription together
+                stored_row = await conn.fetchrow(
+                    HOT_QUERIES["insert_call_with_transcription"],
                     call_id,
                     radio_call.timestamp,
                     radio_call.frequency,
@@ -414,24 +536,11 @@ class DatabaseOperations:
                     radio_call.audio_file_path,
                     radio_call.audio_duration_seconds,
                     radio_call.audio_format,
-                    "processing",
+                    "completed",
                     radio_call.upload_source_ip,
                     radio_call.upload_source_system,
                     radio_call.upload_api_key_id,
                     radio_call.upload_user_agent,
-                )
-
-                # Insert transcription
-                transcription_sql = """
-                    INSERT INTO transcriptions (
-                        call_id, full_transcript, language, confidence_score,
-                        speaker_count, model_name, processing_time_seconds
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7)
-                    RETURNING *
-                """
-                stored_transcription_row = await conn.fetchrow(
-                    transcription_sql,
-                    call_id,
                     transcription.full_transcript,
                     transcription.language,
                     transcription.confidence_score,
@@ -439,50 +548,52 @@ class DatabaseOperations:
                     transcription.model_name,
                     transcription.processing_time_seconds,
                 )
+                stored_call = {k: v for k, v in stored_row.items() if k not in TRANSCRIPTION_RESULT_COLUMNS}
+                stored_transcription = {"call_id": call_id, **{k: stored_row[k] for k in TRANSCRIPTION_RESULT_COLUMNS}}
 
                 # Insert speaker segments
-                stored_segments = []
-                if speaker_segments:
-                    segment_sql = """
-                        INSERT INTO speaker_segments (
-                            call_id, segment_id, start_time_seconds, end_time_seconds,
-                            speaker_id, text, confidence_score
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7)
-                        RETURNING *
-                    """
-                    for segment in speaker_segments:
-                        segment_row = await conn.fetchrow(
-                            segment_sql,
-                            call_id,
-                            segment.segment_id,
-                            segment.start_time_seconds,
-                            segment.end_time_seconds,
-                            segment.speaker_id,
-                            segment.text,
-                            segment.confidence_score,
-                        )
-                        stored_segments.append(segment_row)
-
-                # Update radio call status to completed
-                await conn.execute(
-                    "UPDATE radio_calls SET transcription_status = $1, transcribed_at = NOW() WHERE call_id = $2",
-                    "completed",
-                    call_id,
-                )
+                stored_segments = await self._insert_speaker_segments(conn, call_id, speaker_segments)
 
                 logger.info(f"Stored complete transcription for call {call_id}: " f"{len(stored_segments)} segments")
 
-                return {
-                    "radio_call": dict(stored_call_row),
-                    "transcription": dict(stored_transcription_row),
-                    "speaker_segments": [dict(row) for row in stored_segments],
-                }
-
             except Exception as e:
                 logger.error(f"Failed to store transcription for call {call_id}: {e}")
                 # Transaction will automatically rollback on exception
                 raise
 
+        # After commit: a lookup that started earlier captured the old cache
+        # generation, so the pre-transaction rows it may have read are not cached
+        self.db.record_cache.invalidate(call_id)
+
+        return {
+            "radio_call": stored_call,
+            "transcription": stored_transcription,
+            "speaker_segments": stored_segments,
+        }
+
+    async def _insert_speaker_segments(
+        self, conn: asyncpg.Connection, call_id: UUID, speaker_segments: List[SpeakerSegment]
+    ) -> list[dict[str, Any]]:
+        """Insert a call's speaker segments and return the stored rows."""
+        if not speaker_segments:
+            return []
+
+        records = [
+            (
+                call_id,
+                segment.segment_id,
+                segment.start_time_seconds,
+                segment.end_time_seconds,
+                segment.speaker_id,
+                segment.text,
+                segment.confidence_score,
+            )
+            for segment in speaker_segments
+        ]
+
+        await self.speaker_segments.insert_records(conn, records)
+        return [dict(zip(SPEAKER_SEGMENT_COLUMNS, record)) for record in records]
+
 
 class SecurityEventOperations:
     """Database operations for security events."""
@@ -492,22 +603,10 @@ class SecurityEventOperations:
 
     async def create_security_event(self, event: SecurityEvent) -> SecurityEvent:
         """Create a new security event record."""
-        query = """
-            INSERT INTO security_events (
-                timestamp, event_type, severity, source_ip, source_system,
-                api_key_used, user_agent, description, metadata,
-                related_call_id, related_file_path
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-            RETURNING event_id, timestamp, event_type, severity, source_ip,
-                     source_system, api_key_used, user_agent, description,
-                     metadata, related_call_id, related_file_path
-        """
-
-        # Convert metadata dict to JSON if provided
-        metadata_json = json.dumps(event.metadata) if event.metadata else None
-
-        row = await self.db.fetchrow(
-            query,
+        # metadata is encoded to JSONB and source_ip to INET by the connection's type codecs
+        row = await self.db.fetchrow_hot(
+            "insert_security_event",
+            event.event_id,
             event.timestamp,
             event.event_type,
             event.severity,
@@ -516,7 +615,7 @@ class SecurityEventOperations:
             event.api_key_used,
             event.user_agent,
             event.description,
-            metadata_json,
+            event.metadata or None,
             event.related_call_id,
             event.related_file_path,
         )
@@ -524,16 +623,26 @@ class SecurityEventOperations:
         if not row:
             raise RuntimeError("Failed to create security event")
 
-        # Convert row to dict and parse JSON metadata back to dict
-        row_dict = dict(row)
-        if row_dict.get("metadata") and isinstance(row_dict["metadata"], str):
-            row_dict["metadata"] = json.loads(row_dict["metadata"])
+        return SecurityEvent.model_construct(**row)
 
-        # Convert INET type to string
-        if row_dict.get("source_ip"):
-            row_dict["source_ip"] = str(row_dict["source_ip"])
+    async def create_security_events(self, events: List[SecurityEvent]) -> None:
+        """Insert a batch of security events with one multi-row statement."""
+        if events:
+            await self.db.fetchrow_hot("insert_security_events", *security_event_columns(events))
 
-        return SecurityEvent(**row_dict)
+    def queue_security_event(self, event: SecurityEvent) -> bool:
+        """Hand an event to the background batch writer without waiting; False if it was dropped."""
+        return self.db.security_event_writer.submit(event)
+
+    def tally_security_event(
+        self,
+        event_type: str,
+        source_ip: Optional[str] = None,
+        source_system: Optional[str] = None,
+        api_key_used: Optional[str] = None,
+    ) -> None:
+        """Count a routine event; the batch writer stores periodic per-source summaries instead of each one."""
+        self.db.security_event_writer.tally(event_type, source_ip, source_system, api_key_used)
 
     async def get_security_events(
         self,
@@ -545,117 +654,64 @@ class SecurityEventOperations:
         source_system: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
+        metadata_contains: Optional[dict[str, Any]] = None,
     ) -> List[SecurityEvent]:
-        """Get security events with filtering."""
-        where_conditions = []
-        params: list[Any] = []
-        param_index = 1
-
-        if event_type:
-            where_conditions.append(f"event_type = ${param_index}")
-            params.append(event_type)
-            param_index += 1
-
-        if severity:
-            where_conditions.append(f"severity = ${param_index}")
-            params.append(severity)
-            param_index += 1
-
-        if source_ip:
-            where_conditions.append(f"source_ip = ${param_index}")
-            params.append(source_ip)
-            param_index += 1
-
-        if source_system:
-            where_conditions.append(f"source_system = ${param_index}")
-            params.append(source_system)
-            param_index += 1
-
-        if start_time:
-            where_conditions.append(f"timestamp >= ${param_index}")
-            params.append(start_time)
-            param_index += 1
-
-        if end_time:
-            where_conditions.append(f"timestamp <= ${param_index}")
-            params.append(end_time)
-            param_index += 1
-
-        where_clause = " WHERE " + " AND ".join(where_conditions) if where_conditions else ""
-
-        query = f"""
-            SELECT event_id, timestamp, event_type, severity, source_ip,
-                   source_system, api_key_used, user_agent, description,
-                   metadata, related_call_id, related_file_path
-            FROM security_events
-            {where_clause}
-            ORDER BY timestamp DESC
-            LIMIT ${param_index} OFFSET ${param_index + 1}
-        """
-
-        params.extend([limit, offset])
+        """Get security events with filtering; ``metadata_contains`` matches events whose metadata includes it."""
+        query, params = _security_events_query(
+            limit,
+            offset,
+            {
+                "event_type": event_type,
+                "severity": severity,
+                "source_ip": source_ip,
+                "source_system": source_system,
+                "start_time": start_time,
+                "end_time": end_time,
+                "metadata_contains": metadata_contains,
+            },
+        )
         rows = await self.db.fetch(query, *params)
+        return [SecurityEvent.model_construct(**row) for row in rows]
 
-        # Convert rows and parse JSON metadata
-        results = []
-        for row in rows:
-            row_dict = dict(row)
-            if row_dict.get("metadata") and isinstance(row_dict["metadata"], str):
-                row_dict["metadata"] = json.loads(row_dict["metadata"])
-
-            # Convert INET type to string
-            if row_dict.get("source_ip"):
-                row_dict["source_ip"] = str(row_dict["source_ip"])
-
-            results.append(SecurityEvent(**row_dict))
-
-        return results
+    async def iter_security_events(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        event_type: Optional[str] = None,
+        severity: Optional[str] = None,
+        source_ip: Optional[str] = None,
+        source_system: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        metadata_contains: Optional[dict[str, Any]] = None,
+    ) -> AsyncIterator[SecurityEvent]:
+        """Stream security events (newest first) without materializing the whole result."""
+        query, params = _security_events_query(
+            limit,
+            offset,
+            {
+                "event_type": event_type,
+                "severity": severity,
+                "source_ip": source_ip,
+                "source_system": source_system,
+                "start_time": start_time,
+                "end_time": end_time,
+                "metadata_contains": metadata_contains,
+            },
+        )
+        async for row in self.db.iterate(query, *params):
+            yield SecurityEvent.model_construct(**row)
 
     async def get_upload_source_analysis(self, source_system: str) -> UploadSourceAnalysis:
         """Analyze upload patterns for a specific source system."""
-        # Get upload statistics
-        upload_stats_query = """
-            SELECT
-                COUNT(*) as total_uploads,
-                COUNT(DISTINCT upload_source_ip) as unique_ips,
-                MIN(timestamp) as first_seen,
-                MAX(timestamp) as last_seen
-            FROM radio_calls
-            WHERE upload_source_system = $1
-        """
-
-        upload_stats = await self.db.fetchrow(upload_stats_query, source_system)
-
-        # Get security events for this system
-        security_events_query = """
-            SELECT
-                COUNT(*) as total_events,
-                COUNT(*) FILTER (WHERE severity IN ('high', 'critical')) as violations,
-                COUNT(*) FILTER (WHERE event_type LIKE '%upload%') as upload_events
-            FROM security_events
-            WHERE source_system = $1
-        """
-
-        security_stats = await self.db.fetchrow(security_events_query, source_system)
-
-        # Get recent events
-        recent_events = await self.get_security_events(limit=10, source_system=source_system)
-
-        # Get IP addresses used by this system
-        ips_query = """
-            SELECT DISTINCT upload_source_ip, COUNT(*) as upload_count
-            FROM radio_calls
-            WHERE upload_source_system = $1 AND upload_source_ip IS NOT NULL
-            GROUP BY upload_source_ip
-            ORDER BY upload_count DESC
-        """
-
-        ip_stats = await self.db.fetch(ips_query, source_system)
+        stats_query = _upload_source_analysis_sql(self.db.security_rollup)
+        stats = await self.db.fetchval(stats_query, source_system)
 
         return {
             "system_id": source_system,
-            "upload_statistics": dict(upload_stats) if upload_stats else {},
-            "security_statistics": dict(security_stats) if security_stats else {},
-            "ip_addresses": [dict(row) for row in ip_stats],
-            "recent_events": recent_events,
+            "upload_statistics": stats["upload_statistics"],
+            "security_statistics": stats["security_statistics"],
+            "ip_addresses": stats["ip_addresses"],
+            # Events arrive as JSON (string UUIDs and timestamps), so these few are validated
+            "recent_events": [SecurityEvent.model_validate(event) for event in stats["recent_events"]],
         }
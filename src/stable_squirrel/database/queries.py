@@ -0,0 +1,184 @@
+"""Hot-path SQL statements shared by the connection pool and CRUD operations.
+
+Statements listed in ``HOT_QUERIES`` are always sent as the same text, so after
+their first use on a pool connection they are served from that connection's
+asyncpg statement cache and the ingestion path never pays the parse/plan cost
+per call. asyncpg re-prepares them if a schema change invalidates the cache.
+"""
+
+import asyncpg
+
+from stable_squirrel.database.records import RadioCallRecord
+
+INSERT_RADIO_CALL = """
+    INSERT INTO radio_calls (
+        call_id, timestamp, frequency, talkgroup_id, source_radio_id, system_id,
+        system_label, talkgroup_label, talkgroup_group, talker_alias,
+        audio_file_path, audio_duration_seconds, audio_format,
+        transcription_status, upload_source_ip, upload_source_system,
+        upload_api_key_id, upload_user_agent
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18)
+    RETURNING *
+"""
+
+SELECT_RADIO_CALL = """
+    SELECT call_id, timestamp, frequency, talkgroup_id, source_radio_id,
+           system_id, system_label, talkgroup_label, talkgroup_group,
+           talker_alias, audio_file_path, audio_duration_seconds,
+           audio_format, transcription_status, transcribed_at,
+           upload_source_ip, upload_source_system, upload_api_key_id,
+           upload_user_agent
+    FROM radio_calls
+    WHERE call_id = $1
+"""
+
+SELECT_RADIO_CALLS = """
+    SELECT call_id, timestamp, frequency, talkgroup_id, source_radio_id,
+           system_id, system_label, talkgroup_label, talkgroup_group,
+           talker_alias, audio_file_path, audio_duration_seconds,
+           audio_format, transcription_status, transcribed_at,
+           upload_source_ip, upload_source_system, upload_api_key_id,
+           upload_user_agent
+    FROM radio_calls
+    WHERE call_id = ANY($1::uuid[])
+"""
+
+# A NULL $3 stamps the update with the database clock
+UPDATE_TRANSCRIPTION_STATUS = """
+    UPDATE radio_calls
+    SET transcription_status = $2, transcribed_at = COALESCE($3::timestamptz, NOW())
+    WHERE call_id = $1
+"""
+
+INSERT_TRANSCRIPTION = """
+    INSERT INTO transcriptions (
+        call_id, full_transcript, language, confidence_score,
+        speaker_count, model_name, processing_time_seconds
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7)
+    RETURNING call_id, full_transcript, language, confidence_score,
+              speaker_count, model_name, processing_time_seconds
+"""
+
+# The radio call and its transcription in one statement (one round-trip). The tables
+# only share call_id, so the joined row splits back into both records by column name.
+# The call is written already transcribed; the enclosing transaction makes that atomic.
+INSERT_CALL_WITH_TRANSCRIPTION = """
+    WITH new_call AS (
+        INSERT INTO radio_calls (
+            call_id, timestamp, frequency, talkgroup_id, source_radio_id, system_id,
+            system_label, talkgroup_label, talkgroup_group, talker_alias,
+            audio_file_path, audio_duration_seconds, audio_format,
+            transcription_status, upload_source_ip, upload_source_system,
+            upload_api_key_id, upload_user_agent, transcribed_at
+        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, NOW())
+        RETURNING *
+    ), new_transcription AS (
+        INSERT INTO transcriptions (
+            call_id, full_transcript, language, confidence_score,
+            speaker_count, model_name, processing_time_seconds
+        ) VALUES ($1, $19, $20, $21, $22, $23, $24)
+        RETURNING full_transcript, language, confidence_score,
+                  speaker_count, model_name, processing_time_seconds
+    )
+    SELECT new_call.*, new_transcription.*
+    FROM new_call, new_transcription
+"""
+
+TRANSCRIPTION_RESULT_COLUMNS = (
+    "full_transcript",
+    "language",
+    "confidence_score",
+    "speaker_count",
+    "model_name",
+    "processing_time_seconds",
+)
+
+SELECT_TRANSCRIPTION = """
+    SELECT call_id, full_transcript, language, confidence_score,
+           speaker_count, model_name, processing_time_seconds
+    FROM transcriptions
+    WHERE call_id = $1
+"""
+
+SELECT_TRANSCRIPTIONS = """
+    SELECT call_id, full_transcript, language, confidence_score,
+           speaker_count, model_name, processing_time_seconds
+    FROM transcriptions
+    WHERE call_id = ANY($1::uuid[])
+"""
+
+SELECT_SPEAKER_SEGMENTS = """
+    SELECT segment_id, call_id, start_time_seconds, end_time_seconds,
+           speaker_id, text, confidence_score
+    FROM speaker_segments
+    WHERE call_id = ANY($1::uuid[])
+    ORDER BY call_id, start_time_seconds
+"""
+
+# One array per column: a whole batch binds and executes as a single statement
+INSERT_SPEAKER_SEGMENTS = """
+    INSERT INTO speaker_segments (
+        call_id, segment_id, start_time_seconds, end_time_seconds,
+        speaker_id, text, confidence_score
+    )
+    SELECT * FROM unnest($1::uuid[], $2::uuid[], $3::real[], $4::real[], $5::text[], $6::text[], $7::real[])
+"""
+
+INSERT_SECURITY_EVENT = """
+    INSERT INTO security_events (
+        event_id, timestamp, event_type, severity, source_ip, source_system,
+        api_key_used, user_agent, description, metadata,
+        related_call_id, related_file_path
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
+    RETURNING event_id, timestamp, event_type, severity, source_ip,
+              source_system, api_key_used, user_agent, description,
+              metadata, related_call_id, related_file_path
+"""
+
+# Batch form: one array per column. INET and JSONB values are bound as text[] and cast
+# per element, because the connection's inet/json codecs are text-format only.
+INSERT_SECURITY_EVENTS = """
+    INSERT INTO security_events (
+        event_id, timestamp, event_type, severity, source_ip, source_system,
+        api_key_used, user_agent, description, metadata,
+        related_call_id, related_file_path
+    )
+    SELECT event_id, timestamp, event_type, severity, source_ip::inet, source_system,
+           api_key_used, user_agent, description, metadata::jsonb,
+           related_call_id, related_file_path
+    FROM unnest(
+        $1::uuid[], $2::timestamptz[], $3::text[], $4::text[], $5::text[], $6::text[],
+        $7::text[], $8::text[], $9::text[], $10::text[], $11::uuid[], $12::text[]
+    ) AS e(
+        event_id, timestamp, event_type, severity, source_ip, source_system,
+        api_key_used, user_agent, description, metadata,
+        related_call_id, related_file_path
+    )
+"""
+
+SPEAKER_SEGMENT_COLUMNS = (
+    "call_id",
+    "segment_id",
+    "start_time_seconds",
+    "end_time_seconds",
+    "speaker_id",
+    "text",
+    "confidence_score",
+)
+
+HOT_QUERIES: dict[str, str] = {
+    "insert_radio_call": INSERT_RADIO_CALL,
+    "select_radio_call": SELECT_RADIO_CALL,
+    "update_transcription_status": UPDATE_TRANSCRIPTION_STATUS,
+    "insert_transcription": INSERT_TRANSCRIPTION,
+    "select_transcription": SELECT_TRANSCRIPTION,
+    "insert_call_with_transcription": INSERT_CALL_WITH_TRANSCRIPTION,
+    "insert_speaker_segments": INSERT_SPEAKER_SEGMENTS,
+    "insert_security_event": INSERT_SECURITY_EVENT,
+    "insert_security_events": INSERT_SECURITY_EVENTS,
+}
+
+# Hot statements whose rows are returned as a model-building record class
+HOT_QUERY_RECORD_CLASSES: dict[str, type[asyncpg.Record]] = {
+    "select_radio_call": RadioCallRecord,
+}
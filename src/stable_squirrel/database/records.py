@@ -0,0 +1,73 @@
+"""asyncpg record classes that build models straight from result rows.
+
+Passed as ``record_class`` for statements with a fixed column layout, so the row
+turns into a model by position instead of ``model_construct(**row)`` resolving
+every column by name.
+"""
+
+import asyncpg
+
+from stable_squirrel.database.models import RadioCall
+
+# Column layout shared by SELECT_RADIO_CALL and the radio call search statements
+RADIO_CALL_COLUMNS = (
+    "call_id",
+    "timestamp",
+    "frequency",
+    "talkgroup_id",
+    "source_radio_id",
+    "system_id",
+    "system_label",
+    "talkgroup_label",
+    "talkgroup_group",
+    "talker_alias",
+    "audio_file_path",
+    "audio_duration_seconds",
+    "audio_format",
+    "transcription_status",
+    "transcribed_at",
+)
+
+# Optional trailing columns, only selected for single-call lookups
+RADIO_CALL_UPLOAD_COLUMNS = (
+    "upload_source_ip",
+    "upload_source_system",
+    "upload_api_key_id",
+    "upload_user_agent",
+)
+
+
+class RadioCallRecord(asyncpg.Record):  # type: ignore[misc]  # asyncpg ships no type stubs
+    """Row laid out as ``RADIO_CALL_COLUMNS``, optionally followed by ``RADIO_CALL_UPLOAD_COLUMNS``."""
+
+    __slots__ = ()
+
+    def to_model(self) -> RadioCall:
+        """Build the RadioCall without re-validating what the schema already guarantees."""
+        upload = {}
+        if len(self) > len(RADIO_CALL_COLUMNS):
+            upload = {
+                "upload_source_ip": self[15],
+                "upload_source_system": self[16],
+                "upload_api_key_id": self[17],
+                "upload_user_agent": self[18],
+            }
+
+        return RadioCall.model_construct(
+            call_id=self[0],
+            timestamp=self[1],
+            frequency=self[2],
+            talkgroup_id=self[3],
+            source_radio_id=self[4],
+            system_id=self[5],
+            system_label=self[6],
+            talkgroup_label=self[7],
+            talkgroup_group=self[8],
+            talker_alias=self[9],
+            audio_file_path=self[10],
+            audio_duration_seconds=self[11],
+            audio_format=self[12],
+            transcription_status=self[13],
+            transcribed_at=self[14],
+            **upload,
+        )
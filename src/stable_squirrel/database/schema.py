@@ -1,11 +1,70 @@
 """Database schema creation and TimescaleDB setup."""
 
+import asyncio
 import logging
+from datetime import timedelta
+from typing import Awaitable
 
 from .connection import DatabaseManager
+from .records import RADIO_CALL_COLUMNS
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever create_schema() or ensure_timescale_setup() change so existing
+# databases pick up the new DDL on the next startup.
+SCHEMA_VERSION = 10
+
+# Hypertables partitioned by time, and how old a chunk gets before it is compressed
+HYPERTABLES = ("radio_calls", "security_events")
+COMPRESS_AFTER = "30 days"
+
+# Compression (segmentby, orderby) per hypertable. Ordering compressed batches
+# newest-first matches the ORDER BY timestamp DESC every listing query uses.
+COMPRESSION_SETTINGS = {
+    "radio_calls": ("frequency, talkgroup_id", "timestamp DESC"),
+    "security_events": ("event_type, severity", "timestamp DESC"),
+}
+
+# Continuous aggregate of hourly security event counts per source system
+SECURITY_ROLLUP_VIEW = "security_events_by_system"
+
+# Session settings for concurrent index builds: parallel workers and sort memory per build
+INDEX_BUILD_SETTINGS = (
+    "SET max_parallel_maintenance_workers = 4",
+    "SET maintenance_work_mem = '256MB'",
+)
+
+
+def _covering_search_index(name: str, key_column: str) -> str:
+    """(key, timestamp DESC) index on radio_calls that INCLUDEs every other radio call search column."""
+    include = ", ".join(c for c in RADIO_CALL_COLUMNS if c not in (key_column, "timestamp"))
+    return f"CREATE INDEX IF NOT EXISTS {name} ON radio_calls ({key_column}, timestamp DESC) INCLUDE ({include});"
+
+
+async def _drop_invalid_index(db_manager: DatabaseManager, name: str) -> None:
+    """Drop an index only if it exists and is INVALID, as a failed or interrupted concurrent build leaves it."""
+    invalid = await db_manager.fetchval("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass($1)", name)
+    if invalid:
+        logger.warning(f"Dropping invalid index {name} left by an earlier failed build")
+        await db_manager.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+async def _create_index_concurrently(db_manager: DatabaseManager, name: str, definition: str) -> None:
+    """Build an index without blocking writes, replacing an INVALID leftover of an earlier failed build."""
+    # IF NOT EXISTS would otherwise skip an INVALID index forever
+    await _drop_invalid_index(db_manager, name)
+    try:
+        await db_manager.execute_session(
+            *INDEX_BUILD_SETTINGS, f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}"
+        )
+    except Exception:
+        # Only clean up what this build left behind; a valid existing index is kept
+        try:
+            await _drop_invalid_index(db_manager, name)
+        except Exception as e:
+            logger.warning(f"Could not check index {name} after its build failed: {e}")
+        raise
+
 
 async def create_schema(db_manager: DatabaseManager) -> None:
     """Create all database tables and indexes."""
@@ -67,10 +126,19 @@ async def create_schema(db_manager: DatabaseManager) -> None:
         model_name TEXT,
         processing_time_seconds REAL,
 
+        -- Full-text search document, maintained by PostgreSQL on write
+        tsv TSVECTOR GENERATED ALWAYS AS (to_tsvector('english', full_transcript)) STORED,
+
         PRIMARY KEY (call_id)
     );
     """
 
+    # Databases created before the tsv column existed
+    transcriptions_tsv_sql = """
+    ALTER TABLE transcriptions ADD COLUMN IF NOT EXISTS
+        tsv TSVECTOR GENERATED ALWAYS AS (to_tsvector('english', full_transcript)) STORED;
+    """
+
     # SQL for creating speaker_segments table
     speaker_segments_sql = """
     CREATE TABLE IF NOT EXISTS speaker_segments (
@@ -121,32 +189,72 @@ async def create_schema(db_manager: DatabaseManager) -> None:
     );
     """
 
+    # Single-row table recording which SCHEMA_VERSION the database was set up with
+    schema_meta_sql = """
+    CREATE TABLE IF NOT EXISTS schema_meta (
+        id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+        version INTEGER NOT NULL,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    );
+    """
+
     # Create indexes for optimal query performance
     indexes_sql = [
         # Time-range queries (most common)
         ("CREATE INDEX IF NOT EXISTS idx_calls_timestamp " "ON radio_calls (timestamp DESC);"),
-        # Frequency and talkgroup searches
-        ("CREATE INDEX IF NOT EXISTS idx_calls_frequency " "ON radio_calls (frequency, timestamp DESC);"),
-        ("CREATE INDEX IF NOT EXISTS idx_calls_talkgroup " "ON radio_calls (talkgroup_id, timestamp DESC);"),
-        ("CREATE INDEX IF NOT EXISTS idx_calls_system " "ON radio_calls (system_id, timestamp DESC);"),
-        # Transcription status
-        ("CREATE INDEX IF NOT EXISTS idx_calls_status " "ON radio_calls (transcription_status);"),
-        # Full-text search on transcripts
+        # Wide ranges (exports, old compressed history): a tiny per-block min/max summary
+        # that lets the scan skip everything outside the range without walking the B-tree
         (
-            "CREATE INDEX IF NOT EXISTS idx_transcript_text "
-            "ON transcriptions USING GIN(to_tsvector('english', full_transcript));"
+            "CREATE INDEX IF NOT EXISTS idx_calls_timestamp_brin "
+            "ON radio_calls USING BRIN (timestamp) WITH (pages_per_range = 16);"
         ),
-        # Speaker segment searches
-        ("CREATE INDEX IF NOT EXISTS idx_segments_speaker " "ON speaker_segments (speaker_id, call_id);"),
-        ("CREATE INDEX IF NOT EXISTS idx_segments_timing " "ON speaker_segments (call_id, start_time_seconds);"),
+        # Frequency, talkgroup and system filters are the search hot path: the covering indexes
+        # carry every column search_radio_calls() selects, so those pages are index-only scans
+        "DROP INDEX IF EXISTS idx_calls_frequency;",
+        "DROP INDEX IF EXISTS idx_calls_talkgroup;",
+        "DROP INDEX IF EXISTS idx_calls_system;",
+        # (v4: the v3 covering indexes lacked system_id / talkgroup_id, so they are rebuilt)
+        "DROP INDEX IF EXISTS idx_calls_talkgroup_covering;",
+        "DROP INDEX IF EXISTS idx_calls_system_covering;",
+        _covering_search_index("idx_calls_frequency_search", "frequency"),
+        _covering_search_index("idx_calls_talkgroup_search", "talkgroup_id"),
+        _covering_search_index("idx_calls_system_search", "system_id"),
+        # Calls still awaiting transcription. Partial, so it stays the size of the backlog
+        # instead of growing with every completed call (replaces the plain idx_calls_status)
+        "DROP INDEX IF EXISTS idx_calls_status;",
+        (
+            "CREATE INDEX IF NOT EXISTS idx_calls_unfinished ON radio_calls (timestamp DESC) "
+            "WHERE transcription_status IN ('pending', 'processing', 'failed');"
+        ),
+        # Full-text search on transcripts (replaces the idx_transcript_text expression index)
+        "DROP INDEX IF EXISTS idx_transcript_text;",
         # Security event indexes
-        ("CREATE INDEX IF NOT EXISTS idx_security_events_timestamp " "ON security_events (timestamp DESC);"),
+        # Newest-first listing walks the (timestamp, event_id) primary key backwards, so plain
+        # time ranges only need a BRIN summary: a few pages instead of a B-tree per row
+        "DROP INDEX IF EXISTS idx_security_events_timestamp;",
+        (
+            "CREATE INDEX IF NOT EXISTS idx_security_events_timestamp_brin "
+            "ON security_events USING BRIN (timestamp) WITH (pages_per_range = 32);"
+        ),
         ("CREATE INDEX IF NOT EXISTS idx_security_events_type " "ON security_events (event_type, timestamp DESC);"),
         ("CREATE INDEX IF NOT EXISTS idx_security_events_severity " "ON security_events (severity, timestamp DESC);"),
-        ("CREATE INDEX IF NOT EXISTS idx_security_events_source_ip " "ON security_events (source_ip, timestamp DESC);"),
+        # Source lookups always compare with =, which implies IS NOT NULL, so events without
+        # a source (internal/system events) are left out of these indexes entirely
+        "DROP INDEX IF EXISTS idx_security_events_source_ip;",
+        "DROP INDEX IF EXISTS idx_security_events_source_system;",
         (
-            "CREATE INDEX IF NOT EXISTS idx_security_events_source_system "
-            "ON security_events (source_system, timestamp DESC);"
+            "CREATE INDEX IF NOT EXISTS idx_security_events_by_source_ip "
+            "ON security_events (source_ip, timestamp DESC) WHERE source_ip IS NOT NULL;"
+        ),
+        (
+            "CREATE INDEX IF NOT EXISTS idx_security_events_by_source_system "
+            "ON security_events (source_system, timestamp DESC) WHERE source_system IS NOT NULL;"
+        ),
+        # Metadata containment (metadata @> '{...}'); jsonb_path_ops is about half the size of
+        # the default jsonb_ops and only needs to support @>
+        (
+            "CREATE INDEX IF NOT EXISTS idx_security_events_metadata "
+            "ON security_events USING GIN (metadata jsonb_path_ops);"
         ),
         # Security tracking indexes on radio_calls
         ("CREATE INDEX IF NOT EXISTS idx_calls_upload_source_ip " "ON radio_calls (upload_source_ip, timestamp DESC);"),
@@ -156,16 +264,41 @@ async def create_schema(db_manager: DatabaseManager) -> None:
         ),
     ]
 
+    # Indexes on the plain (non-hypertable) tables are built CONCURRENTLY so uploads and
+    # transcriptions keep writing meanwhile. TimescaleDB rejects CONCURRENTLY on hypertables,
+    # so radio_calls and security_events indexes stay in the script above.
+    concurrent_indexes = {
+        # Full-text search on transcripts
+        "idx_transcriptions_tsv": "ON transcriptions USING GIN(tsv)",
+        # Speaker segment searches
+        "idx_segments_speaker": "ON speaker_segments (speaker_id, call_id)",
+        "idx_segments_timing": "ON speaker_segments (call_id, start_time_seconds)",
+    }
+
+    # Tables, then indexes, sent as one script: a single round trip, and since a
+    # multi-statement simple query runs as one implicit transaction, all or nothing
+    schema_script = "\n".join(
+        [
+            radio_calls_sql,
+            transcriptions_sql,
+            transcriptions_tsv_sql,
+            speaker_segments_sql,
+            security_events_sql,
+            schema_meta_sql,
+            *indexes_sql,
+        ]
+    )
+
     try:
-        # Create tables
-        await db_manager.execute(radio_calls_sql)
-        await db_manager.execute(transcriptions_sql)
-        await db_manager.execute(speaker_segments_sql)
-        await db_manager.execute(security_events_sql)
+        await db_manager.execute(schema_script)
 
-        # Create indexes
-        for index_sql in indexes_sql:
-            await db_manager.execute(index_sql)
+        # CONCURRENTLY cannot run inside the script's transaction; each build gets its own connection
+        await asyncio.gather(
+            *(
+                _create_index_concurrently(db_manager, name, definition)
+                for name, definition in concurrent_indexes.items()
+            )
+        )
 
         logger.info("Database schema created successfully")
 
@@ -174,6 +307,105 @@ async def create_schema(db_manager: DatabaseManager) -> None:
         raise
 
 
+async def record_schema_version(db_manager: DatabaseManager) -> None:
+    """Mark the database as set up for the current SCHEMA_VERSION."""
+    await db_manager.execute(
+        """
+        INSERT INTO schema_meta (id, version) VALUES (TRUE, $1)
+        ON CONFLICT (id) DO UPDATE SET version = EXCLUDED.version, updated_at = NOW()
+        """,
+        SCHEMA_VERSION,
+    )
+    logger.info(f"Recorded database schema version {SCHEMA_VERSION}")
+
+
+async def ensure_rum_index(db_manager: DatabaseManager) -> bool:
+    """
+    Create the RUM full-text index on transcriptions if the extension is available.
+
+    Unlike GIN, a RUM index can return matches already ordered by relevance
+    (``tsv <=> query``), so ranked top-N searches skip ranking and sorting every
+    match. Returns whether ranked searches can use it.
+    """
+    try:
+        available = await db_manager.fetchval("SELECT COUNT(*) FROM pg_available_extensions WHERE name = 'rum'")
+        if not available:
+            logger.warning("RUM extension not installed - transcript search keeps using the GIN index")
+            return False
+
+        await db_manager.execute("CREATE EXTENSION IF NOT EXISTS rum")
+        await _create_index_concurrently(
+            db_manager, "idx_transcriptions_tsv_rum", "ON transcriptions USING rum (tsv rum_tsvector_ops)"
+        )
+        logger.info("RUM transcript search index ready")
+        return True
+
+    except Exception as e:
+        logger.error(f"Failed to set up RUM transcript index: {e}")
+        return False
+
+
+async def security_rollup_available(db_manager: DatabaseManager) -> bool:
+    """Whether the security event continuous aggregate exists to answer per-system counts."""
+    try:
+        return bool(await db_manager.fetchval(f"SELECT to_regclass('{SECURITY_ROLLUP_VIEW}') IS NOT NULL"))
+    except Exception as e:
+        logger.warning(f"Failed to check for the security event rollup: {e}")
+        return False
+
+
+async def set_chunk_time_interval(db_manager: DatabaseManager, interval: timedelta) -> None:
+    """
+    Set the chunk size new hypertable chunks are created with.
+
+    Smaller chunks keep the recent, write-heavy range small enough to stay in
+    memory uncompressed while older chunks become eligible for compression sooner.
+    Existing chunks keep their size.
+    """
+    try:
+        for table in HYPERTABLES:
+            await db_manager.execute(f"SELECT set_chunk_time_interval('{table}', $1::interval)", interval)
+    except Exception as e:
+        logger.warning(f"Failed to set chunk time interval: {e}")
+
+
+async def _timescale_step(description: str, step: Awaitable[object]) -> None:
+    """Await one TimescaleDB setup step, logging instead of raising if it fails."""
+    try:
+        await step
+    except Exception as e:
+        logger.error(f"Failed to set up {description}: {e}")
+
+
+async def _set_compression(db_manager: DatabaseManager, table: str, segmentby: str, orderby: str) -> None:
+    """Enable compression on a hypertable, skipping the ALTER when its settings already match."""
+    current = await db_manager.fetchrow(
+        """
+        SELECT
+            string_agg(attname, ', ' ORDER BY segmentby_column_index)
+                FILTER (WHERE segmentby_column_index IS NOT NULL) AS segmentby,
+            string_agg(attname || CASE WHEN orderby_asc THEN '' ELSE ' DESC' END, ', ' ORDER BY orderby_column_index)
+                FILTER (WHERE orderby_column_index IS NOT NULL) AS orderby
+        FROM timescaledb_information.compression_settings
+        WHERE hypertable_name = $1
+        """,
+        table,
+    )
+    if current and (current["segmentby"], current["orderby"]) == (segmentby, orderby):
+        return
+
+    await db_manager.execute(
+        f"""
+        ALTER TABLE {table} SET (
+            timescaledb.compress,
+            timescaledb.compress_segmentby = '{segmentby}',
+            timescaledb.compress_orderby = '{orderby}'
+        )
+        """
+    )
+    logger.info(f"Compression enabled on {table}")
+
+
 async def ensure_timescale_setup(db_manager: DatabaseManager) -> None:
     """Set up TimescaleDB hypertables and policies."""
 
@@ -209,30 +441,63 @@ async def ensure_timescale_setup(db_manager: DatabaseManager) -> None:
             )
             logger.info("Created security_events hypertable")
 
-        # Set chunk time interval to 1 day (optimize for our query patterns)
-        await db_manager.execute("SELECT set_chunk_time_interval('radio_calls', INTERVAL '1 day')")
+    except Exception as e:
+        logger.error(f"Failed to set up TimescaleDB hypertables: {e}")
+        # Don't raise - the system can work without these optimizations
+        return
 
-        # Enable compression for older data (saves storage)
-        await db_manager.execute(
-            """
-            ALTER TABLE radio_calls SET (
-                timescaledb.compress,
-                timescaledb.compress_segmentby = 'frequency, talkgroup_id'
-            )
-        """
+    # Independent steps, each logging its own failure so one rejected step (say,
+    # new compression settings on already compressed chunks) doesn't skip the rest
+    for table, (segmentby, orderby) in COMPRESSION_SETTINGS.items():
+        await _timescale_step(
+            f"compression settings on {table}", _set_compression(db_manager, table, segmentby, orderby)
         )
-
-        # Auto-compress data older than 30 days
-        compression_policy_check = await db_manager.fetchval(
-            ("SELECT COUNT(*) FROM timescaledb_information.jobs " "WHERE proc_name = 'policy_compression'")
+    for table in HYPERTABLES:
+        # Auto-compress data older than COMPRESS_AFTER
+        await _timescale_step(
+            f"compression policy on {table}",
+            db_manager.execute(
+                f"SELECT add_compression_policy('{table}', INTERVAL '{COMPRESS_AFTER}', if_not_exists => TRUE)"
+            ),
+        )
+        # The policy job only picks chunks up on its next scheduled run, so compress
+        # whatever history already qualifies now
+        await _timescale_step(
+            f"compression of old {table} chunks",
+            db_manager.execute(
+                f"""
+                SELECT compress_chunk(c, if_not_compressed => TRUE)
+                FROM show_chunks('{table}', older_than => INTERVAL '{COMPRESS_AFTER}') c
+                """
+            ),
         )
 
-        if not compression_policy_check:
-            await db_manager.execute("SELECT add_compression_policy('radio_calls', INTERVAL '30 days')")
-            logger.info("Added compression policy for old data")
-
-        logger.info("TimescaleDB setup completed")
+    # Per-system event counts for upload source analysis. Real-time (not materialized_only),
+    # so the hour the policy has not refreshed yet is still counted from the raw rows.
+    await _timescale_step(
+        "security event rollup",
+        db_manager.execute(
+            f"""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS {SECURITY_ROLLUP_VIEW}
+            WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+            SELECT time_bucket(INTERVAL '1 hour', timestamp) AS bucket,
+                   source_system, event_type, severity, COUNT(*) AS event_count
+            FROM security_events
+            GROUP BY bucket, source_system, event_type, severity
+            """
+        ),
+    )
+    await _timescale_step(
+        "security event rollup policy",
+        db_manager.execute(
+            f"""
+            SELECT add_continuous_aggregate_policy('{SECURITY_ROLLUP_VIEW}',
+                start_offset => INTERVAL '7 days',
+                end_offset => INTERVAL '1 hour',
+                schedule_interval => INTERVAL '10 minutes',
+                if_not_exists => TRUE)
+            """
+        ),
+    )
 
-    except Exception as e:
-        logger.error(f"Failed to set up TimescaleDB optimizations: {e}")
-        # Don't raise - the system can work without these optimizations
+    logger.info("TimescaleDB setup completed")
@@ -1,10 +1,13 @@
 """Enhanced authentication and security service."""
 
+import hmac
 import logging
+from collections import deque
+from itertools import islice
 from typing import TYPE_CHECKING, Any, Optional, Tuple, cast
 from uuid import UUID
 
-from stable_squirrel.config import IngestionConfig
+from stable_squirrel.config import APIKeyConfig, IngestionConfig, api_key_digest
 from stable_squirrel.database.models import SecurityEvent
 
 if TYPE_CHECKING:
@@ -12,6 +15,21 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Routine audit events that may be dropped when the batch writer's queue is full;
+# anything more severe is written directly instead
+DROPPABLE_SEVERITIES = frozenset({"info", "low"})
+
+# Cap on events kept in memory when there is no database to store them
+FALLBACK_EVENT_BUFFER = 10000
+
+LOG_LEVELS = {
+    "info": logging.INFO,
+    "low": logging.INFO,
+    "medium": logging.WARNING,
+    "high": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
 
 class SecurityAuthService:
     """Enhanced authentication service with IP validation and audit logging."""
@@ -19,7 +37,9 @@ class SecurityAuthService:
     def __init__(self, config: IngestionConfig, security_ops: Optional["SecurityEventOperations"] = None):
         self.config = config
         self.security_ops = security_ops
-        self._security_events: list[SecurityEvent] = []  # Fallback in-memory storage if no DB operations provided
+        # Fallback in-memory storage if no DB operations provided; oldest events fall off
+        # the front, so it stays in creation (timestamp) order
+        self._security_events: deque[SecurityEvent] = deque(maxlen=FALLBACK_EVENT_BUFFER)
 
     async def validate_api_key(
         self, api_key: str, client_ip: str, system_id: Optional[str] = None, user_agent: Optional[str] = None
@@ -31,62 +51,50 @@ class SecurityAuthService:
             (is_valid, api_key_id, security_event)
         """
 
+        # Keys are matched by digest: one hash and one dict lookup however many keys are
+        # configured, and the legacy comparison does not leak timing about the key
+        digest = api_key_digest(api_key)
+
         # Check legacy single API key first (for backward compatibility)
-        if self.config.api_key and api_key == self.config.api_key:
-            await self._log_security_event(
-                event_type="api_key_used",
-                severity="info",
-                source_ip=client_ip,
-                source_system=system_id,
-                api_key_used="legacy",
-                user_agent=user_agent,
-                description=f"Legacy API key used by system {system_id}",
-            )
+        legacy_digest = self.config.legacy_api_key_digest
+        if legacy_digest is not None and hmac.compare_digest(digest, legacy_digest):
+            await self._log_api_key_used(client_ip, system_id, "legacy", user_agent)
             return True, "legacy", None
 
         # Check enhanced API keys
-        for key_config in self.config.api_keys:
-            if key_config.key == api_key:
-                # Validate IP restrictions
-                if key_config.allowed_ips and client_ip not in key_config.allowed_ips:
-                    event = await self._log_security_event(
-                        event_type="api_key_ip_violation",
-                        severity="high",
-                        source_ip=client_ip,
-                        source_system=system_id,
-                        api_key_used=key_config.key[:8] + "...",  # Partial key for logging
-                        user_agent=user_agent,
-                        description=f"API key used from unauthorized IP {client_ip}",
-                        metadata={"allowed_ips": key_config.allowed_ips, "actual_ip": client_ip},
-                    )
-                    return False, None, event
-
-                # Validate system restrictions
-                if key_config.allowed_systems and system_id and system_id not in key_config.allowed_systems:
-                    event = await self._log_security_event(
-                        event_type="api_key_system_violation",
-                        severity="high",
-                        source_ip=client_ip,
-                        source_system=system_id,
-                        api_key_used=key_config.key[:8] + "...",
-                        user_agent=user_agent,
-                        description=f"API key used by unauthorized system {system_id}",
-                        metadata={"allowed_systems": key_config.allowed_systems, "actual_system": system_id},
-                    )
-                    return False, None, event
-
-                # Valid API key usage
-                await self._log_security_event(
-                    event_type="api_key_used",
-                    severity="info",
+        key_config = self.config.api_key_index.get(digest)
+        if key_config is not None:
+            # Validate IP restrictions
+            if not key_config.allows_ip(client_ip):
+                event = await self._log_security_event(
+                    event_type="api_key_ip_violation",
+                    severity="high",
+                    source_ip=client_ip,
+                    source_system=system_id,
+                    api_key_used=key_config.key[:8] + "...",  # Partial key for logging
+                    user_agent=user_agent,
+                    description=f"API key used from unauthorized IP {client_ip}",
+                    metadata={"allowed_ips": sorted(key_config.allowed_ips or ()), "actual_ip": client_ip},
+                )
+                return False, None, event
+
+            # Validate system restrictions
+            if key_config.allowed_systems and system_id and system_id not in key_config.allowed_systems:
+                event = await self._log_security_event(
+                    event_type="api_key_system_violation",
+                    severity="high",
                     source_ip=client_ip,
                     source_system=system_id,
                     api_key_used=key_config.key[:8] + "...",
                     user_agent=user_agent,
-                    description=f"Valid API key used by system {system_id}",
-                    metadata={"key_description": key_config.description},
+                    description=f"API key used by unauthorized system {system_id}",
+                    metadata={"allowed_systems": sorted(key_config.allowed_systems), "actual_system": system_id},
                 )
-                return True, key_config.key[:8], None
+                return False, None, event
+
+            # Valid API key usage
+            await self._log_api_key_used(client_ip, system_id, key_config.key[:8] + "...", user_agent, key_config)
+            return True, key_config.key[:8], None
 
         # No valid API key found
         event = await self._log_security_event(
@@ -143,6 +151,35 @@ class SecurityAuthService:
             metadata={"limit_type": limit_type, "current_count": current_count, "limit": limit},
         )
 
+    async def _log_api_key_used(
+        self,
+        client_ip: str,
+        system_id: Optional[str],
+        api_key_used: str,
+        user_agent: Optional[str],
+        key_config: Optional[APIKeyConfig] = None,
+    ) -> None:
+        """
+        Record a successful authentication.
+
+        This runs on every upload, so with a database it is only tallied and stored
+        as a periodic per-source summary; no event, metadata or log line is built.
+        """
+        if self.security_ops:
+            self.security_ops.tally_security_event("api_key_used", client_ip, system_id, api_key_used)
+            return
+
+        await self._log_security_event(
+            event_type="api_key_used",
+            severity="info",
+            source_ip=client_ip,
+            source_system=system_id,
+            api_key_used=api_key_used,
+            user_agent=user_agent,
+            description=f"{'Valid' if key_config else 'Legacy'} API key used by system {system_id}",
+            metadata={"key_description": key_config.description} if key_config else None,
+        )
+
     async def _log_security_event(
         self,
         event_type: str,
@@ -179,10 +216,12 @@ class SecurityAuthService:
             related_file_path=related_file_path,
         )
 
-        # Store in database if available, otherwise fall back to memory
+        # Store in database if available, otherwise fall back to memory. Events are queued
+        # for the background batch writer so the request never waits on the INSERT.
         if self.security_ops:
             try:
-                await self.security_ops.create_security_event(event)
+                if not self.security_ops.queue_security_event(event) and severity not in DROPPABLE_SEVERITIES:
+                    await self.security_ops.create_security_event(event)
             except Exception as e:
                 logger.warning(f"Failed to store security event in database: {e}")
                 self._security_events.append(event)
@@ -190,15 +229,11 @@ class SecurityAuthService:
             self._security_events.append(event)
 
         # Log to application logger based on severity
-        log_level = {
-            "info": logger.info,
-            "low": logger.info,
-            "medium": logger.warning,
-            "high": logger.error,
-            "critical": logger.critical,
-        }.get(severity, logger.info)
-
-        log_level(f"Security Event [{event_type}]: {description} " f"(IP: {source_ip}, System: {source_system})")
+        log_level = LOG_LEVELS.get(severity, logging.INFO)
+        if logger.isEnabledFor(log_level):
+            logger.log(
+                log_level, f"Security Event [{event_type}]: {description} (IP: {source_ip}, System: {source_system})"
+            )
 
         return event
 
@@ -216,18 +251,14 @@ class SecurityAuthService:
             except Exception as e:
                 logger.warning(f"Failed to retrieve security events from database: {e}")
 
-        # Fallback to in-memory events
-        events = self._security_events
-
-        if event_type:
-            events = [e for e in events if e.event_type == event_type]
-
-        if severity:
-            events = [e for e in events if e.severity == severity]
-
-        # Return most recent events first
-        events.sort(key=lambda e: e.timestamp, reverse=True)
-        return events[:limit]
+        # Fallback to in-memory events: already in time order, so walk newest-first and
+        # stop after limit matches instead of filtering and sorting everything
+        matches = (
+            e
+            for e in reversed(self._security_events)
+            if (not event_type or e.event_type == event_type) and (not severity or e.severity == severity)
+        )
+        return list(islice(matches, limit))
 
     async def get_upload_source_analysis(self, system_id: str) -> dict[str, Any]:
         """Analyze upload patterns for a specific source system."""
@@ -241,15 +272,32 @@ class SecurityAuthService:
             except Exception as e:
                 logger.warning(f"Failed to retrieve upload analysis from database: {e}")
 
-        # Fallback to in-memory analysis
-        system_events = [e for e in self._security_events if e.source_system == system_id]
+        # Fallback to in-memory analysis, in a single pass over the buffer
+        total_events = upload_attempts = security_violations = 0
+        last_seen = None
+        unique_ips: set[str] = set()
+        recent_events: deque[SecurityEvent] = deque(maxlen=10)
+
+        for event in self._security_events:
+            if event.source_system != system_id:
+                continue
+            total_events += 1
+            if "upload" in event.event_type:
+                upload_attempts += 1
+            if event.severity in ("high", "critical"):
+                security_violations += 1
+            if last_seen is None or event.timestamp > last_seen:
+                last_seen = event.timestamp
+            if event.source_ip:
+                unique_ips.add(event.source_ip)
+            recent_events.append(event)
 
         return {
             "system_id": system_id,
-            "total_events": len(system_events),
-            "upload_attempts": len([e for e in system_events if "upload" in e.event_type]),
-            "security_violations": len([e for e in system_events if e.severity in ["high", "critical"]]),
-            "last_seen": max([e.timestamp for e in system_events]) if system_events else None,
-            "unique_ips": len(set([e.source_ip for e in system_events if e.source_ip])),
-            "recent_events": system_events[:10],  # Last 10 events
+            "total_events": total_events,
+            "upload_attempts": upload_attempts,
+            "security_violations": security_violations,
+            "last_seen": last_seen,
+            "unique_ips": len(unique_ips),
+            "recent_events": list(reversed(recent_events)),  # Last 10 events, newest first
         }
@@ -1,15 +1,92 @@
 """Upload validation and security for audio files."""
 
 import logging
-import mimetypes
-from pathlib import Path
-from typing import Dict, List, Optional, Set
+import os
+import re
+import time
+from collections import OrderedDict
+from functools import cached_property
+from typing import Any, FrozenSet, Optional, Tuple
 
 from fastapi import UploadFile
 from pydantic import BaseModel, Field
 
+from stable_squirrel.utils.audio_duration import id3_tag_end
+
 logger = logging.getLogger(__name__)
 
+# Header and malicious-content checks only look at the start of the file, so only
+# this much of an upload is read during validation (the size check needs no read)
+CONTENT_PREFIX_BYTES = 4096
+
+# Filename substrings that are never allowed, matched in a single regex pass
+DANGEROUS_FILENAME_PATTERNS = (
+    "..",
+    "/",
+    "\\",
+    ":",
+    "*",
+    "?",
+    '"',
+    "<",
+    ">",
+    "|",
+    ".exe",
+    ".bat",
+    ".cmd",
+    ".scr",
+    ".pif",
+    ".com",
+)
+_DANGEROUS_FILENAME_RE = re.compile("|".join(map(re.escape, DANGEROUS_FILENAME_PATTERNS)))
+
+# Malicious content signatures as (name, pattern, message). File signatures are
+# anchored at the start, where they never appear in legitimate audio; script
+# markers may sit anywhere in the leading metadata bytes, in any case.
+MALICIOUS_SIGNATURES = (
+    ("elf", rb"\A\x7fELF", "Executable file detected"),
+    ("java_class", rb"\A\xca\xfe\xba\xbe", "Java class file detected"),
+    ("pdf", rb"\A%PDF", "PDF file detected"),
+    ("script", rb"(?i:<script|javascript:)", "Script content detected in file header"),
+)
+SIGNATURE_SCAN_BYTES = 64
+
+# All signatures compiled into one pattern, so a scan is a single search
+_SIGNATURE_RE = re.compile(
+    b"|".join(b"(?P<%s>%s)" % (name.encode(), pattern) for name, pattern, _ in MALICIOUS_SIGNATURES)
+)
+_SIGNATURE_MESSAGES = {name: message for name, _, message in MALICIOUS_SIGNATURES}
+
+# MIME type implied by each accepted extension, trusted when a client declares something else
+_EXT_TO_MIME = {".mp3": "audio/mpeg"}
+
+# Second byte of an MP3 frame header after the 0xFF sync byte: MPEG-1 and MPEG-2
+# Layer III, with or without CRC protection
+MP3_FRAME_SYNC_SECOND_BYTES = frozenset((0xFB, 0xFA, 0xF3, 0xF2))
+
+
+def _is_mp3_frame_header(data: bytes, offset: int) -> bool:
+    """Whether an MP3 frame header starts at ``offset``."""
+    return len(data) >= offset + 2 and data[offset] == 0xFF and data[offset + 1] in MP3_FRAME_SYNC_SECOND_BYTES
+
+
+# Idle IPs are swept from the rate limit counters this often, or sooner once this many are tracked
+RATE_LIMIT_SWEEP_SECONDS = 300
+RATE_LIMIT_SWEEP_SIZE = 10_000
+
+# Per-IP sliding window counter: (window index, previous window count, current window count)
+WindowCounter = Tuple[int, int, int]
+
+
+def _roll_window(counter: Optional[WindowCounter], window: int) -> WindowCounter:
+    """Advance a counter to ``window``, carrying the current count over only if it was the one before."""
+    if counter is None:
+        return (window, 0, 0)
+    start, previous, current = counter
+    if start == window:
+        return counter
+    return (window, current if start == window - 1 else 0, 0)
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
@@ -25,13 +102,14 @@ class SecurityConfig(BaseModel):
     min_file_size: int = Field(default=1024, description="Minimum file size in bytes (1KB)")
 
     # Allowed file types
-    allowed_mime_types: Set[str] = Field(
-        default={"audio/mpeg", "audio/mp3"},
+    allowed_mime_types: FrozenSet[str] = Field(
+        default=frozenset({"audio/mpeg", "audio/mp3"}),
         description="Allowed MIME types for SDR audio files (MP3 only - SDRTrunk standard)",
     )
 
-    allowed_extensions: Set[str] = Field(
-        default={".mp3"}, description="Allowed file extensions for SDR audio files (MP3 only - SDRTrunk standard)"
+    allowed_extensions: FrozenSet[str] = Field(
+        default=frozenset({".mp3"}),
+        description="Allowed file extensions for SDR audio files (MP3 only - SDRTrunk standard)",
     )
 
     # Content validation
@@ -42,21 +120,44 @@ class SecurityConfig(BaseModel):
     max_uploads_per_minute: int = Field(default=10, description="Maximum uploads per IP per minute")
     max_uploads_per_hour: int = Field(default=100, description="Maximum uploads per IP per hour")
 
+    @cached_property
+    def allowed_extensions_text(self) -> str:
+        """Sorted, comma-separated ``allowed_extensions`` for error messages (cached until a field is reassigned)."""
+        return ", ".join(sorted(self.allowed_extensions))
+
+    @cached_property
+    def allowed_mime_types_text(self) -> str:
+        """Sorted, comma-separated ``allowed_mime_types`` for error messages (cached until a field is reassigned)."""
+        return ", ".join(sorted(self.allowed_mime_types))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self.__dict__.pop("allowed_extensions_text", None)
+        self.__dict__.pop("allowed_mime_types_text", None)
+
 
 class AudioFileValidator:
     """Validates audio file uploads for security."""
 
+    __slots__ = ("config", "_minute_counters", "_hour_counters", "_last_sweep")
+
     def __init__(self, config: SecurityConfig):
         self.config = config
-        self._upload_tracking: Dict[str, List[float]] = {}  # IP -> list of timestamps
-
-    async def validate_upload_file(self, file: UploadFile, client_ip: str) -> None:
+        # IP -> sliding window counter, one map per limit window, least recently seen IP first
+        self._minute_counters: OrderedDict[str, WindowCounter] = OrderedDict()
+        self._hour_counters: OrderedDict[str, WindowCounter] = OrderedDict()
+        self._last_sweep = time.time()
+
+    async def validate_upload_file(
+        self, file: UploadFile, client_ip: str, content_length: Optional[int] = None
+    ) -> None:
         """
         Comprehensive validation of uploaded audio file.
 
         Args:
             file: The uploaded file to validate
             client_ip: Client IP address for rate limiting
+            content_length: Request Content-Length, the size bound used when the file has no size
 
         Raises:
             ValidationError: If validation fails
@@ -65,62 +166,80 @@ class AudioFileValidator:
         self._check_rate_limits(client_ip)
 
         # Basic file validation
-        await self._validate_file_basics(file)
+        file_ext = await self._validate_file_basics(file)
 
         # Content type validation
-        self._validate_content_type(file)
+        self._validate_content_type(file, file_ext)
 
         # File size validation
-        await self._validate_file_size(file)
+        self._validate_file_size(file, content_length)
 
         # Content validation (requires reading file)
         if self.config.require_valid_audio_header or self.config.scan_for_malicious_content:
-            await self._validate_file_content(file)
+            await self._validate_file_content(file, file_ext)
 
-        # Record successful upload for rate limiting
-        self._record_upload(client_ip)
+        # Record successful upload for rate limiting (counters were rolled by the check)
+        for counters in (self._minute_counters, self._hour_counters):
+            start, previous, current = counters[client_ip]
+            counters[client_ip] = (start, previous, current + 1)
 
         logger.info(f"File validation passed: {file.filename} from {client_ip}")
 
     def _check_rate_limits(self, client_ip: str) -> None:
-        """Check if client has exceeded rate limits."""
-        import time
-
-        current_time = time.time()
-
-        # Clean old entries and get current uploads
-        if client_ip in self._upload_tracking:
-            # Remove uploads older than 1 hour
-            self._upload_tracking[client_ip] = [
-                ts for ts in self._upload_tracking[client_ip] if current_time - ts < 3600
-            ]
-        else:
-            self._upload_tracking[client_ip] = []
+        """
+        Check if client has exceeded rate limits.
 
-        uploads = self._upload_tracking[client_ip]
+        Uses a sliding window counter per limit: the upload count in the current
+        fixed window plus the previous window's count weighted by how much of it
+        still overlaps the trailing window. This is O(1) per request and keeps
+        three integers per IP instead of every upload timestamp.
+        """
+        now = time.time()
+        if now - self._last_sweep >= RATE_LIMIT_SWEEP_SECONDS or len(self._hour_counters) > RATE_LIMIT_SWEEP_SIZE:
+            self._sweep_counters(now)
 
-        # Check hourly limit
-        if len(uploads) >= self.config.max_uploads_per_hour:
+        hourly = self._window_estimate(self._hour_counters, client_ip, now, 3600)
+        if hourly >= self.config.max_uploads_per_hour:
             raise ValidationError(f"Rate limit exceeded: maximum {self.config.max_uploads_per_hour} uploads per hour")
 
-        # Check per-minute limit
-        recent_uploads = [ts for ts in uploads if current_time - ts < 60]
-        if len(recent_uploads) >= self.config.max_uploads_per_minute:
+        per_minute = self._window_estimate(self._minute_counters, client_ip, now, 60)
+        if per_minute >= self.config.max_uploads_per_minute:
             raise ValidationError(
                 f"Rate limit exceeded: maximum {self.config.max_uploads_per_minute} uploads per minute"
             )
 
-    def _record_upload(self, client_ip: str) -> None:
-        """Record a successful upload for rate limiting."""
-        import time
-
-        if client_ip not in self._upload_tracking:
-            self._upload_tracking[client_ip] = []
-
-        self._upload_tracking[client_ip].append(time.time())
+    @staticmethod
+    def _window_estimate(
+        counters: OrderedDict[str, WindowCounter], client_ip: str, now: float, window_seconds: int
+    ) -> float:
+        """Roll the IP's counter to the current window and estimate uploads in the trailing window."""
+        window = int(now // window_seconds)
+        counter = _roll_window(counters.get(client_ip), window)
+        counters[client_ip] = counter
+        counters.move_to_end(client_ip)
+
+        _, previous, current = counter
+        overlap = 1 - (now % window_seconds) / window_seconds
+        return current + previous * overlap
+
+    def _sweep_counters(self, now: float) -> None:
+        """
+        Drop IPs idle for two full windows, whose counters would roll back to zero anyway.
 
-    async def _validate_file_basics(self, file: UploadFile) -> None:
-        """Basic file validation."""
+        Counters are kept in last-use order, so each sweep stops at the first
+        IP still in use and only visits the entries it removes.
+        """
+        for counters, window_seconds in ((self._minute_counters, 60), (self._hour_counters, 3600)):
+            window = int(now // window_seconds)
+            while counters:
+                oldest_ip, (start, _, _) = next(iter(counters.items()))
+                if start >= window - 1:
+                    break
+                del counters[oldest_ip]
+        self._last_sweep = now
+
+    async def _validate_file_basics(self, file: UploadFile) -> str:
+        """Basic file validation; returns the lowercased file extension for the later checks."""
         if not file:
             raise ValidationError("No file provided")
 
@@ -131,62 +250,42 @@ class AudioFileValidator:
         filename = file.filename.lower()
 
         # Block potentially dangerous filenames
-        dangerous_patterns = [
-            "..",
-            "/",
-            "\\",
-            ":",
-            "*",
-            "?",
-            '"',
-            "<",
-            ">",
-            "|",
-            ".exe",
-            ".bat",
-            ".cmd",
-            ".scr",
-            ".pif",
-            ".com",
-        ]
-
-        for pattern in dangerous_patterns:
-            if pattern in filename:
-                raise ValidationError(f"Invalid filename: contains dangerous pattern '{pattern}'")
-
-        # Check file extension
-        file_ext = Path(filename).suffix.lower()
+        match = _DANGEROUS_FILENAME_RE.search(filename)
+        if match:
+            raise ValidationError(f"Invalid filename: contains dangerous pattern '{match.group()}'")
+
+        # Check file extension (the name is already lowercased and free of path separators)
+        file_ext = os.path.splitext(filename)[1]
         if file_ext not in self.config.allowed_extensions:
             raise ValidationError(
-                f"Invalid file extension '{file_ext}'. " f"Allowed: {', '.join(sorted(self.config.allowed_extensions))}"
+                f"Invalid file extension '{file_ext}'. " f"Allowed: {self.config.allowed_extensions_text}"
             )
+        return file_ext
 
-    def _validate_content_type(self, file: UploadFile) -> None:
+    def _validate_content_type(self, file: UploadFile, file_ext: str) -> None:
         """Validate MIME type."""
         # Check declared content type
         if file.content_type and file.content_type not in self.config.allowed_mime_types:
-            # Try to guess content type from filename
-            if file.filename:
-                guessed_type, _ = mimetypes.guess_type(file.filename)
-                if guessed_type and guessed_type in self.config.allowed_mime_types:
-                    return  # Guessed type is valid
+            # Fall back to the type implied by the (already validated) extension
+            if _EXT_TO_MIME.get(file_ext) in self.config.allowed_mime_types:
+                return
             raise ValidationError(
                 f"Invalid content type '{file.content_type}'. "
-                f"Allowed: {', '.join(sorted(self.config.allowed_mime_types))}"
+                f"Allowed: {self.config.allowed_mime_types_text}"
             )
 
-    async def _validate_file_size(self, file: UploadFile) -> None:
-        """Validate file size."""
-        # Get file size
-        file_size = 0
-        if hasattr(file, "size") and file.size:
-            file_size = file.size
-        else:
-            # Read file to get size (will reset position after)
-            initial_position = file.file.tell()
-            file.file.seek(0, 2)  # Seek to end
-            file_size = file.file.tell()
-            file.file.seek(initial_position)  # Reset position
+    def _validate_file_size(self, file: UploadFile, content_length: Optional[int]) -> None:
+        """Validate file size from the size Starlette records while spooling, never by seeking the file."""
+        file_size = getattr(file, "size", None)
+        if file_size is None:
+            if content_length is None:
+                raise ValidationError("Upload size unknown: no file size or Content-Length")
+            # The whole request body bounds the file from above, so only the maximum applies
+            if content_length > self.config.max_file_size:
+                raise ValidationError(
+                    f"File too large: {content_length} bytes " f"(maximum: {self.config.max_file_size} bytes)"
+                )
+            return
 
         if file_size < self.config.min_file_size:
             raise ValidationError(f"File too small: {file_size} bytes " f"(minimum: {self.config.min_file_size} bytes)")
@@ -194,10 +293,9 @@ class AudioFileValidator:
         if file_size > self.config.max_file_size:
             raise ValidationError(f"File too large: {file_size} bytes " f"(maximum: {self.config.max_file_size} bytes)")
 
-    async def _validate_file_content(self, file: UploadFile) -> None:
-        """Validate file content for security."""
-        # Read file content for validation
-        file_content = await file.read()
+    async def _validate_file_content(self, file: UploadFile, file_ext: str) -> None:
+        """Validate file content for security, reading only the leading CONTENT_PREFIX_BYTES."""
+        header = await file.read(CONTENT_PREFIX_BYTES)
 
         try:
             # Reset file position for later use
@@ -206,57 +304,51 @@ class AudioFileValidator:
             # Some UploadFile implementations don't support seek
             pass
 
-        if not file_content:
+        if not header:
             raise ValidationError("Empty file content")
 
         # Scan for malicious content first (security priority)
         if self.config.scan_for_malicious_content:
-            self._scan_malicious_content(file_content)
+            self._scan_malicious_content(header)
 
         # Check for valid audio headers after malicious content check
         if self.config.require_valid_audio_header:
-            self._check_audio_headers(file_content, file.filename or "unknown")
+            self._check_audio_headers(header, file_ext)
 
-    def _check_audio_headers(self, content: bytes, filename: str) -> None:
+    def _check_audio_headers(self, header: bytes, file_ext: str) -> None:
         """Check for valid MP3 file headers (SDRTrunk only sends MP3)."""
-        if len(content) < 12:
+        if len(header) < 12:
             raise ValidationError("File too small to contain valid audio header")
 
-        file_ext = Path(filename).suffix.lower()
-
         # MP3 file validation (SDRTrunk standard)
         if file_ext == ".mp3":
-            # Check for ID3 tag or MP3 frame header
-            if not (
-                content.startswith(b"ID3")
-                or content.startswith(b"\xff\xfb")  # MP3 frame sync
-                or content.startswith(b"\xff\xfa")
-            ):
+            if header[:3] == b"ID3":
+                # Skip the tag and require a real frame after it. Tags extending past the
+                # prefix (e.g. embedded artwork) are accepted on their well-formed size alone.
+                frame_start = id3_tag_end(header)
+                if frame_start is None or (
+                    frame_start + 2 <= len(header) and not _is_mp3_frame_header(header, frame_start)
+                ):
+                    raise ValidationError("Invalid MP3 file header")
+            elif not _is_mp3_frame_header(header, 0):
                 raise ValidationError("Invalid MP3 file header")
         else:
             # Only MP3 files are allowed
             raise ValidationError(f"Unsupported audio format: {file_ext}. Only MP3 files are accepted.")
 
-    def _scan_malicious_content(self, content: bytes) -> None:
-        """Scan for potentially malicious content patterns."""
+    def _scan_malicious_content(self, header: bytes) -> None:
+        """Scan the start of the file for potentially malicious content patterns."""
         # For audio files, be extremely conservative - MP3 compressed data can contain
-        # ANY byte pattern naturally. Only check for executable headers at file start.
-        if len(content) < 16:
+        # ANY byte pattern naturally. Only check for executable headers at file start,
+        # which is why the file's leading bytes are all this ever sees.
+        if len(header) < 16:
             return  # Too small to contain meaningful headers
 
-        # Only check for executable file headers at the very beginning
-        # These should NEVER appear at the start of legitimate audio files
-        if content.startswith(b"\x7fELF"):
-            raise ValidationError("Executable file detected")
-        if content.startswith(b"\xca\xfe\xba\xbe"):
-            raise ValidationError("Java class file detected")
-        if content.startswith(b"%PDF"):
-            raise ValidationError("PDF file detected")
-
-        # Check for HTML/script content only in first 64 bytes (metadata area)
-        header_check = content[:64].lower()
-        if b"<script" in header_check or b"javascript:" in header_check:
-            raise ValidationError("Script content detected in file header")
+        # Executable headers at the very beginning, script content only in the
+        # first 64 bytes (metadata area)
+        match = _SIGNATURE_RE.search(header, 0, SIGNATURE_SCAN_BYTES)
+        if match and match.lastgroup:
+            raise ValidationError(_SIGNATURE_MESSAGES[match.lastgroup])
 
 
 # Global validator instance (will be configured in main app)
@@ -278,16 +370,17 @@ def get_validator() -> AudioFileValidator:
     return _global_validator
 
 
-async def validate_audio_file(file: UploadFile, client_ip: str) -> None:
+async def validate_audio_file(file: UploadFile, client_ip: str, content_length: Optional[int] = None) -> None:
     """
     Convenience function to validate an audio file upload.
 
     Args:
         file: The uploaded file to validate
         client_ip: Client IP address for rate limiting
+        content_length: Request Content-Length, the size bound used when the file has no size
 
     Raises:
         ValidationError: If validation fails
     """
     validator = get_validator()
-    await validator.validate_upload_file(file, client_ip)
+    await validator.validate_upload_file(file, client_ip, content_length)
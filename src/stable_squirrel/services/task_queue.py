@@ -7,17 +7,31 @@ upload acceptance from transcription processing, allowing unlimited concurrent u
 import asyncio
 import logging
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Awaitable, Callable, Dict, List, Optional, TypedDict, Union
-from uuid import UUID, uuid4
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, TypedDict, Union
+from uuid import uuid4
 
 from stable_squirrel.database.models import RadioCallCreate
 
 logger = logging.getLogger(__name__)
 
+# Finished tasks kept for status lookups; beyond this the oldest are forgotten
+# even if cleanup_old_tasks has not run
+MAX_FINISHED_TASKS = 10000
+
+# Task times are time.monotonic_ns() readings; adding this offset gives Unix
+# epoch nanoseconds, so they are only turned into datetimes when serialized
+_MONOTONIC_TO_EPOCH_NS = time.time_ns() - time.monotonic_ns()
+
+
+def _isoformat(monotonic_ns: int) -> str:
+    """Render a monotonic task time as a local ISO 8601 timestamp."""
+    return datetime.fromtimestamp((monotonic_ns + _MONOTONIC_TO_EPOCH_NS) / 1e9).isoformat()
+
 
 class TaskDict(TypedDict):
     """TypedDict for serialized task data."""
@@ -35,8 +49,8 @@ class TaskDict(TypedDict):
     worker_id: Optional[str]
 
 
-class QueueStats(TypedDict):
-    """TypedDict for queue statistics."""
+class QueueCounters(TypedDict):
+    """TypedDict for the running counters a queue keeps."""
 
     total_enqueued: int
     total_processed: int
@@ -44,6 +58,11 @@ class QueueStats(TypedDict):
     total_retries: int
     average_processing_time: float
     queue_full_rejections: int
+
+
+class QueueStats(QueueCounters):
+    """TypedDict for queue statistics: the counters plus a snapshot of current sizes."""
+
     queue_size: int
     retry_queue_size: int
     active_tasks: int
@@ -63,31 +82,60 @@ class TaskStatus(Enum):
     RETRYING = "retrying"
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionTask:
     """A transcription task in the queue."""
 
-    task_id: UUID = field(default_factory=uuid4)
+    # Raw UUID bytes: cheaper to hash and store as a tracking key; hex() when shown
+    task_id: bytes = field(default_factory=lambda: uuid4().bytes)
     call_data: Optional[RadioCallCreate] = None
     audio_file_path: Optional[Path] = None
-    created_at: datetime = field(default_factory=datetime.now)
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    # time.monotonic_ns() readings
+    created_at: int = field(default_factory=time.monotonic_ns)
+    started_at: Optional[int] = None
+    completed_at: Optional[int] = None
     status: TaskStatus = TaskStatus.PENDING
     retry_count: int = 0
     max_retries: int = 3
     error_message: Optional[str] = None
     worker_id: Optional[str] = None
 
+    def mark_processing(self, worker_id: str) -> int:
+        """Move to PROCESSING on ``worker_id``; returns the start time."""
+        self.status = TaskStatus.PROCESSING
+        self.worker_id = worker_id
+        self.started_at = time.monotonic_ns()
+        return self.started_at
+
+    def mark_completed(self) -> int:
+        """Move to COMPLETED; returns the completion time."""
+        self.status = TaskStatus.COMPLETED
+        self.completed_at = time.monotonic_ns()
+        return self.completed_at
+
+    def mark_attempt_failed(self, error: Exception) -> bool:
+        """Record a failed attempt; returns whether it may still be retried (and is now RETRYING)."""
+        self.error_message = str(error)
+        self.retry_count += 1
+        if self.retry_count <= self.max_retries:
+            self.status = TaskStatus.RETRYING
+            return True
+        return False
+
+    def mark_failed(self) -> None:
+        """Move to FAILED for good."""
+        self.status = TaskStatus.FAILED
+        self.completed_at = time.monotonic_ns()
+
     def to_dict(self) -> TaskDict:
         """Convert task to dictionary for serialization."""
         return {
-            "task_id": str(self.task_id),
+            "task_id": self.task_id.hex(),
             "call_data": self.call_data.model_dump() if self.call_data else None,
             "audio_file_path": str(self.audio_file_path) if self.audio_file_path else None,
-            "created_at": self.created_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": _isoformat(self.created_at),
+            "started_at": _isoformat(self.started_at) if self.started_at is not None else None,
+            "completed_at": _isoformat(self.completed_at) if self.completed_at is not None else None,
             "status": self.status.value,
             "retry_count": self.retry_count,
             "max_retries": self.max_retries,
@@ -99,30 +147,35 @@ class TranscriptionTask:
 class TranscriptionTaskQueue:
     """High-throughput task queue for transcription processing."""
 
-    def __init__(self, max_queue_size: int = 10000, num_workers: int = 4):
+    def __init__(self, max_queue_size: int = 10000, num_workers: int = 4, max_finished_tasks: int = MAX_FINISHED_TASKS):
         self.max_queue_size = max_queue_size
         self.num_workers = num_workers
+        self.max_finished_tasks = max_finished_tasks
 
-        # Core queue and workers
+        # Core queue and workers. asyncio.Queue is already a bounded deque plus waiter
+        # futures: no lock (everything runs on the event loop thread), O(1) qsize(),
+        # and put_nowait()/get_nowait() never suspend. A hand-rolled deque+Event
+        # ring would only lose the get() that workers race across both queues.
         self.task_queue: asyncio.Queue[TranscriptionTask] = asyncio.Queue(maxsize=max_queue_size)
         self.retry_queue: asyncio.Queue[TranscriptionTask] = asyncio.Queue(maxsize=max_queue_size // 2)
         self.workers: List[asyncio.Task[None]] = []
         self.running = False
 
         # Task tracking
-        self.active_tasks: Dict[UUID, TranscriptionTask] = {}
-        self.completed_tasks: Dict[UUID, TranscriptionTask] = {}
-        self.failed_tasks: Dict[UUID, TranscriptionTask] = {}
+        self.active_tasks: Dict[bytes, TranscriptionTask] = {}
+        # Finished tasks, in the order they finished (oldest first), each capped at max_finished_tasks
+        self.completed_tasks: OrderedDict[bytes, TranscriptionTask] = OrderedDict()
+        self.failed_tasks: OrderedDict[bytes, TranscriptionTask] = OrderedDict()
 
         # Statistics
-        self.stats = {
-            "total_enqueued": 0,
-            "total_processed": 0,
-            "total_failed": 0,
-            "total_retries": 0,
-            "average_processing_time": 0.0,
-            "queue_full_rejections": 0,
-        }
+        self.stats = QueueCounters(
+            total_enqueued=0,
+            total_processed=0,
+            total_failed=0,
+            total_retries=0,
+            average_processing_time=0.0,
+            queue_full_rejections=0,
+        )
 
         # Callbacks
         self.transcription_processor: Optional[Callable[[Path, RadioCallCreate], Awaitable[None]]] = None
@@ -143,10 +196,6 @@ class TranscriptionTaskQueue:
             worker_task = asyncio.create_task(self._worker(f"worker-{i+1}"), name=f"transcription-worker-{i+1}")
             self.workers.append(worker_task)
 
-        # Start retry processor
-        retry_task = asyncio.create_task(self._retry_processor(), name="retry-processor")
-        self.workers.append(retry_task)
-
         logger.info("Transcription task queue started successfully")
 
     async def stop(self) -> None:
@@ -168,12 +217,12 @@ class TranscriptionTaskQueue:
         self.workers.clear()
         logger.info("Transcription task queue stopped")
 
-    async def enqueue_task(self, call_data: RadioCallCreate, audio_file_path: Path) -> UUID:
+    async def enqueue_task(self, call_data: RadioCallCreate, audio_file_path: Path) -> bytes:
         """
         Enqueue a transcription task for background processing.
 
         Returns:
-            Task ID for tracking
+            Task ID (raw UUID bytes) for tracking
 
         Raises:
             ValueError: If queue is full
@@ -188,7 +237,7 @@ class TranscriptionTaskQueue:
             self.active_tasks[task.task_id] = task
             self.stats["total_enqueued"] += 1
 
-            logger.info(f"Enqueued transcription task {task.task_id} for call {call_data.call_id}")
+            logger.info(f"Enqueued transcription task {task.task_id.hex()} for call {call_data.call_id}")
 
             return task.task_id
 
@@ -198,7 +247,7 @@ class TranscriptionTaskQueue:
                 f"Transcription queue is full ({self.max_queue_size} tasks). " "Try again later or increase queue size."
             )
 
-    async def get_task_status(self, task_id: UUID) -> Optional[TranscriptionTask]:
+    async def get_task_status(self, task_id: bytes) -> Optional[TranscriptionTask]:
         """Get the status of a specific task."""
         # Check active tasks first
         if task_id in self.active_tasks:
@@ -217,12 +266,7 @@ class TranscriptionTaskQueue:
     def get_queue_stats(self) -> QueueStats:
         """Get current queue statistics."""
         return QueueStats(
-            total_enqueued=int(self.stats["total_enqueued"]),
-            total_processed=int(self.stats["total_processed"]),
-            total_failed=int(self.stats["total_failed"]),
-            total_retries=int(self.stats["total_retries"]),
-            average_processing_time=self.stats["average_processing_time"],
-            queue_full_rejections=int(self.stats["queue_full_rejections"]),
+            **self.stats,
             queue_size=self.task_queue.qsize(),
             retry_queue_size=self.retry_queue.qsize(),
             active_tasks=len(self.active_tasks),
@@ -238,19 +282,10 @@ class TranscriptionTaskQueue:
 
         while self.running:
             try:
-                # Get task from queue with timeout
-                try:
-                    task = await asyncio.wait_for(
-                        self.task_queue.get(), timeout=1.0  # Check running status every second
-                    )
-                except asyncio.TimeoutError:
-                    continue
-
-                # Process the task
-                await self._process_task(task, worker_id)
-
-                # Mark task as done
-                self.task_queue.task_done()
+                # Check running status every second
+                for queue, task in await self._next_tasks(timeout=1.0):
+                    await self._process_task(task, worker_id)
+                    queue.task_done()
 
             except asyncio.CancelledError:
                 logger.info(f"Worker {worker_id} cancelled")
@@ -262,43 +297,55 @@ class TranscriptionTaskQueue:
 
         logger.info(f"Transcription worker {worker_id} stopped")
 
+    async def _next_tasks(self, timeout: float) -> List[Tuple[asyncio.Queue[TranscriptionTask], TranscriptionTask]]:
+        """
+        Take the next task from whichever queue has one, preferring retries.
+
+        Workers wait on the retry and main queues together, so retried tasks are
+        picked up directly rather than being shuttled back through the main queue.
+        Returns an empty list if nothing arrived within ``timeout``.
+        """
+        for queue in (self.retry_queue, self.task_queue):
+            if not queue.empty():
+                return [(queue, queue.get_nowait())]
+
+        getters = {asyncio.ensure_future(queue.get()): queue for queue in (self.retry_queue, self.task_queue)}
+        try:
+            done, _ = await asyncio.wait(getters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # A cancelled get() leaves its item in the queue
+            for getter in getters:
+                if not getter.done():
+                    getter.cancel()
+        return [(getters[getter], getter.result()) for getter in getters if getter in done]
+
     async def _process_task(self, task: TranscriptionTask, worker_id: str) -> None:
         """Process a single transcription task."""
-        task.status = TaskStatus.PROCESSING
-        task.started_at = datetime.now()
-        task.worker_id = worker_id
-
-        start_time = time.time()
+        started_ns = task.mark_processing(worker_id)
 
         try:
-            logger.info(f"Worker {worker_id} processing task {task.task_id}")
+            logger.info(f"Worker {worker_id} processing task {task.task_id.hex()}")
 
             # Call the transcription processor
             if self.transcription_processor and task.audio_file_path and task.call_data:
                 await self.transcription_processor(task.audio_file_path, task.call_data)
 
-            # Mark as completed
-            task.status = TaskStatus.COMPLETED
-            task.completed_at = datetime.now()
+            completed_ns = task.mark_completed()
 
             # Update statistics
-            processing_time = time.time() - start_time
+            processing_time = (completed_ns - started_ns) / 1e9
             self.stats["total_processed"] += 1
+            processed = self.stats["total_processed"]
 
-            # Update average processing time
-            if self.stats["average_processing_time"] == 0:
-                self.stats["average_processing_time"] = processing_time
-            else:
-                # Moving average
-                self.stats["average_processing_time"] = (
-                    self.stats["average_processing_time"] * 0.9 + processing_time * 0.1
-                )
+            # Running mean over every processed task
+            average = self.stats["average_processing_time"]
+            self.stats["average_processing_time"] = average + (processing_time - average) / processed
 
             # Move to completed tasks
-            self.completed_tasks[task.task_id] = task
+            self._record_finished(self.completed_tasks, task)
             del self.active_tasks[task.task_id]
 
-            logger.info(f"Task {task.task_id} completed in {processing_time:.2f}s")
+            logger.info(f"Task {task.task_id.hex()} completed in {processing_time:.2f}s")
 
             # Call progress callback if set
             if self.progress_callback:
@@ -308,23 +355,19 @@ class TranscriptionTaskQueue:
                     logger.warning(f"Progress callback error: {e}")
 
         except Exception as e:
-            logger.error(f"Task {task.task_id} failed: {e}")
-
-            task.error_message = str(e)
-            task.retry_count += 1
+            logger.error(f"Task {task.task_id.hex()} failed: {e}")
 
-            if task.retry_count <= task.max_retries:
+            if task.mark_attempt_failed(e):
                 # Retry the task
-                task.status = TaskStatus.RETRYING
                 self.stats["total_retries"] += 1
 
                 try:
                     # Add to retry queue with delay
                     await asyncio.sleep(min(task.retry_count * 5, 30))  # Exponential backoff
                     self.retry_queue.put_nowait(task)
-                    logger.info(f"Task {task.task_id} queued for retry {task.retry_count}/{task.max_retries}")
+                    logger.info(f"Task {task.task_id.hex()} queued for retry {task.retry_count}/{task.max_retries}")
                 except asyncio.QueueFull:
-                    logger.error(f"Retry queue full, task {task.task_id} marked as failed")
+                    logger.error(f"Retry queue full, task {task.task_id.hex()} marked as failed")
                     self._mark_task_failed(task)
             else:
                 # Max retries exceeded
@@ -332,75 +375,44 @@ class TranscriptionTaskQueue:
 
     def _mark_task_failed(self, task: TranscriptionTask) -> None:
         """Mark a task as permanently failed."""
-        task.status = TaskStatus.FAILED
-        task.completed_at = datetime.now()
+        task.mark_failed()
 
         self.stats["total_failed"] += 1
 
         # Move to failed tasks
-        self.failed_tasks[task.task_id] = task
+        self._record_finished(self.failed_tasks, task)
         if task.task_id in self.active_tasks:
             del self.active_tasks[task.task_id]
 
-        logger.error(f"Task {task.task_id} permanently failed after {task.retry_count} retries")
-
-    async def _retry_processor(self) -> None:
-        """Process retry queue."""
-        logger.info("Retry processor started")
-
-        while self.running:
-            try:
-                # Get task from retry queue
-                try:
-                    task = await asyncio.wait_for(self.retry_queue.get(), timeout=1.0)
-                except asyncio.TimeoutError:
-                    continue
-
-                # Put back in main queue
-                try:
-                    await self.task_queue.put(task)
-                    self.retry_queue.task_done()
-                except asyncio.QueueFull:
-                    # Main queue is full, put back in retry queue
-                    await asyncio.sleep(5)
-                    try:
-                        self.retry_queue.put_nowait(task)
-                    except asyncio.QueueFull:
-                        self._mark_task_failed(task)
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Retry processor error: {e}")
-
-        logger.info("Retry processor stopped")
+        logger.error(f"Task {task.task_id.hex()} permanently failed after {task.retry_count} retries")
 
     async def cleanup_old_tasks(self, max_age_hours: int = 24) -> None:
         """Clean up old completed and failed tasks to prevent memory leaks."""
-        cutoff_time = datetime.now().timestamp() - (max_age_hours * 3600)
-
-        # Clean completed tasks
-        old_completed = [
-            task_id
-            for task_id, task in self.completed_tasks.items()
-            if task.completed_at and task.completed_at.timestamp() < cutoff_time
-        ]
-
-        for task_id in old_completed:
-            del self.completed_tasks[task_id]
+        cutoff = time.monotonic_ns() - max_age_hours * 3600 * 1_000_000_000
 
-        # Clean failed tasks
-        old_failed = [
-            task_id
-            for task_id, task in self.failed_tasks.items()
-            if task.completed_at and task.completed_at.timestamp() < cutoff_time
-        ]
-
-        for task_id in old_failed:
-            del self.failed_tasks[task_id]
+        old_completed = self._expire_finished(self.completed_tasks, cutoff)
+        old_failed = self._expire_finished(self.failed_tasks, cutoff)
 
         if old_completed or old_failed:
-            logger.info(f"Cleaned up {len(old_completed)} completed and {len(old_failed)} failed tasks")
+            logger.info(f"Cleaned up {old_completed} completed and {old_failed} failed tasks")
+
+    def _record_finished(self, tasks: OrderedDict[bytes, TranscriptionTask], task: TranscriptionTask) -> None:
+        """Track a finished task, evicting the oldest once the map is at capacity."""
+        tasks[task.task_id] = task
+        while len(tasks) > self.max_finished_tasks:
+            tasks.popitem(last=False)
+
+    @staticmethod
+    def _expire_finished(tasks: OrderedDict[bytes, TranscriptionTask], cutoff: int) -> int:
+        """Pop tasks that finished before ``cutoff``; they are oldest first, so only expired ones are visited."""
+        expired = 0
+        while tasks:
+            oldest = next(iter(tasks.values()))
+            if oldest.completed_at is None or oldest.completed_at >= cutoff:
+                break
+            tasks.popitem(last=False)
+            expired += 1
+        return expired
 
 
 # Global task queue instance
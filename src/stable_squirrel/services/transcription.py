@@ -1,10 +1,12 @@
 """Transcription service using WhisperX."""
 
+import asyncio
+import gc
 import logging
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, TypedDict
 
 import whisperx
 
@@ -15,6 +17,7 @@ from stable_squirrel.database.models import (
     TranscriptionCreate,
 )
 from stable_squirrel.database.operations import DatabaseOperations
+from stable_squirrel.utils.audio_duration import audio_header_duration
 
 if TYPE_CHECKING:
     from stable_squirrel.database import DatabaseManager
@@ -27,6 +30,15 @@ AlignModel = Any  # whisperx.load_align_model() return type
 DiarizeModel = Any  # whisperx.DiarizationPipeline type
 WhisperResult = Dict[str, Any]  # WhisperX transcription result
 
+# CTranslate2 compute types used for compute_type "auto": int8 weights halve
+# model memory and bandwidth, with float16 activations where the GPU has them
+AUTO_COMPUTE_TYPES = {"cuda": "int8_float16", "cpu": "int8"}
+
+# Silent clip run through the models right after loading, so kernel selection
+# and allocator growth happen at startup instead of on the first real call
+WARMUP_SECONDS = 15
+SAMPLE_RATE = 16000  # whisperx.load_audio() resamples to 16 kHz mono
+
 
 class AudioMetadata(TypedDict):
     """Audio file metadata."""
@@ -48,6 +60,12 @@ class TranscriptionService:
         self._diarize_model: Optional[DiarizeModel] = None
         self._align_model: Optional[AlignModel] = None
         self._metadata: Optional[Dict[str, Any]] = None  # Language metadata from align model
+        self._device: Optional[str] = None
+        # Each pipeline stage runs one call at a time, sharing its model across every
+        # queue worker; one call's alignment overlaps the next call's transcription,
+        # and audio decoding and database writes overlap with both
+        self._transcribe_lock = asyncio.Lock()
+        self._align_lock = asyncio.Lock()
         self._running = False
 
     async def start(self) -> None:
@@ -58,8 +76,9 @@ class TranscriptionService:
         self._running = True
         logger.info("Starting transcription service...")
 
-        # Load WhisperX model
-        await self._load_model()
+        # Load WhisperX model (unless preload_model() already did)
+        if self._model is None:
+            await self._load_model()
 
         # Initialize and start task queue for background processing
         try:
@@ -95,8 +114,17 @@ class TranscriptionService:
         # Cleanup model
         self._model = None
 
+    async def preload_model(self) -> None:
+        """Load the WhisperX models ahead of start(), e.g. while other startup work is in flight."""
+        if self._model is None:
+            await self._load_model()
+
     async def _load_model(self) -> None:
-        """Load the WhisperX model and supporting models."""
+        """Load the WhisperX model and supporting models without blocking the event loop."""
+        await asyncio.to_thread(self._load_model_sync)
+
+    def _load_model_sync(self) -> None:
+        """Load the WhisperX model and supporting models (blocking; runs in a worker thread)."""
         try:
             logger.info(f"Loading WhisperX model: {self.config.model_name}")
 
@@ -106,12 +134,16 @@ class TranscriptionService:
                 import torch
 
                 device = "cuda" if torch.cuda.is_available() else "cpu"
+            self._device = device
 
-            # Load main transcription model
-            self._model = whisperx.load_model(
-                self.config.model_name, device=device, compute_type="float16" if device == "cuda" else "int8"
-            )
-            logger.info(f"Loaded WhisperX model '{self.config.model_name}' on {device}")
+            compute_type = self.config.compute_type
+            if compute_type == "auto":
+                compute_type = AUTO_COMPUTE_TYPES.get(device, "int8")
+
+            # Load main transcription model; WhisperX runs it on faster-whisper's
+            # CTranslate2 backend with batched inference
+            self._model = whisperx.load_model(self.config.model_name, device=device, compute_type=compute_type)
+            logger.info(f"Loaded WhisperX model '{self.config.model_name}' on {device} ({compute_type})")
 
             # Load alignment model if available
             try:
@@ -143,11 +175,29 @@ class TranscriptionService:
                     self._diarize_model = None
 
             logger.info("WhisperX models loaded successfully")
+            self._warm_up_sync()
 
         except Exception as e:
             logger.error(f"Failed to load WhisperX models: {e}")
             raise
 
+    def _warm_up_sync(self) -> None:
+        """Run a silent clip through transcription and alignment; failures only cost the speedup."""
+        assert self._model is not None  # Only called once the model has loaded
+        try:
+            import numpy as np
+
+            start_time = time.perf_counter()
+            silence = np.zeros(SAMPLE_RATE * WARMUP_SECONDS, dtype=np.float32)
+            self._model.transcribe(silence, batch_size=self.config.batch_size, language=self.config.language or "en")
+            if self._align_model and self._metadata:
+                stub = [{"start": 0.0, "end": float(WARMUP_SECONDS), "text": "warm up"}]
+                whisperx.align(stub, self._align_model, self._metadata, silence, device=self._model.device)
+            self._release_gpu_memory()
+            logger.info(f"Warmed up transcription models in {time.perf_counter() - start_time:.1f}s")
+        except Exception as e:
+            logger.warning(f"Model warmup failed, first transcription may be slower: {e}")
+
     async def transcribe_file(self, file_path: Path) -> WhisperResult:
         """Transcribe an audio file using WhisperX."""
         if not self._running or not self._model:
@@ -160,28 +210,7 @@ class TranscriptionService:
             # Extract audio file metadata first
             audio_info = await self._extract_audio_metadata(file_path)
 
-            # Load and transcribe audio
-            audio = whisperx.load_audio(str(file_path))
-
-            # Initial transcription
-            result = self._model.transcribe(audio, batch_size=self.config.batch_size, language=self.config.language)
-
-            # Get detected language
-            detected_language = result.get("language", "en")
-            logger.info(f"Detected language: {detected_language}")
-
-            # Align transcription for precise timestamps
-            if self._align_model and self._metadata:
-                result = whisperx.align(
-                    result["segments"], self._align_model, self._metadata, audio, device=self._model.device
-                )
-
-            # Perform speaker diarization if enabled
-            diarize_segments = None
-            if self.config.enable_diarization and self._diarize_model:
-                diarize_segments = self._diarize_model(audio)
-                # Assign speaker labels to segments
-                result = whisperx.assign_word_speakers(diarize_segments, result)
+            result, detected_language = await self._run_pipeline(file_path)
 
             # Process results into our format
             processing_time = time.time() - start_time
@@ -204,15 +233,67 @@ class TranscriptionService:
             logger.error(f"Error transcribing file {file_path}: {e}")
             raise
 
+    async def _run_pipeline(self, file_path: Path) -> Tuple[WhisperResult, str]:
+        """Decode the audio, then pass it through the transcription and alignment stages in turn."""
+        audio = await asyncio.to_thread(whisperx.load_audio, str(file_path))
+        async with self._transcribe_lock:
+            result, detected_language = await asyncio.to_thread(self._transcribe_sync, audio)
+        async with self._align_lock:
+            result = await asyncio.to_thread(self._align_sync, audio, result)
+        return result, detected_language
+
+    def _transcribe_sync(self, audio: Any) -> Tuple[WhisperResult, str]:
+        """Run the Whisper pass over decoded audio (blocking; runs in a worker thread)."""
+        assert self._model is not None  # Callers check the service is ready
+        result = self._model.transcribe(audio, batch_size=self.config.batch_size, language=self.config.language)
+
+        # Get detected language
+        detected_language = result.get("language", "en")
+        logger.info(f"Detected language: {detected_language}")
+
+        # Hand the transcription pass's cached GPU memory back before the next model runs
+        self._release_gpu_memory()
+        return result, detected_language
+
+    def _align_sync(self, audio: Any, result: WhisperResult) -> WhisperResult:
+        """Align and diarize a transcription (blocking; runs in a worker thread)."""
+        assert self._model is not None  # Callers check the service is ready
+
+        # Align transcription for precise timestamps
+        if self._align_model and self._metadata:
+            result = whisperx.align(
+                result["segments"], self._align_model, self._metadata, audio, device=self._model.device
+            )
+            self._release_gpu_memory()
+
+        # Perform speaker diarization if enabled
+        if self.config.enable_diarization and self._diarize_model:
+            diarize_segments = self._diarize_model(audio)
+            # Assign speaker labels to segments
+            result = whisperx.assign_word_speakers(diarize_segments, result)
+
+        return result
+
+    def _release_gpu_memory(self) -> None:
+        """Free intermediate tensors and return PyTorch's cached CUDA blocks to the driver."""
+        if self._device != "cuda":
+            return
+
+        import torch
+
+        gc.collect()
+        torch.cuda.empty_cache()
+
     async def _extract_audio_metadata(self, file_path: Path) -> AudioMetadata:
         """Extract metadata from audio file."""
         try:
-            # Use librosa or similar to get audio info
-            # For now, basic file info
-            import librosa
+            # MP3/WAV headers usually give the duration from their first few KB
+            duration = await asyncio.to_thread(audio_header_duration, file_path)
+            if duration is None:
+                import librosa
 
-            # Get duration without loading full audio
-            duration = librosa.get_duration(path=str(file_path))
+                # Get duration without loading full audio
+                duration = float(await asyncio.to_thread(librosa.get_duration, path=str(file_path)))
 
             return {
                 "duration": duration,
@@ -329,32 +410,7 @@ class TranscriptionService:
             # Update radio call with actual duration
             radio_call.audio_duration_seconds = audio_info.get("duration", 0.0)
 
-            # Load and transcribe audio
-            audio = whisperx.load_audio(str(file_path))
-
-            # Initial transcription
-            result = self._model.transcribe(audio, batch_size=self.config.batch_size, language=self.config.language)
-
-            # Get detected language
-            detected_language = result.get("language", "en")
-            logger.info(f"Detected language: {detected_language}")
-
-            # Align transcription for precise timestamps
-            if self._align_model and self._metadata:
-                result = whisperx.align(
-                    result["segments"],
-                    self._align_model,
-                    self._metadata,
-                    audio,
-                    device=self._model.device,
-                )
-
-            # Perform speaker diarization if enabled
-            diarize_segments = None
-            if self.config.enable_diarization and self._diarize_model:
-                diarize_segments = self._diarize_model(audio)
-                # Assign speaker labels to segments
-                result = whisperx.assign_word_speakers(diarize_segments, result)
+            result, detected_language = await self._run_pipeline(file_path)
 
             # Process results into our format
             processing_time = time.time() - start_time
@@ -0,0 +1,146 @@
+"""
+Audio duration from file headers.
+
+Reads only the first few kilobytes of an MP3 or WAV file instead of decoding
+it: an MP3's Xing/Info or VBRI tag carries the exact frame count (otherwise a
+constant bitrate is assumed), and a WAV's ``fmt `` and ``data`` chunks give its
+byte rate and length. Anything unrecognized yields ``None`` so callers can fall
+back to a full decoder.
+"""
+
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+HEADER_READ_BYTES = 4096
+
+ID3_HEADER_SIZE = 10
+ID3_FOOTER_PRESENT = 0x10
+
+# MPEG version field -> (bitrates in kbps for Layer III, sample rates in Hz, samples per frame)
+_MPEG1 = (
+    (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (44100, 48000, 32000),
+    1152,
+)
+_MPEG2_BITRATES = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+_MPEG_VERSIONS = {
+    0b11: _MPEG1,
+    0b10: (_MPEG2_BITRATES, (22050, 24000, 16000), 576),  # MPEG-2
+    0b00: (_MPEG2_BITRATES, (11025, 12000, 8000), 576),  # MPEG-2.5
+}
+LAYER_III = 0b01
+CHANNEL_MODE_MONO = 0b11
+
+XING_FRAMES_PRESENT = 0x1
+VBRI_OFFSET = 36  # From the frame start, right after a 32-byte side info block
+WAV_UNKNOWN_DATA_SIZES = (0, 0xFFFFFFFF)  # Left by streaming writers that never patch the header
+
+
+def audio_header_duration(path: Path) -> Optional[float]:
+    """Duration in seconds read from an MP3 or WAV header, or None if it can't be determined cheaply."""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(HEADER_READ_BYTES)
+            if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+                return _wav_duration(header, path.stat().st_size)
+            return _mp3_duration(f, header, path.stat().st_size)
+    except OSError:
+        return None
+
+
+def _wav_duration(header: bytes, file_size: int) -> Optional[float]:
+    """Duration from the ``fmt `` byte rate and ``data`` chunk size of a RIFF/WAVE header."""
+    byte_rate = None
+    offset = 12
+    while offset + 8 <= len(header):
+        chunk_id = header[offset : offset + 4]
+        chunk_size = int.from_bytes(header[offset + 4 : offset + 8], "little")
+        if chunk_id == b"fmt " and offset + 20 <= len(header):
+            byte_rate = int.from_bytes(header[offset + 16 : offset + 20], "little")
+        elif chunk_id == b"data":
+            if not byte_rate or chunk_size in WAV_UNKNOWN_DATA_SIZES:
+                return None
+            # A truncated file holds less audio than its header claims
+            return min(chunk_size, file_size - offset - 8) / byte_rate
+        # Chunks are padded to an even length
+        offset += 8 + chunk_size + (chunk_size & 1)
+    return None
+
+
+def _mp3_duration(f: BinaryIO, header: bytes, file_size: int) -> Optional[float]:
+    """Duration from the first frame of an MP3, using its VBR tag when present."""
+    audio_start = 0
+    if header[:3] == b"ID3":
+        tag_end = id3_tag_end(header)
+        if tag_end is None:
+            return None
+        audio_start = tag_end
+        if audio_start + 4 > len(header):
+            # Large tags (cover art) end past the first read
+            f.seek(audio_start)
+            header = f.read(HEADER_READ_BYTES)
+        else:
+            header = header[audio_start:]
+
+    frame_offset = header.find(b"\xff")
+    while frame_offset != -1:
+        frame = _decode_frame_header(header, frame_offset)
+        if frame is not None:
+            break
+        frame_offset = header.find(b"\xff", frame_offset + 1)
+    else:
+        return None
+
+    bitrate, sample_rate, samples_per_frame, side_info_size = frame
+    frame_count = _vbr_frame_count(header, frame_offset, side_info_size)
+    if frame_count:
+        return frame_count * samples_per_frame / sample_rate
+
+    # No VBR tag: assume a constant bitrate over the rest of the file
+    return (file_size - audio_start - frame_offset) * 8 / (bitrate * 1000)
+
+
+def id3_tag_end(header: bytes) -> Optional[int]:
+    """Offset just past the ID3v2 tag at the start of ``header``, or None if its size is malformed."""
+    size_bytes = header[6:10]
+    if len(size_bytes) < 4 or any(byte & 0x80 for byte in size_bytes):
+        return None
+    # Synchsafe integer: 7 significant bits per byte
+    tag_size = (size_bytes[0] << 21) | (size_bytes[1] << 14) | (size_bytes[2] << 7) | size_bytes[3]
+    footer = ID3_HEADER_SIZE if header[5] & ID3_FOOTER_PRESENT else 0
+    return ID3_HEADER_SIZE + tag_size + footer
+
+
+def _decode_frame_header(data: bytes, offset: int) -> Optional[tuple[int, int, int, int]]:
+    """(bitrate kbps, sample rate, samples per frame, side info size) of a Layer III frame header at ``offset``."""
+    if offset + 4 > len(data):
+        return None
+    b1, b2, b3 = data[offset + 1], data[offset + 2], data[offset + 3]
+    if b1 & 0xE0 != 0xE0 or (b1 >> 1) & 0b11 != LAYER_III:
+        return None
+
+    version = _MPEG_VERSIONS.get((b1 >> 3) & 0b11)
+    bitrate_index, sample_rate_index = b2 >> 4, (b2 >> 2) & 0b11
+    if version is None or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    bitrates, sample_rates, samples_per_frame = version
+    mono = b3 >> 6 == CHANNEL_MODE_MONO
+    if version is _MPEG1:
+        side_info_size = 17 if mono else 32
+    else:
+        side_info_size = 9 if mono else 17
+    return bitrates[bitrate_index], sample_rates[sample_rate_index], samples_per_frame, side_info_size
+
+
+def _vbr_frame_count(data: bytes, frame_offset: int, side_info_size: int) -> Optional[int]:
+    """Frame count from a Xing/Info or VBRI tag in the first frame, if it has one."""
+    xing = frame_offset + 4 + side_info_size
+    if data[xing : xing + 4] in (b"Xing", b"Info") and len(data) >= xing + 12:
+        flags = int.from_bytes(data[xing + 4 : xing + 8], "big")
+        return int.from_bytes(data[xing + 8 : xing + 12], "big") if flags & XING_FRAMES_PRESENT else None
+
+    vbri = frame_offset + VBRI_OFFSET
+    if data[vbri : vbri + 4] == b"VBRI" and len(data) >= vbri + 18:
+        return int.from_bytes(data[vbri + 14 : vbri + 18], "big")
+    return None
@@ -5,23 +5,51 @@ This module provides stream-based file processing to minimize memory usage
 and prevent blocking the event loop during large file operations.
 """
 
+import asyncio
+import errno
 import logging
 import os
-import tempfile
+import shutil
+import time
 from pathlib import Path
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Optional, cast
 
 import aiofiles
 import aiofiles.os
+import aiofiles.tempfile
 
 logger = logging.getLogger(__name__)
 
+# copy_file_range() errors meaning the kernel can't copy between these two files;
+# shutil.copyfile() then uses sendfile()/fcopyfile() or a buffered loop instead
+_NO_KERNEL_COPY_ERRNOS = frozenset((errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL))
+
+
+def _copy_file_sync(source: Path, dest: Path) -> None:
+    """Copy ``source`` to ``dest`` inside the kernel where possible (blocking)."""
+    if hasattr(os, "copy_file_range"):
+        with open(source, "rb") as src, open(dest, "wb") as dst:
+            try:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                return
+            except OSError as e:
+                if e.errno not in _NO_KERNEL_COPY_ERRNOS:
+                    raise
+
+    shutil.copyfile(source, dest)
+
 
 class AsyncFileManager:
     """Manages async file operations with automatic cleanup."""
 
     def __init__(self) -> None:
-        self._temp_files: set[Path] = set()
+        # Tracked temp files and their creation time (monotonic), oldest first
+        self._temp_files: dict[Path, float] = {}
 
     async def save_upload_stream(
         self, content_stream: AsyncIterator[bytes], filename: str, max_size: int = 100 * 1024 * 1024  # 100MB default
@@ -40,21 +68,17 @@ class AsyncFileManager:
         Raises:
             ValueError: If file is too large
         """
-        # Create temp file
         suffix = Path(filename).suffix or ".tmp"
-        temp_fd, temp_path_str = tempfile.mkstemp(suffix=suffix, prefix="stream_")
-        temp_path = Path(temp_path_str)
-
-        # Close the file descriptor since we'll use aiofiles
-        os.close(temp_fd)
-
-        # Track temp file for cleanup
-        self._temp_files.add(temp_path)
+        temp_path: Optional[Path] = None
 
         try:
             total_size = 0
 
-            async with aiofiles.open(temp_path, "wb") as f:
+            async with aiofiles.tempfile.NamedTemporaryFile("wb", suffix=suffix, prefix="stream_", delete=False) as f:
+                # Track temp file for cleanup
+                temp_path = Path(cast(str, f.name))  # Named temp files always have a str path
+                self._temp_files[temp_path] = time.monotonic()
+
                 async for chunk in content_stream:
                     total_size += len(chunk)
 
@@ -68,25 +92,22 @@ class AsyncFileManager:
 
         except Exception:
             # Clean up on error
-            await self.cleanup_file(temp_path)
+            if temp_path is not None:
+                await self.cleanup_file(temp_path)
             raise
 
-    async def copy_file_async(self, source: Path, dest: Path, chunk_size: int = 64 * 1024) -> None:
+    async def copy_file_async(self, source: Path, dest: Path) -> None:
         """
-        Copy a file asynchronously in chunks.
+        Copy a file asynchronously without passing its data through Python.
+
+        Uses copy_file_range() where the kernel supports it for these files,
+        otherwise shutil.copyfile() (sendfile() on Linux, fcopyfile() on macOS).
 
         Args:
             source: Source file path
             dest: Destination file path
-            chunk_size: Size of chunks to read/write
         """
-        async with aiofiles.open(source, "rb") as src:
-            async with aiofiles.open(dest, "wb") as dst:
-                while True:
-                    chunk = await src.read(chunk_size)
-                    if not chunk:
-                        break
-                    await dst.write(chunk)
+        await asyncio.to_thread(_copy_file_sync, source, dest)
 
     async def read_file_chunks(self, file_path: Path, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
         """
@@ -127,27 +148,37 @@ class AsyncFileManager:
             True if file was deleted, False otherwise
         """
         try:
-            if await self.file_exists(file_path):
+            try:
                 await aiofiles.os.unlink(file_path)
                 logger.debug(f"Cleaned up temp file: {file_path}")
+            except FileNotFoundError:
+                pass
 
-            self._temp_files.discard(file_path)
+            self._temp_files.pop(file_path, None)
             return True
 
         except Exception as e:
             logger.warning(f"Failed to cleanup file {file_path}: {e}")
             return False
 
-    async def cleanup_all(self) -> int:
+    async def cleanup_all(self, max_age_seconds: Optional[float] = None) -> int:
         """
-        Clean up all tracked temporary files.
+        Clean up tracked temporary files, oldest first.
+
+        Args:
+            max_age_seconds: Only clean up files tracked for longer than this;
+                all of them if None
 
         Returns:
             Number of files cleaned up
         """
         cleaned_count = 0
+        cutoff = None if max_age_seconds is None else time.monotonic() - max_age_seconds
 
-        for file_path in list(self._temp_files):
+        for file_path, created_at in list(self._temp_files.items()):
+            if cutoff is not None and created_at > cutoff:
+                # Tracked in creation order, so every remaining file is newer
+                break
             if await self.cleanup_file(file_path):
                 cleaned_count += 1
 
@@ -178,16 +209,10 @@ class StreamingUploadProcessor:
         # For now, save directly since we already have the content
         # In a real streaming scenario, this would process chunks
         suffix = Path(filename).suffix or ".mp3"
-        temp_fd, temp_path_str = tempfile.mkstemp(suffix=suffix, prefix="upload_")
-        temp_path = Path(temp_path_str)
-
-        # Close the file descriptor and use aiofiles
-        os.close(temp_fd)
-
-        async with aiofiles.open(temp_path, "wb") as f:
+        async with aiofiles.tempfile.NamedTemporaryFile("wb", suffix=suffix, prefix="upload_", delete=False) as f:
             await f.write(audio_content)
 
-        return temp_path
+        return Path(cast(str, f.name))  # Named temp files always have a str path
 
     async def validate_audio_stream(self, file_path: Path, allowed_formats: set[str] = {".mp3"}) -> bool:
         """
@@ -30,6 +30,8 @@ def create_app(
     db_manager: "DatabaseManager",
 ) -> FastAPI:
     """Create and configure the FastAPI application."""
+    # No default_response_class on purpose: routes declare response models, so FastAPI serializes
+    # them straight to JSON bytes in pydantic-core. A custom response class disables that path.
     app = FastAPI(
         title="Stable Squirrel",
         description="SDR Audio Transcription and Search System",
@@ -1,6 +1,6 @@
 """Main API endpoints."""
 
-from typing import TypedDict, Union
+from typing import Literal, TypedDict, Union
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, Request
@@ -72,13 +72,17 @@ async def list_transcriptions(
         # For now, use the length of results as total (would need separate count query for exact total)
         total_count = len(radio_calls) + offset
 
+        # Fetch the transcriptions and speaker segments of completed calls, one round-trip each
+        completed = [call.call_id for call in radio_calls if call.transcription_status == "completed"]
+        transcriptions = await db_ops.transcriptions.get_transcriptions(completed)
+        segments = await db_ops.speaker_segments.get_speaker_segments_for_calls(completed)
+
         # Convert to response format
         responses = []
         for call in radio_calls:
-            # Get transcription if available
-            transcription = None
-            if call.transcription_status == "completed":
-                transcription = await db_ops.transcriptions.get_transcription(call.call_id)
+            transcription = transcriptions.get(call.call_id)
+            # Speakers in order of first appearance
+            speakers = list(dict.fromkeys(segment.speaker_id for segment in segments.get(call.call_id, [])))
 
             response = TranscriptionResponse(
                 id=str(call.call_id),
@@ -86,7 +90,7 @@ async def list_transcriptions(
                 transcript=transcription.full_transcript if transcription else "",
                 timestamp=call.timestamp.isoformat(),
                 duration=call.audio_duration_seconds or 0.0,
-                speakers=[],  # TODO: Get speaker list from segments
+                speakers=speakers,
             )
             responses.append(response)
 
@@ -109,6 +113,9 @@ async def search_transcriptions(
     offset: int = Query(0, ge=0),
     frequency: int = Query(None, description="Filter by frequency"),
     talkgroup_id: int = Query(None, description="Filter by talkgroup ID"),
+    projection: Literal["full", "list"] = Query(
+        "full", description="'list' returns a highlighted snippet instead of the full transcript"
+    ),
 ) -> PaginatedSearchResponse:
     """Search transcriptions by text using full-text search."""
     try:
@@ -123,6 +130,7 @@ async def search_transcriptions(
             offset=offset,
             frequency=frequency,
             talkgroup_id=talkgroup_id,
+            projection=projection,
         )
 
         # Perform search
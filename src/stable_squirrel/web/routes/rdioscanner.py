@@ -1,10 +1,12 @@
 """RdioScanner API endpoint for receiving calls from SDRTrunk."""
 
+import asyncio
 import logging
+import shutil
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, BinaryIO, Optional, Union
 
 from fastapi import APIRouter, HTTPException, Request, Response, UploadFile
 from fastapi.responses import JSONResponse
@@ -44,6 +46,38 @@ class SimpleUploadFile:
 # Type alias for form data fields
 FormFieldValue = Union[str, SimpleUploadFile]
 
+# Form values that carry a file rather than text
+FILE_FIELD_TYPES = (SimpleUploadFile, UploadFile)
+
+
+def _copy_to_temp_file(source: BinaryIO, suffix: str) -> Path:
+    """Copy a file object into a new temporary file in chunks, returning its path."""
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as temp_file:
+        shutil.copyfileobj(source, temp_file)
+    return Path(temp_file.name)
+
+
+async def write_audio_to_temp_file(audio: Union[SimpleUploadFile, UploadFile], suffix: str) -> Path:
+    """
+    Persist uploaded audio to a temporary file for transcription.
+
+    Spooled ``UploadFile``s are copied file-to-file off the event loop rather
+    than read into memory first; in-memory uploads are written as they are.
+    """
+    if isinstance(audio, UploadFile):
+        if audio.size == 0:
+            raise HTTPException(status_code=400, detail="Empty audio file")
+        await audio.seek(0)
+        return await asyncio.to_thread(_copy_to_temp_file, audio.file, suffix)
+
+    audio_content = await audio.read()
+    if not audio_content:
+        raise HTTPException(status_code=400, detail="Empty audio file")
+
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as temp_file:
+        temp_file.write(audio_content)
+    return Path(temp_file.name)
+
 
 def parse_multipart_manually(content_type: str, body: bytes) -> dict[str, FormFieldValue]:
     """
@@ -314,11 +348,14 @@ async def perform_file_security_validation(
             # Create a mock UploadFile for validation
             from io import BytesIO
 
-            upload_file = UploadFile(filename=audio.filename, file=BytesIO(audio.content))
+            upload_file = UploadFile(filename=audio.filename, file=BytesIO(audio.content), size=audio.size)
             upload_file.content_type = audio.content_type or "application/octet-stream"
             await validate_audio_file(upload_file, client_ip)
         else:
-            await validate_audio_file(audio, client_ip)
+            content_length = request.headers.get("content-length")
+            await validate_audio_file(
+                audio, client_ip, int(content_length) if content_length and content_length.isdigit() else None
+            )
 
         # Log successful validation
         if config.ingestion.track_upload_sources:
@@ -414,7 +451,7 @@ def create_upload_data_model(
     # Ensure we have a valid filename
     if audioName:
         filename = audioName
-    elif audio and hasattr(audio, "filename"):
+    elif audio and getattr(audio, "filename", None):
         filename = audio.filename
     else:
         filename = "unknown.mp3"
@@ -478,20 +515,9 @@ async def upload_call(request: Request) -> Response:
         # Use FastAPI's built-in form parsing (Hypercorn handles HTTP/2 properly)
         form_data: dict[str, Any]
         try:
-            from fastapi import UploadFile
-
             fastapi_form = await request.form()
-            # Convert FastAPI form to our expected format
-            form_data = {}
-            for key, value in fastapi_form.items():
-                if isinstance(value, UploadFile):
-                    # Convert UploadFile to SimpleUploadFile
-                    content = await value.read()
-                    form_data[key] = SimpleUploadFile(
-                        filename=value.filename or "unknown", content_type=value.content_type, content=content
-                    )
-                else:
-                    form_data[key] = value
+            # Uploaded files stay as spooled UploadFiles; they are streamed to disk once validated
+            form_data = dict(fastapi_form.items())
             logger.debug(f"FastAPI form parsing successful: {len(form_data)} fields")
         except Exception as e:
             logger.warning(f"FastAPI form parsing failed, trying manual parsing: {e}")
@@ -501,11 +527,11 @@ async def upload_call(request: Request) -> Response:
 
         # Extract core fields
         key_raw = form_data.get("key")
-        key = str(key_raw) if key_raw and not isinstance(key_raw, SimpleUploadFile) else ""
+        key = str(key_raw) if key_raw and not isinstance(key_raw, FILE_FIELD_TYPES) else ""
         system_raw = form_data.get("system")
-        system = str(system_raw) if system_raw and not isinstance(system_raw, SimpleUploadFile) else None
+        system = str(system_raw) if system_raw and not isinstance(system_raw, FILE_FIELD_TYPES) else None
         test_str_raw = form_data.get("test")
-        test_str = str(test_str_raw) if test_str_raw and not isinstance(test_str_raw, SimpleUploadFile) else None
+        test_str = str(test_str_raw) if test_str_raw and not isinstance(test_str_raw, FILE_FIELD_TYPES) else None
         test = int(test_str) if test_str else None
         audio_raw = form_data.get("audio")
         # Ensure audio is actually a file upload, not a string
@@ -591,16 +617,8 @@ async def upload_call(request: Request) -> Response:
 
         # Process audio file if provided
         if audio and hasattr(audio, "read"):
-            audio_content = await audio.read()
-            if not audio_content:
-                raise HTTPException(status_code=400, detail="Empty audio file")
-
             # Create temporary file for processing
-            with tempfile.NamedTemporaryFile(
-                suffix=Path(upload_data.audio_filename).suffix or ".wav", delete=False
-            ) as temp_file:
-                temp_file.write(audio_content)
-                temp_file_path = Path(temp_file.name)
+            temp_file_path = await write_audio_to_temp_file(audio, Path(upload_data.audio_filename).suffix or ".wav")
 
             # Process with transcription service
             transcription_service = request.app.state.transcription_service
@@ -685,7 +703,8 @@ async def process_rdioscanner_call(
             task_id = await task_queue.enqueue_task(radio_call, audio_file_path)
 
             logger.info(
-                f"RdioScanner call queued for transcription: {upload_data.audio_filename} " f"(Task ID: {task_id})"
+                f"RdioScanner call queued for transcription: {upload_data.audio_filename} "
+                f"(Task ID: {task_id.hex()})"
             )
 
         except ValueError as e:
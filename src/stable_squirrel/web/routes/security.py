@@ -1,5 +1,6 @@
 """Security monitoring and analysis API endpoints."""
 
+import json
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -7,6 +8,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel
 
+from stable_squirrel.database.models import SecurityEvent
 from stable_squirrel.database.operations import DatabaseOperations
 
 logger = logging.getLogger(__name__)
@@ -71,9 +73,21 @@ async def get_security_events(
     source_system: Optional[str] = Query(None, description="Filter by source system"),
     start_time: Optional[datetime] = Query(None, description="Filter events after this time"),
     end_time: Optional[datetime] = Query(None, description="Filter events before this time"),
+    metadata: Optional[str] = Query(
+        None, description='Only events whose metadata contains this JSON object, e.g. {"limit_type": "per_minute"}'
+    ),
 ) -> SecurityEventsResponse:
     """Get security events with filtering and pagination."""
 
+    metadata_contains = None
+    if metadata:
+        try:
+            metadata_contains = json.loads(metadata)
+        except ValueError:
+            metadata_contains = None
+        if not isinstance(metadata_contains, dict):
+            raise HTTPException(status_code=400, detail="metadata must be a JSON object")
+
     try:
         # Get database operations from app state
         db_manager = request.app.state.db_manager
@@ -89,6 +103,7 @@ async def get_security_events(
             source_system=source_system,
             start_time=start_time,
             end_time=end_time,
+            metadata_contains=metadata_contains,
         )
 
         # Convert to response format
@@ -141,7 +156,7 @@ async def get_upload_source_analysis(
         analysis = await db_ops.security_events.get_upload_source_analysis(system_id)
 
         # Convert recent events to response format
-        recent_events = []
+        recent_events: List[SecurityEventResponse] = []
         for event in analysis.get("recent_events", []):
             event_response = SecurityEventResponse(
                 event_id=str(event.event_id),
@@ -190,21 +205,26 @@ async def get_security_summary(
         end_time = datetime.now()
         start_time = end_time - timedelta(hours=hours)
 
-        # Get all events in the time range
-        all_events = await db_ops.security_events.get_security_events(
+        # Stream events in the time range and aggregate in a single pass, so the
+        # summary never holds the whole window in memory
+        total_events = 0
+        events_by_severity: Dict[str, int] = {}
+        recent_events: List[SecurityEvent] = []
+        system_counts: Dict[str, int] = {}
+        ip_counts: Dict[str, int] = {}
+        async for event in db_ops.security_events.iter_security_events(
             limit=10000,  # Large limit to get all events
             start_time=start_time,
             end_time=end_time,
-        )
-
-        # Calculate summary statistics
-        total_events = len(all_events)
-
-        # Count events by severity
-        events_by_severity: Dict[str, int] = {}
-        for event in all_events:
-            severity = event.severity
-            events_by_severity[severity] = events_by_severity.get(severity, 0) + 1
+        ):
+            total_events += 1
+            events_by_severity[event.severity] = events_by_severity.get(event.severity, 0) + 1
+            if total_events <= 10:  # Events arrive newest first
+                recent_events.append(event)
+            if event.source_system:
+                system_counts[event.source_system] = system_counts.get(event.source_system, 0) + 1
+            if event.source_ip:
+                ip_counts[event.source_ip] = ip_counts.get(event.source_ip, 0) + 1
 
         # Get recent high-severity violations
         recent_violations = [
@@ -222,27 +242,15 @@ async def get_security_summary(
                 related_call_id=str(event.related_call_id) if event.related_call_id else None,
                 related_file_path=event.related_file_path,
             )
-            for event in all_events[:10]  # Top 10 recent events
+            for event in recent_events
             if event.severity in ["high", "critical"]
         ]
 
-        # Count top source systems
-        system_counts: Dict[str, int] = {}
-        for event in all_events:
-            if event.source_system:
-                system_counts[event.source_system] = system_counts.get(event.source_system, 0) + 1
-
         top_source_systems = [
             {"system_id": system, "event_count": count}
             for system, count in sorted(system_counts.items(), key=lambda x: x[1], reverse=True)[:10]
         ]
 
-        # Count top source IPs
-        ip_counts: Dict[str, int] = {}
-        for event in all_events:
-            if event.source_ip:
-                ip_counts[event.source_ip] = ip_counts.get(event.source_ip, 0) + 1
-
         top_source_ips = [
             {"ip_address": ip, "event_count": count}
             for ip, count in sorted(ip_counts.items(), key=lambda x: x[1], reverse=True)[:10]
@@ -10,7 +10,7 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from stable_squirrel.config import Config
-from stable_squirrel.database.models import RadioCall, SearchResult, Transcription
+from stable_squirrel.database.models import RadioCall, SearchResult, SpeakerSegment, Transcription
 from stable_squirrel.web.routes import api
 
 
@@ -93,8 +93,24 @@ def test_list_transcriptions_success(client, mock_radio_call, mock_transcription
     # Mock database operations
     mock_db_ops = MagicMock()
     mock_db_ops.radio_calls.search_radio_calls = AsyncMock(return_value=[mock_radio_call])
-    mock_db_ops.transcriptions.get_transcription = AsyncMock(return_value=mock_transcription)
-    mock_db_ops.speaker_segments.get_speaker_segments = AsyncMock(return_value=[])
+    mock_db_ops.transcriptions.get_transcriptions = AsyncMock(
+        return_value={mock_radio_call.call_id: mock_transcription}
+    )
+    speaker_ids = ["SPEAKER_01", "SPEAKER_00", "SPEAKER_01"]
+    segments = [
+        SpeakerSegment(
+            call_id=mock_radio_call.call_id,
+            segment_id=uuid4(),
+            start_time_seconds=float(index),
+            end_time_seconds=float(index) + 1.0,
+            speaker_id=speaker_id,
+            text="...",
+        )
+        for index, speaker_id in enumerate(speaker_ids)
+    ]
+    mock_db_ops.speaker_segments.get_speaker_segments_for_calls = AsyncMock(
+        return_value={mock_radio_call.call_id: segments}
+    )
 
     with pytest.MonkeyPatch.context() as m:
         m.setattr("stable_squirrel.web.routes.api.DatabaseOperations", lambda x: mock_db_ops)
@@ -111,12 +127,17 @@ def test_list_transcriptions_success(client, mock_radio_call, mock_transcription
 
         transcriptions = data["transcriptions"]
         assert len(transcriptions) >= 0
+        assert transcriptions[0]["speakers"] == ["SPEAKER_01", "SPEAKER_00"]
+        segment_lookup = mock_db_ops.speaker_segments.get_speaker_segments_for_calls
+        segment_lookup.assert_awaited_once_with([mock_radio_call.call_id])
 
 
 def test_list_transcriptions_with_filters(client):
     """Test listing transcriptions with query filters."""
     mock_db_ops = MagicMock()
     mock_db_ops.radio_calls.search_radio_calls = AsyncMock(return_value=[])
+    mock_db_ops.transcriptions.get_transcriptions = AsyncMock(return_value={})
+    mock_db_ops.speaker_segments.get_speaker_segments_for_calls = AsyncMock(return_value={})
 
     with pytest.MonkeyPatch.context() as m:
         m.setattr("stable_squirrel.web.routes.api.DatabaseOperations", lambda x: mock_db_ops)
@@ -366,6 +387,8 @@ def test_pagination_parameters(client):
     """Test pagination parameter validation."""
     mock_db_ops = MagicMock()
     mock_db_ops.radio_calls.search_radio_calls = AsyncMock(return_value=[])
+    mock_db_ops.transcriptions.get_transcriptions = AsyncMock(return_value={})
+    mock_db_ops.speaker_segments.get_speaker_segments_for_calls = AsyncMock(return_value={})
 
     with pytest.MonkeyPatch.context() as m:
         m.setattr("stable_squirrel.web.routes.api.DatabaseOperations", lambda x: mock_db_ops)
@@ -426,6 +449,8 @@ def test_concurrent_api_requests(client):
         return []
 
     mock_db_ops.radio_calls.search_radio_calls = mock_search
+    mock_db_ops.transcriptions.get_transcriptions = AsyncMock(return_value={})
+    mock_db_ops.speaker_segments.get_speaker_segments_for_calls = AsyncMock(return_value={})
 
     results = []
     errors = []
@@ -0,0 +1,88 @@
+"""Tests for reading audio durations from file headers."""
+
+import struct
+
+import pytest
+
+from stable_squirrel.utils.audio_duration import audio_header_duration
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz; stereo and mono
+STEREO_FRAME_HEADER = b"\xff\xfb\x90\x00"
+MONO_FRAME_HEADER = b"\xff\xfb\x90\xc0"
+
+
+def id3_tag(body_size: int) -> bytes:
+    synchsafe = bytes((body_size >> shift) & 0x7F for shift in (21, 14, 7, 0))
+    return b"ID3\x04\x00\x00" + synchsafe + b"\x00" * body_size
+
+
+def wav_file(byte_rate: int, data: bytes, data_size: int | None = None) -> bytes:
+    fmt = struct.pack("<HHIIHH", 1, 1, byte_rate // 2, byte_rate, 2, 16)
+    size = len(data) if data_size is None else data_size
+    chunks = b"fmt " + struct.pack("<I", len(fmt)) + fmt + b"data" + struct.pack("<I", size) + data
+    return b"RIFF" + struct.pack("<I", 4 + len(chunks)) + b"WAVE" + chunks
+
+
+def write(tmp_path, name: str, content: bytes):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return path
+
+
+def test_cbr_mp3_duration_from_size_and_bitrate(tmp_path):
+    """Test an MP3 without a VBR tag is timed from its size at the first frame's bitrate."""
+    audio = STEREO_FRAME_HEADER + b"\x00" * (16000 - 4)
+    path = write(tmp_path, "call.mp3", id3_tag(20) + audio)
+
+    assert audio_header_duration(path) == pytest.approx(1.0)
+
+
+def test_xing_frame_count_gives_exact_duration(tmp_path):
+    """Test a Xing tag's frame count is used instead of the size estimate."""
+    xing = b"Xing" + struct.pack(">II", 0x1, 100)
+    frame = MONO_FRAME_HEADER + b"\x00" * 17 + xing
+    path = write(tmp_path, "call.mp3", frame + b"\x00" * 50000)
+
+    assert audio_header_duration(path) == pytest.approx(100 * 1152 / 44100)
+
+
+def test_vbri_frame_count_gives_exact_duration(tmp_path):
+    """Test a VBRI tag's frame count is used when there is no Xing tag."""
+    vbri = b"VBRI" + struct.pack(">HHHII", 1, 0, 75, 50000, 250)
+    frame = STEREO_FRAME_HEADER + b"\x00" * 32 + vbri
+    path = write(tmp_path, "call.mp3", frame + b"\x00" * 50000)
+
+    assert audio_header_duration(path) == pytest.approx(250 * 1152 / 44100)
+
+
+def test_id3_tag_past_first_read_is_skipped(tmp_path):
+    """Test the first frame is found after an ID3 tag larger than the initial read."""
+    audio = STEREO_FRAME_HEADER + b"\x00" * (8000 - 4)
+    path = write(tmp_path, "call.mp3", id3_tag(10000) + audio)
+
+    assert audio_header_duration(path) == pytest.approx(0.5)
+
+
+def test_wav_duration_from_data_chunk(tmp_path):
+    """Test a WAV is timed from its data chunk size and byte rate."""
+    path = write(tmp_path, "call.wav", wav_file(16000, b"\x00" * 32000))
+
+    assert audio_header_duration(path) == pytest.approx(2.0)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        wav_file(16000, b"\x00" * 32000, data_size=0),  # Streaming writer never patched the size
+        b"\x00" * 2048,
+        b"",
+    ],
+)
+def test_unknown_duration_returns_none(tmp_path, content):
+    """Test headers that don't give a trustworthy duration return None for the caller's fallback."""
+    assert audio_header_duration(write(tmp_path, "call.bin", content)) is None
+
+
+def test_missing_file_returns_none(tmp_path):
+    """Test an unreadable file returns None instead of raising."""
+    assert audio_header_duration(tmp_path / "missing.mp3") is None
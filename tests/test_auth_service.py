@@ -0,0 +1,149 @@
+"""Tests for the API key authentication service."""
+
+import logging
+
+import pytest
+
+from stable_squirrel.config import APIKeyConfig, IngestionConfig
+from stable_squirrel.security import SecurityAuthService
+
+
+class FakeSecurityEventOperations:
+    """Security event store whose batch queue can be marked full."""
+
+    def __init__(self, queue_full: bool = False):
+        self.queue_full = queue_full
+        self.queued = []
+        self.written = []
+        self.tallied = []
+
+    def queue_security_event(self, event) -> bool:
+        if self.queue_full:
+            return False
+        self.queued.append(event)
+        return True
+
+    def tally_security_event(self, event_type, source_ip=None, source_system=None, api_key_used=None):
+        self.tallied.append((event_type, source_ip, source_system, api_key_used))
+
+    async def create_security_event(self, event):
+        self.written.append(event)
+        return event
+
+
+def make_service(security_ops: FakeSecurityEventOperations) -> SecurityAuthService:
+    config = IngestionConfig(api_keys=[APIKeyConfig(key="station-key-123", allowed_ips=["10.0.0.1"])])
+    return SecurityAuthService(config, security_ops)
+
+
+@pytest.mark.asyncio
+async def test_security_events_are_queued_not_written_inline():
+    """Test a rejected key hands its audit event to the batch writer instead of inserting it."""
+    ops = FakeSecurityEventOperations()
+    service = make_service(ops)
+
+    assert (await service.validate_api_key("wrong-key", "10.0.0.1"))[0] is False
+
+    assert [event.event_type for event in ops.queued] == ["invalid_api_key"]
+    assert ops.written == []
+
+
+@pytest.mark.asyncio
+async def test_successful_authentication_is_only_tallied():
+    """Test the success path counts the key use instead of building and queueing an event."""
+    ops = FakeSecurityEventOperations()
+    service = make_service(ops)
+
+    assert await service.validate_api_key("station-key-123", "10.0.0.1", "100") == (True, "station-", None)
+
+    assert ops.tallied == [("api_key_used", "10.0.0.1", "100", "station-...")]
+    assert ops.queued == ops.written == []
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_routine_events_but_writes_violations():
+    """Test a full queue drops info events while high-severity events are still stored."""
+    ops = FakeSecurityEventOperations(queue_full=True)
+    service = make_service(ops)
+
+    await service.validate_api_key("station-key-123", "10.0.0.1")
+    await service.validate_api_key("station-key-123", "192.168.1.1")
+
+    assert [event.event_type for event in ops.written] == ["api_key_ip_violation"]
+    assert not service._security_events
+
+
+@pytest.mark.asyncio
+async def test_api_key_lookup_follows_config_changes():
+    """Test keys are matched through the digest index, which is rebuilt when keys are reassigned."""
+    ops = FakeSecurityEventOperations()
+    service = make_service(ops)
+    assert (await service.validate_api_key("other-key-456", "10.0.0.1"))[0] is False
+
+    service.config.api_keys = [APIKeyConfig(key="other-key-456")]
+    service.config.api_key = "legacy-key"
+
+    assert await service.validate_api_key("other-key-456", "10.0.0.1") == (True, "other-ke", None)
+    assert await service.validate_api_key("legacy-key", "10.0.0.1") == (True, "legacy", None)
+    assert (await service.validate_api_key("station-key-123", "10.0.0.1"))[0] is False
+
+
+@pytest.mark.asyncio
+async def test_allowed_ips_accept_cidr_ranges():
+    """Test allowed_ips entries may be CIDR ranges alongside exact addresses."""
+    key_config = APIKeyConfig(key="station-key-123", allowed_ips=["10.0.0.1", "192.168.8.0/22"])
+    service = SecurityAuthService(IngestionConfig(api_keys=[key_config]), FakeSecurityEventOperations())
+
+    cases = (("10.0.0.1", True), ("192.168.11.254", True), ("192.168.12.1", False), ("unknown", False))
+    for client_ip, allowed in cases:
+        assert (await service.validate_api_key("station-key-123", client_ip))[0] is allowed, client_ip
+
+
+@pytest.mark.asyncio
+async def test_fallback_events_bounded_and_returned_newest_first(monkeypatch):
+    """Test without a database events are kept in a capped buffer and read back newest-first."""
+    monkeypatch.setattr("stable_squirrel.security.auth_service.FALLBACK_EVENT_BUFFER", 3)
+    service = SecurityAuthService(IngestionConfig())
+
+    for index in range(5):
+        await service.log_rate_limit_violation("10.0.0.1", str(index), "per_minute", index, 1)
+
+    events = await service.get_security_events(limit=2)
+    assert [event.source_system for event in events] == ["4", "3"]
+    assert len(service._security_events) == 3
+
+
+@pytest.mark.asyncio
+async def test_fallback_upload_source_analysis():
+    """Test the in-memory analysis counts one system's events and lists its latest first."""
+    service = SecurityAuthService(IngestionConfig())
+    for index in range(12):
+        await service.log_upload_attempt(f"10.0.0.{index % 3}", "100", None, None, f"{index}.mp3", success=index != 5)
+    await service.log_upload_attempt("10.0.0.9", "200", None, None, "other.mp3", success=True)
+
+    analysis = await service.get_upload_source_analysis("100")
+
+    assert analysis["total_events"] == analysis["upload_attempts"] == 12
+    assert analysis["security_violations"] == 0
+    assert analysis["unique_ips"] == 3
+    assert analysis["last_seen"] == service._security_events[11].timestamp
+    assert [e.metadata["file_name"] for e in analysis["recent_events"]][:2] == ["11.mp3", "10.mp3"]
+    assert len(analysis["recent_events"]) == 10
+
+
+@pytest.mark.asyncio
+async def test_security_events_logged_at_severity_level(caplog):
+    """Test each event is logged at the level its severity maps to, unknown severities at INFO."""
+    service = SecurityAuthService(IngestionConfig())
+
+    with caplog.at_level(logging.INFO, logger="stable_squirrel.security.auth_service"):
+        for severity in ("low", "medium", "high", "critical", "unexpected"):
+            await service._log_security_event(event_type="test", severity=severity, description=severity)
+
+    assert [record.levelno for record in caplog.records] == [
+        logging.INFO,
+        logging.WARNING,
+        logging.ERROR,
+        logging.CRITICAL,
+        logging.INFO,
+    ]
@@ -1,9 +1,15 @@
 """Tests for configuration management."""
 
+import json
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
-from stable_squirrel.config import Config, load_config, save_config
+import pytest
+import yaml
+from pydantic import ValidationError
+
+from stable_squirrel.config import APIKeyConfig, Config, clear_config_cache, load_config, save_config
 
 
 def test_default_config():
@@ -50,3 +56,95 @@ def test_load_nonexistent_config():
 
         # Should create the file
         assert config_path.exists()
+
+
+def test_load_config_cached_until_file_changes():
+    """Test unchanged config files are served from the parse cache."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yaml"
+        config_path.write_text("transcription:\n  model_name: base\n")
+
+        with patch("stable_squirrel.config.yaml.load", wraps=yaml.load) as yaml_load:
+            first = load_config(config_path)
+            assert load_config(config_path) == first
+            assert yaml_load.call_count == 1
+
+            config_path.write_text("transcription:\n  model_name: small.en\n")
+            reloaded = load_config(config_path)
+
+            assert reloaded.transcription.model_name == "small.en"
+            assert yaml_load.call_count == 2
+
+            clear_config_cache()
+            (Path(tmpdir) / "config.yaml.cache.json").unlink()
+            load_config(config_path)
+            assert yaml_load.call_count == 3
+
+
+def test_load_config_returns_independent_copies():
+    """Test modifying a loaded config does not leak into later loads of the cached file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yaml"
+        config_path.write_text("transcription:\n  model_name: base\n")
+
+        first = load_config(config_path)
+        first.transcription.model_name = "large-v3"
+
+        assert load_config(config_path).transcription.model_name == "base"
+
+
+def test_load_config_uses_json_sidecar_cache():
+    """Test a JSON sidecar is written and reused for an unchanged config file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yaml"
+        config_path.write_text("transcription:\n  model_name: base\n")
+
+        load_config(config_path)
+        cache_path = Path(tmpdir) / "config.yaml.cache.json"
+        assert cache_path.exists()
+
+        clear_config_cache()
+        assert load_config(config_path).transcription.model_name == "base"
+
+        # Editing the YAML invalidates the sidecar
+        config_path.write_text("transcription:\n  model_name: medium\n")
+        assert load_config(config_path).transcription.model_name == "medium"
+
+
+def test_config_sidecar_cache_omits_defaults():
+    """Test the sidecar only stores values set in the YAML, so code defaults are never pinned."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yaml"
+        config_path.write_text("transcription:\n  model_name: base\n")
+
+        load_config(config_path)
+        cached = json.loads((Path(tmpdir) / "config.yaml.cache.json").read_text())
+
+        assert cached["config"] == {"transcription": {"model_name": "base"}}
+
+
+def test_api_key_restrictions_loaded_as_sets():
+    """Test API key IP/system allow-lists are stored as frozensets and round-trip through YAML."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yaml"
+        config_path.write_text(
+            "ingestion:\n"
+            "  api_keys:\n"
+            "    - key: abc123\n"
+            "      allowed_ips: ['10.0.0.1', '10.0.0.2']\n"
+            "      allowed_systems: ['100']\n"
+        )
+
+        key_config = load_config(config_path).ingestion.api_keys[0]
+        assert key_config.allowed_ips == frozenset({"10.0.0.1", "10.0.0.2"})
+        assert key_config.allowed_systems == frozenset({"100"})
+
+        saved_path = Path(tmpdir) / "saved.yaml"
+        save_config(load_config(config_path), saved_path)
+        assert load_config(saved_path).ingestion.api_keys[0].allowed_ips == key_config.allowed_ips
+
+
+def test_api_key_rejects_malformed_cidr():
+    """Test a bad CIDR entry in allowed_ips fails at config load rather than on first upload."""
+    with pytest.raises(ValidationError, match="10.0.0.0/33"):
+        APIKeyConfig(key="abc123", allowed_ips=["10.0.0.1", "10.0.0.0/33"])
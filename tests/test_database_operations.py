@@ -6,12 +6,16 @@ from uuid import uuid4
 
 import pytest
 
+from stable_squirrel.database.cache import RADIO_CALL, TRANSCRIPTION, RecordCache
 from stable_squirrel.database.models import (
     RadioCallCreate,
+    SecurityEvent,
     SpeakerSegment,
     TranscriptionCreate,
 )
-from stable_squirrel.database.operations import DatabaseOperations
+from stable_squirrel.database.operations import SEGMENT_COPY_THRESHOLD, DatabaseOperations
+from stable_squirrel.database.queries import HOT_QUERIES, TRANSCRIPTION_RESULT_COLUMNS
+from stable_squirrel.database.records import RADIO_CALL_COLUMNS, RADIO_CALL_UPLOAD_COLUMNS, RadioCallRecord
 
 
 @pytest.fixture
@@ -71,6 +75,21 @@ def speaker_segments_data():
     ]
 
 
+class MockRadioCallRecord(tuple):
+    """Positional radio call row standing in for an asyncpg RadioCallRecord."""
+
+    to_model = RadioCallRecord.to_model
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            key = (RADIO_CALL_COLUMNS + RADIO_CALL_UPLOAD_COLUMNS).index(key)
+        return super().__getitem__(key)
+
+    @classmethod
+    def from_mapping(cls, row: dict) -> "MockRadioCallRecord":
+        return cls(row.get(column) for column in RADIO_CALL_COLUMNS + RADIO_CALL_UPLOAD_COLUMNS)
+
+
 class MockDatabaseManager:
     """Mock database manager for testing."""
 
@@ -78,6 +97,11 @@ class MockDatabaseManager:
         self.calls = []
         self.transcriptions = []
         self.speaker_segments = []
+        self.copied = {}
+        self.fetched = []
+        self.record_cache = RecordCache(max_entries=100, ttl_seconds=60)
+        self.rum_search = False
+        self.security_rollup = False
         self.next_call_id = 1
 
     async def execute(self, query: str, *args) -> None:
@@ -86,6 +110,7 @@ class MockDatabaseManager:
 
     def transaction(self):
         """Mock transaction context manager."""
+        manager = self
 
         class MockTransaction:
             async def __aenter__(self):
@@ -97,9 +122,21 @@ class MockDatabaseManager:
             async def execute(self, query: str, *args) -> None:
                 pass
 
+            async def fetch(self, query: str, *args) -> list:
+                manager.fetched.append((query, args))
+                return []
+
+            async def copy_records_to_table(self, table_name: str, *, records, columns) -> str:
+                manager.copied.setdefault(table_name, []).extend(dict(zip(columns, r)) for r in records)
+                return f"COPY {len(records)}"
+
             async def fetchrow(self, query: str, *args) -> dict:
                 # For store_complete_transcription, return mock results
-                if "INSERT INTO radio_calls" in query:
+                if "new_transcription" in query:
+                    # Combined call + transcription insert: call params first, then the transcription's
+                    stored_call = await self.fetchrow(HOT_QUERIES["insert_radio_call"], *args[:18])
+                    return {**stored_call, **dict(zip(TRANSCRIPTION_RESULT_COLUMNS, args[18:]))}
+                elif "INSERT INTO radio_calls" in query:
                     return {
                         "call_id": args[0],  # call_id from arguments
                         "timestamp": args[1],  # timestamp
@@ -146,28 +183,48 @@ class MockDatabaseManager:
 
         return MockTransaction()
 
-    async def fetch(self, query: str, *args) -> list:
+    async def fetch(self, query: str, *args, record_class=None) -> list:
         """Mock fetch method."""
-        if "radio_calls" in query and "SELECT" in query:
+        if "search_rank" in query:
             return [
                 {
                     "call_id": uuid4(),
                     "timestamp": datetime(2023, 12, 30, 20, 0, 0),
                     "frequency": 460025000,
                     "talkgroup_id": 1001,
-                    "source_radio_id": 2001,
-                    "system_id": 123,
-                    "system_label": "Test System",
                     "talkgroup_label": "Police Dispatch",
-                    "talkgroup_group": "Law Enforcement",
+                    "system_label": "Test System",
                     "talker_alias": "Unit 123",
                     "audio_file_path": "/tmp/test.wav",
                     "audio_duration_seconds": 15.5,
-                    "audio_format": "wav",
-                    "transcription_status": "pending",
-                    "transcribed_at": None,
+                    "full_transcript": "Test police transcript",
+                    "speaker_count": 1,
+                    "confidence_score": 0.9,
+                    "search_rank": 0.5,
                 }
             ]
+        elif "radio_calls" in query and "SELECT" in query:
+            return [
+                MockRadioCallRecord.from_mapping(
+                    {
+                        "call_id": uuid4(),
+                        "timestamp": datetime(2023, 12, 30, 20, 0, 0),
+                        "frequency": 460025000,
+                        "talkgroup_id": 1001,
+                        "source_radio_id": 2001,
+                        "system_id": 123,
+                        "system_label": "Test System",
+                        "talkgroup_label": "Police Dispatch",
+                        "talkgroup_group": "Law Enforcement",
+                        "talker_alias": "Unit 123",
+                        "audio_file_path": "/tmp/test.wav",
+                        "audio_duration_seconds": 15.5,
+                        "audio_format": "wav",
+                        "transcription_status": "pending",
+                        "transcribed_at": None,
+                    }
+                )
+            ]
         elif "transcriptions" in query and "SELECT" in query:
             return [
                 {
@@ -191,27 +248,26 @@ class MockDatabaseManager:
     async def fetchrow(self, query: str, *args) -> dict:
         """Mock fetchrow method."""
         if "INSERT INTO radio_calls" in query:
-            call_id = uuid4()
             return {
-                "call_id": call_id,
-                "timestamp": args[0],  # timestamp
-                "frequency": args[1],  # frequency
-                "talkgroup_id": args[2],  # talkgroup_id
-                "source_radio_id": args[3] if len(args) > 3 else None,  # source_radio_id
-                "system_id": args[4] if len(args) > 4 else None,  # system_id
-                "system_label": args[5] if len(args) > 5 else None,  # system_label
-                "talkgroup_label": args[6] if len(args) > 6 else None,  # talkgroup_label
-                "talkgroup_group": args[7] if len(args) > 7 else None,  # talkgroup_group
-                "talker_alias": args[8] if len(args) > 8 else None,  # talker_alias
-                "audio_file_path": args[9] if len(args) > 9 else "/tmp/test.wav",  # audio_file_path
-                "audio_duration_seconds": args[10] if len(args) > 10 else 10.0,  # audio_duration_seconds
-                "audio_format": args[11] if len(args) > 11 else "wav",  # audio_format
-                "transcription_status": "pending",  # args[12] is "pending"
+                "call_id": args[0],  # call_id
+                "timestamp": args[1],  # timestamp
+                "frequency": args[2],  # frequency
+                "talkgroup_id": args[3],  # talkgroup_id
+                "source_radio_id": args[4],  # source_radio_id
+                "system_id": args[5],  # system_id
+                "system_label": args[6],  # system_label
+                "talkgroup_label": args[7],  # talkgroup_label
+                "talkgroup_group": args[8],  # talkgroup_group
+                "talker_alias": args[9],  # talker_alias
+                "audio_file_path": args[10],  # audio_file_path
+                "audio_duration_seconds": args[11],  # audio_duration_seconds
+                "audio_format": args[12],  # audio_format
+                "transcription_status": args[13],  # transcription_status
                 "transcribed_at": None,
-                "upload_source_ip": args[13] if len(args) > 13 else None,  # upload_source_ip
-                "upload_source_system": args[14] if len(args) > 14 else None,  # upload_source_system
-                "upload_api_key_id": args[15] if len(args) > 15 else None,  # upload_api_key_id
-                "upload_user_agent": args[16] if len(args) > 16 else None,  # upload_user_agent
+                "upload_source_ip": args[14],  # upload_source_ip
+                "upload_source_system": args[15],  # upload_source_system
+                "upload_api_key_id": args[16],  # upload_api_key_id
+                "upload_user_agent": args[17],  # upload_user_agent
             }
         elif "INSERT INTO transcriptions" in query:
             return {
@@ -222,6 +278,10 @@ class MockDatabaseManager:
             }
         return {"call_id": uuid4()}
 
+    async def fetchrow_hot(self, key: str, *args):
+        """Mock hot query; runs the statement text through fetchrow."""
+        return await self.fetchrow(HOT_QUERIES[key], *args)
+
     async def fetchval(self, query: str, *args):
         """Mock fetchval method."""
         if "COUNT" in query:
@@ -319,12 +379,49 @@ async def test_store_complete_transcription(db_operations, radio_call_data, tran
     stored_radio_call = result["radio_call"]
     assert stored_radio_call["frequency"] == radio_call_data.frequency
     assert stored_radio_call["talkgroup_id"] == radio_call_data.talkgroup_id
+    assert stored_radio_call["transcription_status"] == "completed"
 
     # Verify the transcription (returned as dict)
     stored_transcription = result["transcription"]
+    assert stored_transcription["call_id"] == radio_call_data.call_id
+    assert "full_transcript" not in result["radio_call"]
     assert stored_transcription["full_transcript"] == transcription_data.full_transcript
     assert stored_transcription["language"] == transcription_data.language
 
+    # A small batch of segments goes through one unnest() INSERT, one array per column
+    (query, columns), *_ = db_operations.db.fetched
+    assert query == HOT_QUERIES["insert_speaker_segments"]
+    assert len(columns) == 7
+    assert columns[0] == [radio_call_data.call_id] * len(speaker_segments_data)
+    assert columns[5] == [s.text for s in speaker_segments_data]
+    assert [segment["text"] for segment in result["speaker_segments"]] == [s.text for s in speaker_segments_data]
+    assert "speaker_segments" not in db_operations.db.copied
+
+
+@pytest.mark.asyncio
+async def test_store_complete_transcription_copies_large_segment_batches(
+    db_operations, radio_call_data, transcription_data
+):
+    """Test that large segment batches are written with COPY."""
+    segments = [
+        SpeakerSegment(
+            call_id=radio_call_data.call_id,
+            start_time_seconds=float(i),
+            end_time_seconds=float(i) + 0.5,
+            speaker_id="SPEAKER_00",
+            text=f"Segment {i}",
+        )
+        for i in range(SEGMENT_COPY_THRESHOLD)
+    ]
+
+    result = await db_operations.store_complete_transcription(radio_call_data, transcription_data, segments)
+
+    copied_segments = db_operations.db.copied["speaker_segments"]
+    assert len(copied_segments) == SEGMENT_COPY_THRESHOLD
+    assert all(segment["call_id"] == radio_call_data.call_id for segment in copied_segments)
+    assert result["speaker_segments"] == copied_segments
+    assert db_operations.db.fetched == []
+
 
 @pytest.mark.asyncio
 async def test_radio_call_operations_create(db_operations, radio_call_data):
@@ -332,10 +429,161 @@ async def test_radio_call_operations_create(db_operations, radio_call_data):
     result = await db_operations.radio_calls.create_radio_call(radio_call_data)
 
     assert result is not None
+    assert result.call_id == radio_call_data.call_id
     assert result.frequency == radio_call_data.frequency
     assert result.talkgroup_id == radio_call_data.talkgroup_id
 
 
+@pytest.mark.asyncio
+async def test_get_radio_call_cached_until_status_update(db_operations, monkeypatch):
+    """Test repeated lookups are served from the record cache until the call is written."""
+    lookups = []
+
+    async def mock_fetchrow_hot(key, *args):
+        lookups.append(key)
+        if key == "select_radio_call":
+            return MockRadioCallRecord.from_mapping(
+                {"call_id": args[0], "timestamp": datetime(2023, 12, 30), "frequency": 460025000}
+            )
+        return None
+
+    monkeypatch.setattr(db_operations.db, "fetchrow_hot", mock_fetchrow_hot)
+    call_id = uuid4()
+
+    first = await db_operations.radio_calls.get_radio_call(call_id)
+    second = await db_operations.radio_calls.get_radio_call(call_id)
+    assert first.call_id == second.call_id == call_id
+    assert lookups == ["select_radio_call"]
+
+    await db_operations.radio_calls.update_transcription_status(call_id, "completed")
+    await db_operations.radio_calls.get_radio_call(call_id)
+    assert lookups == ["select_radio_call", "update_transcription_status", "select_radio_call"]
+
+
+@pytest.mark.asyncio
+async def test_get_radio_call_read_during_write_not_cached(db_operations, monkeypatch):
+    """Test a row read before a concurrent status update commits is returned but not cached."""
+    read_started = asyncio.Event()
+    release_read = asyncio.Event()
+    lookups = []
+
+    async def mock_fetchrow_hot(key, *args):
+        lookups.append(key)
+        if key != "select_radio_call":
+            return None
+        status = "pending" if len(lookups) == 1 else "completed"
+        row = MockRadioCallRecord.from_mapping({"call_id": args[0], "transcription_status": status})
+        if len(lookups) == 1:
+            # The first read sees the row as it was before the update committed
+            read_started.set()
+            await release_read.wait()
+        return row
+
+    monkeypatch.setattr(db_operations.db, "fetchrow_hot", mock_fetchrow_hot)
+    call_id = uuid4()
+
+    stale_read = asyncio.create_task(db_operations.radio_calls.get_radio_call(call_id))
+    await read_started.wait()
+    await db_operations.radio_calls.update_transcription_status(call_id, "completed")
+    release_read.set()
+
+    assert (await stale_read).transcription_status == "pending"
+    assert (await db_operations.radio_calls.get_radio_call(call_id)).transcription_status == "completed"
+    assert lookups == ["select_radio_call", "update_transcription_status", "select_radio_call"]
+
+
+@pytest.mark.asyncio
+async def test_get_radio_calls_batches_uncached_ids(db_operations, monkeypatch):
+    """Test batch lookup fetches only uncached calls, in a single ANY($1) query."""
+    cached_id, fetched_id, unknown_id = uuid4(), uuid4(), uuid4()
+    db_operations.db.record_cache.set(
+        RADIO_CALL,
+        cached_id,
+        MockRadioCallRecord.from_mapping({"call_id": cached_id, "frequency": 1}),
+        db_operations.db.record_cache.generation(cached_id),
+    )
+    queries = []
+
+    async def mock_fetch(query, *args, record_class=None):
+        queries.append((query, args))
+        return [MockRadioCallRecord.from_mapping({"call_id": fetched_id, "frequency": 2})]
+
+    monkeypatch.setattr(db_operations.db, "fetch", mock_fetch)
+
+    calls = await db_operations.radio_calls.get_radio_calls([cached_id, fetched_id, unknown_id, fetched_id])
+
+    assert {call_id: call.frequency for call_id, call in calls.items()} == {cached_id: 1, fetched_id: 2}
+    assert len(queries) == 1
+    assert "ANY($1::uuid[])" in queries[0][0]
+    assert queries[0][1] == ([fetched_id, unknown_id],)
+
+    # Fetched rows are cached for the next lookup
+    await db_operations.radio_calls.get_radio_calls([fetched_id])
+    assert len(queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_transcriptions_batches_uncached_ids(db_operations, monkeypatch):
+    """Test batch transcription lookup mixes cached rows with one fetch and leaves out calls without one."""
+    cache = db_operations.db.record_cache
+    cached_id, fetched_id, untranscribed_id = uuid4(), uuid4(), uuid4()
+    cache.set(
+        TRANSCRIPTION,
+        cached_id,
+        {"call_id": cached_id, "full_transcript": "cached"},
+        cache.generation(cached_id),
+    )
+    stored = {fetched_id: {"call_id": fetched_id, "full_transcript": "fetched"}}
+    queries = []
+
+    async def mock_fetch(query, *args, record_class=None):
+        queries.append((query, args))
+        return [stored[call_id] for call_id in args[0] if call_id in stored]
+
+    monkeypatch.setattr(db_operations.db, "fetch", mock_fetch)
+
+    transcriptions = await db_operations.transcriptions.get_transcriptions([cached_id, fetched_id, untranscribed_id])
+
+    assert {call_id: t.full_transcript for call_id, t in transcriptions.items()} == {
+        cached_id: "cached",
+        fetched_id: "fetched",
+    }
+    assert len(queries) == 1
+    assert "ANY($1::uuid[])" in queries[0][0]
+    assert queries[0][1] == ([fetched_id, untranscribed_id],)
+
+    # The fetched row is cached; a call without a transcription is looked up again
+    await db_operations.transcriptions.get_transcriptions([fetched_id, untranscribed_id])
+    assert queries[1][1] == ([untranscribed_id],)
+
+
+@pytest.mark.asyncio
+async def test_get_speaker_segments_for_calls_groups_rows_by_call(db_operations, monkeypatch):
+    """Test batch segment lookup groups rows per call, giving calls without segments an empty list."""
+    call_id, silent_id = uuid4(), uuid4()
+    rows = [
+        {"call_id": call_id, "segment_id": uuid4(), "start_time_seconds": start, "speaker_id": speaker}
+        for start, speaker in ((0.0, "SPEAKER_00"), (2.0, "SPEAKER_01"))
+    ]
+    queries = []
+
+    async def mock_fetch(query, *args, record_class=None):
+        queries.append(args)
+        return rows
+
+    monkeypatch.setattr(db_operations.db, "fetch", mock_fetch)
+
+    segments = await db_operations.speaker_segments.get_speaker_segments_for_calls([call_id, silent_id])
+
+    assert [segment.speaker_id for segment in segments[call_id]] == ["SPEAKER_00", "SPEAKER_01"]
+    assert segments[silent_id] == []
+    assert queries == [([call_id, silent_id],)]
+
+    # Both results, including the empty one, are cached
+    await db_operations.speaker_segments.get_speaker_segments_for_calls([call_id, silent_id])
+    assert len(queries) == 1
+
+
 @pytest.mark.asyncio
 async def test_radio_call_operations_search(db_operations):
     """Test searching radio calls."""
@@ -345,6 +593,9 @@ async def test_radio_call_operations_search(db_operations):
     results = await db_operations.radio_calls.search_radio_calls(search_query)
 
     assert isinstance(results, list)
+    assert results[0].talkgroup_label == "Police Dispatch"
+    assert results[0].transcription_status == "pending"
+    assert results[0].upload_source_ip is None
 
 
 @pytest.mark.asyncio
@@ -356,6 +607,184 @@ async def test_transcription_operations_search(db_operations):
     results = await db_operations.transcriptions.search_transcriptions(search_query)
 
     assert isinstance(results, list)
+    assert results[0].search_rank == 0.5
+    assert not hasattr(results[0], "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_search_filters_numbered_in_order(db_operations, monkeypatch):
+    """Test only set filters become conditions, with placeholders numbered in order."""
+    from stable_squirrel.database.models import SearchQuery
+
+    captured = {}
+
+    async def mock_fetch(query, *args, record_class=None):
+        captured["query"], captured["args"] = query, args
+        return []
+
+    monkeypatch.setattr(db_operations.db, "fetch", mock_fetch)
+
+    search_query = SearchQuery(talkgroup_id=1001, end_time=datetime(2024, 1, 1), limit=5, offset=10)
+    await db_operations.radio_calls.search_radio_calls(search_query)
+
+    assert "talkgroup_id = $1" in captured["query"]
+    assert "timestamp <= $2" in captured["query"]
+    assert "LIMIT $3 OFFSET $4" in captured["query"]
+    assert "frequency =" not in captured["query"]
+    assert captured["args"] == (1001, datetime(2024, 1, 1), 5, 10)
+
+
+@pytest.mark.asyncio
+async def test_search_sql_reused_per_filter_shape(db_operations, monkeypatch):
+    """Test searches with the same set of filters share one statement text."""
+    from stable_squirrel.database.models import SearchQuery
+
+    queries = []
+
+    async def mock_fetch(query, *args, record_class=None):
+        queries.append(query)
+        return []
+
+    monkeypatch.setattr(db_operations.db, "fetch", mock_fetch)
+
+    await db_operations.radio_calls.search_radio_calls(SearchQuery(talkgroup_id=1001))
+    await db_operations.radio_calls.search_radio_calls(SearchQuery(talkgroup_id=2002, offset=50))
+    await db_operations.radio_calls.search_radio_calls(SearchQuery(system_id=3))
+
+    assert queries[0] is queries[1]
+    assert queries[2] != queries[0]
+
+
+@pytest.mark.asyncio
+async def test_unfiltered_search_has_no_where_clause(db_operations, monkeypatch):
+    """Test the "latest calls" search renders a static statement with only LIMIT/OFFSET bound."""
+    from stable_squirrel.database.models import SearchQuery
+
+    captured = {}
+
+    async def mock_fetch(query, *args, record_class=None):
+        captured["query"], captured["args"] = query, args
+        return []
+
+    monkeypatch.setattr(db_operations.db, "fetch", mock_fetch)
+
+    await db_operations.radio_calls.search_radio_calls(SearchQuery(limit=50))
+
+    assert "WHERE" not in captured["query"]
+    assert "LIMIT $1 OFFSET $2" in captured["query"]
+    assert captured["args"] == (50, 0)
+
+
+@pytest.mark.asyncio
+async def test_text_search_uses_tsv_column(db_operations, monkeypatch):
+    """Test full-text search matches and ranks on the stored tsv column with one bind parameter."""
+    from stable_squirrel.database.models import SearchQuery
+
+    captured = {}
+
+    async def mock_fetch(query, *args, record_class=None):
+        captured["query"], captured["args"] = query, args
+        return []
+
+    monkeypatch.setattr(db_operations.db, "fetch", mock_fetch)
+
+    search_query = SearchQuery(query_text="structure fire", frequency=460025000, limit=10, offset=0)
+    await db_operations.transcriptions.search_transcriptions(search_query)
+
+    assert "t.tsv @@ plainto_tsquery('english', $1)" in captured["query"]
+    assert "ts_rank(t.tsv, plainto_tsquery('english', $1))" in captured["query"]
+    assert "rc.frequency = $2" in captured["query"]
+    assert "to_tsvector" not in captured["query"]
+    assert captured["query"].count("rc.call_id = t.call_id") == 1
+    assert captured["args"] == ("structure fire", 460025000, 10, 0)
+
+
+@pytest.mark.asyncio
+async def test_text_search_orders_by_rum_distance_when_available(db_operations, monkeypatch):
+    """Test ranked search orders by the RUM distance operator once the RUM index is in place."""
+    from stable_squirrel.database.models import SearchQuery
+
+    captured = {}
+
+    async def mock_fetch(query, *args, record_class=None):
+        captured["query"] = query
+        return []
+
+    monkeypatch.setattr(db_operations.db, "fetch", mock_fetch)
+    search_query = SearchQuery(query_text="structure fire")
+
+    await db_operations.transcriptions.search_transcriptions(search_query)
+    assert "<=>" not in captured["query"]
+
+    db_operations.db.rum_search = True
+    await db_operations.transcriptions.search_transcriptions(search_query)
+    assert "ORDER BY t.tsv <=> plainto_tsquery('english', $1)" in captured["query"]
+
+
+@pytest.mark.asyncio
+async def test_list_projection_returns_snippet(db_operations, monkeypatch):
+    """Test the list projection selects a highlighted snippet instead of the full transcript."""
+    from stable_squirrel.database.models import SearchQuery
+
+    captured = {}
+
+    async def mock_fetch(query, *args, record_class=None):
+        captured["query"] = query
+        return []
+
+    monkeypatch.setattr(db_operations.db, "fetch", mock_fetch)
+
+    search_query = SearchQuery(query_text="structure fire", projection="list")
+    await db_operations.transcriptions.search_transcriptions(search_query)
+
+    assert "ts_headline('english', t.full_transcript, plainto_tsquery('english', $1)" in captured["query"]
+    assert "AS snippet" in captured["query"]
+    assert "t.full_transcript, t.speaker_count" not in captured["query"]
+    assert "t.confidence_score" not in captured["query"]
+
+
+@pytest.mark.asyncio
+async def test_upload_source_analysis_single_stats_query(db_operations, monkeypatch):
+    """Test upload source statistics and recent events come from one combined JSON query."""
+    stats_queries = []
+
+    async def mock_fetchval(query, *args):
+        stats_queries.append(query)
+        # The pool's json codec hands back the decoded object
+        return {
+            "upload_statistics": {"total_uploads": 5, "unique_ips": 2},
+            "security_statistics": {"total_events": 3, "violations": 1, "upload_events": 2},
+            "ip_addresses": [{"upload_source_ip": "10.0.0.1", "upload_count": 4}],
+            "recent_events": [
+                {
+                    "event_id": "6f1c2f0e-8c5e-4a55-9a55-1f0a3b6d2c11",
+                    "timestamp": "2024-01-01T12:00:00+00:00",
+                    "event_type": "upload_blocked",
+                    "severity": "high",
+                    "source_ip": "10.0.0.1",
+                    "source_system": "123",
+                    "api_key_used": None,
+                    "user_agent": None,
+                    "description": "Blocked upload",
+                    "metadata": {"reason": "size"},
+                    "related_call_id": None,
+                    "related_file_path": None,
+                }
+            ],
+        }
+
+    monkeypatch.setattr(db_operations.db, "fetchval", mock_fetchval)
+
+    analysis = await db_operations.security_events.get_upload_source_analysis("123")
+
+    assert len(stats_queries) == 1
+    assert "FROM security_events_by_system" not in stats_queries[0]
+    assert analysis["system_id"] == "123"
+    assert analysis["upload_statistics"]["total_uploads"] == 5
+    assert analysis["security_statistics"]["violations"] == 1
+    assert analysis["ip_addresses"] == [{"upload_source_ip": "10.0.0.1", "upload_count": 4}]
+    assert [event.severity for event in analysis["recent_events"]] == ["high"]
+    assert analysis["recent_events"][0].timestamp.year == 2024
 
 
 def test_map_record_to_model(db_operations):
@@ -492,3 +921,80 @@ async def test_concurrent_operations(db_operations, radio_call_data):
     for result in results:
         # Each result should either be a valid RadioCall or an exception
         assert result is not None
+
+
+def test_repeated_labels_are_interned():
+    """Test low-cardinality string fields share a single interned object."""
+    first = SpeakerSegment(
+        call_id=uuid4(), start_time_seconds=0.0, end_time_seconds=1.0, speaker_id="".join(["SPEAKER_", "07"]), text="a"
+    )
+    second = SpeakerSegment(
+        call_id=uuid4(), start_time_seconds=1.0, end_time_seconds=2.0, speaker_id="".join(["SPEAKER", "_07"]), text="b"
+    )
+
+    assert first.speaker_id == "SPEAKER_07"
+    assert first.speaker_id is second.speaker_id
+
+
+@pytest.mark.asyncio
+async def test_upload_source_analysis_counts_from_rollup_when_available(db_operations, monkeypatch):
+    """Test security statistics are summed from the continuous aggregate once it exists."""
+    stats_queries = []
+
+    async def mock_fetchval(query, *args):
+        stats_queries.append(query)
+        return {"upload_statistics": {}, "security_statistics": {}, "ip_addresses": [], "recent_events": []}
+
+    monkeypatch.setattr(db_operations.db, "fetchval", mock_fetchval)
+    db_operations.db.security_rollup = True
+
+    await db_operations.security_events.get_upload_source_analysis("123")
+
+    security_statistics = stats_queries[0].split("'security_statistics'")[1].split("'ip_addresses'")[0]
+    assert "SUM(event_count)" in security_statistics
+    assert "FROM security_events_by_system" in security_statistics
+
+
+@pytest.mark.asyncio
+async def test_security_events_metadata_containment_filter(db_operations, monkeypatch):
+    """Test the metadata filter becomes a jsonb containment condition with the dict as its parameter."""
+    captured = {}
+
+    async def mock_fetch(query, *args, record_class=None):
+        captured["query"], captured["args"] = query, args
+        return []
+
+    monkeypatch.setattr(db_operations.db, "fetch", mock_fetch)
+
+    await db_operations.security_events.get_security_events(
+        limit=10, severity="medium", metadata_contains={"limit_type": "per_minute"}
+    )
+
+    assert "severity = $1" in captured["query"]
+    assert "metadata @> $2" in captured["query"]
+    assert captured["args"] == ("medium", {"limit_type": "per_minute"}, 10, 0)
+
+
+@pytest.mark.asyncio
+async def test_iter_security_events_streams_filtered_rows(db_operations, monkeypatch):
+    """Test streaming security events binds every filter, including metadata containment."""
+    captured = {}
+    event = SecurityEvent(event_type="upload_rejected", source_ip="10.0.0.1", description="Rejected")
+
+    async def mock_iterate(query, *args, record_class=None):
+        captured["query"], captured["args"] = query, args
+        for _ in range(2):
+            yield event.model_dump()
+
+    monkeypatch.setattr(db_operations.db, "iterate", mock_iterate, raising=False)
+
+    unfiltered = [e async for e in db_operations.security_events.iter_security_events(limit=5)]
+    assert [e.event_id for e in unfiltered] == [event.event_id, event.event_id]
+    assert captured["args"] == (5, 0)
+
+    filtered = db_operations.security_events.iter_security_events(
+        source_ip="10.0.0.1", metadata_contains={"reason": "size"}
+    )
+    assert len([e async for e in filtered]) == 2
+    assert "source_ip = $1" in captured["query"] and "metadata @> $2" in captured["query"]
+    assert captured["args"] == ("10.0.0.1", {"reason": "size"}, 100, 0)
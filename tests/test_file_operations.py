@@ -0,0 +1,96 @@
+"""Tests for async file operations."""
+
+import errno
+import os
+
+import pytest
+
+from stable_squirrel.utils.file_operations import AsyncFileManager, StreamingUploadProcessor
+
+
+async def chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+@pytest.mark.asyncio
+async def test_save_upload_stream_writes_tracked_temp_file():
+    """Test a streamed upload lands in a tracked temp file with the original suffix."""
+    manager = AsyncFileManager()
+
+    path = await manager.save_upload_stream(chunks(b"ID3", b"data"), "call.mp3")
+
+    try:
+        assert path.read_bytes() == b"ID3data"
+        assert path.suffix == ".mp3" and path.name.startswith("stream_")
+        assert list(manager._temp_files) == [path]
+    finally:
+        await manager.cleanup_all()
+    assert not path.exists()
+
+
+@pytest.mark.asyncio
+async def test_save_upload_stream_removes_oversized_file():
+    """Test a stream over the size limit is rejected and its temp file removed."""
+    manager = AsyncFileManager()
+
+    with pytest.raises(ValueError, match="exceeds maximum"):
+        await manager.save_upload_stream(chunks(b"x" * 10, b"x" * 10), "call.mp3", max_size=15)
+
+    assert manager._temp_files == {}
+
+
+@pytest.mark.asyncio
+async def test_cleanup_all_with_max_age_keeps_newer_files(monkeypatch):
+    """Test only files tracked for longer than max_age_seconds are cleaned up."""
+    now = [1000.0]
+    monkeypatch.setattr("stable_squirrel.utils.file_operations.time.monotonic", lambda: now[0])
+    manager = AsyncFileManager()
+
+    old = await manager.save_upload_stream(chunks(b"old"), "old.mp3")
+    now[0] += 60
+    new = await manager.save_upload_stream(chunks(b"new"), "new.mp3")
+
+    assert await manager.cleanup_all(max_age_seconds=30) == 1
+    assert not old.exists() and new.exists()
+    assert await manager.cleanup_all() == 1
+    assert not new.exists()
+
+
+@pytest.mark.asyncio
+async def test_process_upload_content_writes_temp_file():
+    """Test in-memory upload content is written to a temp file."""
+    path = await StreamingUploadProcessor().process_upload_content(b"audio", "call.mp3")
+
+    try:
+        assert path.read_bytes() == b"audio"
+        assert path.suffix == ".mp3" and path.name.startswith("upload_")
+    finally:
+        path.unlink()
+
+
+@pytest.mark.asyncio
+async def test_copy_file_async_copies_contents(tmp_path):
+    """Test a file is copied byte for byte."""
+    source, dest = tmp_path / "source.mp3", tmp_path / "dest.mp3"
+    source.write_bytes(bytes(range(256)) * 1000)
+
+    await AsyncFileManager().copy_file_async(source, dest)
+
+    assert dest.read_bytes() == source.read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_copy_file_async_falls_back_without_kernel_copy(tmp_path, monkeypatch):
+    """Test a cross-filesystem copy_file_range() failure falls back to shutil.copyfile()."""
+
+    def cross_device(*args):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "copy_file_range", cross_device, raising=False)
+    source, dest = tmp_path / "source.mp3", tmp_path / "dest.mp3"
+    source.write_bytes(b"audio" * 1000)
+
+    await AsyncFileManager().copy_file_async(source, dest)
+
+    assert dest.read_bytes() == source.read_bytes()
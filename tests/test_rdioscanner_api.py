@@ -1,7 +1,7 @@
 """Tests for RdioScanner API endpoints."""
 
 import io
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import FastAPI
@@ -25,6 +25,8 @@ def app():
     app.state.config = config
     app.state.transcription_service = AsyncMock()
     app.state.db_manager = AsyncMock()  # Add mock db_manager
+    # Security events are handed to the batch writer synchronously
+    app.state.db_manager.security_event_writer = MagicMock()
 
     return app
 
@@ -326,3 +328,22 @@ def test_datetime_conversion():
     assert call_timestamp.year == 2023
     assert call_timestamp.month == 12
     assert call_timestamp.day == 30
+
+
+@pytest.mark.asyncio
+async def test_write_audio_to_temp_file_streams_upload_file():
+    """Test a spooled UploadFile is copied to the temp file whole, from the start, without reading it first."""
+    from fastapi import UploadFile
+
+    from stable_squirrel.web.routes.rdioscanner import write_audio_to_temp_file
+
+    content = b"ID3\x03\x00\x00\x00\x00\x00\x00\xff\xfb\x90\x00" + b"\x01" * 5000
+    upload = UploadFile(file=io.BytesIO(content), size=len(content), filename="call.mp3")
+    await upload.read(4096)  # Validation leaves the position anywhere
+
+    path = await write_audio_to_temp_file(upload, ".mp3")
+    try:
+        assert path.suffix == ".mp3"
+        assert path.read_bytes() == content
+    finally:
+        path.unlink()
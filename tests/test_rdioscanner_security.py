@@ -1,7 +1,8 @@
 """Tests for RdioScanner API security validation."""
 
 import io
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
 from fastapi import FastAPI
@@ -49,6 +50,13 @@ def security_enabled_app():
         }
     )
 
+    # Hot inserts go through fetchrow_hot; serve them the same row
+    db_manager.fetchrow_hot = db_manager.fetchrow
+
+    # Security events are handed to the batch writer synchronously
+    db_manager.security_event_writer = MagicMock()
+    db_manager.security_event_writer.submit.return_value = True
+
     app.state.db_manager = db_manager
 
     return app
@@ -60,7 +68,7 @@ def security_client(security_enabled_app):
     # Mock the task queue for all security tests
     with patch("stable_squirrel.services.task_queue.get_task_queue") as mock_get_queue:
         mock_queue = AsyncMock()
-        mock_queue.enqueue_task = AsyncMock(return_value="test-task-id")
+        mock_queue.enqueue_task = AsyncMock(return_value=uuid4().bytes)
         mock_get_queue.return_value = mock_queue
         yield TestClient(security_enabled_app)
 
@@ -70,13 +78,28 @@ def valid_mp3_file():
     """Create a valid MP3 file that passes security validation."""
     # Create a proper MP3 file with ID3 header and some audio data
     id3_header = b"ID3\x03\x00\x00\x00\x00\x00\x00"  # ID3v2.3 header
-    audio_data = b"\x00\x01" * 600  # Sample audio data to make it large enough
+    audio_data = b"\xff\xfb\x90\x00" + b"\x00\x01" * 600  # MP3 frame and sample audio data
 
     content = id3_header + audio_data
 
     return io.BytesIO(content)
 
 
+def test_security_events_written_directly_when_writer_queue_full(security_client, security_enabled_app):
+    """Test a blocked upload's event is inserted inline when the batch writer drops it."""
+    db_manager = security_enabled_app.state.db_manager
+    db_manager.security_event_writer.submit.return_value = False
+
+    files = {"audio": ("tiny.mp3", io.BytesIO(b"tiny"), "audio/mpeg")}
+    data = {"key": "test-api-key", "system": "123", "dateTime": 1703980800}
+    response = security_client.post("/api/call-upload", files=files, data=data)
+
+    assert response.status_code == 400
+    db_manager.security_event_writer.submit.assert_called_once()
+    statements = [call.args[0] for call in db_manager.fetchrow_hot.await_args_list]
+    assert statements == ["insert_security_event"]
+
+
 def test_security_file_too_large(security_client):
     """Test that files exceeding size limit are rejected."""
     # Create a file larger than 1MB limit
@@ -0,0 +1,98 @@
+"""Tests for the in-process record cache."""
+
+from uuid import uuid4
+
+from stable_squirrel.database.cache import RADIO_CALL, TRANSCRIPTION, RecordCache
+
+
+def test_record_cache_evicts_least_recently_used():
+    """Test the oldest untouched entry is evicted once the cache is full."""
+    cache = RecordCache(max_entries=2, ttl_seconds=60)
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    cache.set(RADIO_CALL, first, "a", cache.generation(first))
+    cache.set(RADIO_CALL, second, "b", cache.generation(second))
+    assert cache.get(RADIO_CALL, first) == "a"  # first is now most recently used
+    cache.set(RADIO_CALL, third, "c", cache.generation(third))
+
+    assert cache.get(RADIO_CALL, second) is None
+    assert cache.get(RADIO_CALL, first) == "a"
+    assert cache.get(RADIO_CALL, third) == "c"
+
+
+def test_record_cache_expires_entries(monkeypatch):
+    """Test entries are dropped after their TTL."""
+    now = [1000.0]
+    monkeypatch.setattr("stable_squirrel.database.cache.time.monotonic", lambda: now[0])
+    cache = RecordCache(max_entries=10, ttl_seconds=5)
+    call_id = uuid4()
+
+    cache.set(TRANSCRIPTION, call_id, "row", cache.generation(call_id))
+    now[0] += 4
+    assert cache.get(TRANSCRIPTION, call_id) == "row"
+    now[0] += 2
+    assert cache.get(TRANSCRIPTION, call_id) is None
+    assert len(cache) == 0
+
+
+def test_record_cache_invalidate_drops_all_kinds():
+    """Test invalidating a call removes every cached view of it but nothing else."""
+    cache = RecordCache(max_entries=10, ttl_seconds=60)
+    call_id, other_id = uuid4(), uuid4()
+    cache.set(RADIO_CALL, call_id, "call", cache.generation(call_id))
+    cache.set(TRANSCRIPTION, call_id, "transcription", cache.generation(call_id))
+    cache.set(RADIO_CALL, other_id, "other", cache.generation(other_id))
+
+    cache.invalidate(call_id)
+
+    assert cache.get(RADIO_CALL, call_id) is None
+    assert cache.get(TRANSCRIPTION, call_id) is None
+    assert cache.get(RADIO_CALL, other_id) == "other"
+
+
+def test_record_cache_disabled_with_zero_size():
+    """Test a zero-sized cache never stores anything."""
+    cache = RecordCache(max_entries=0, ttl_seconds=60)
+    call_id = uuid4()
+    cache.set(RADIO_CALL, call_id, "row", cache.generation(call_id))
+
+    assert len(cache) == 0
+
+
+def test_record_cache_skips_values_fetched_before_invalidation():
+    """Test a value read before a concurrent invalidation is not cached, while later reads are."""
+    cache = RecordCache(max_entries=10, ttl_seconds=60)
+    call_id = uuid4()
+
+    stale_generation = cache.generation(call_id)
+    cache.invalidate(call_id)
+    cache.set(RADIO_CALL, call_id, "stale", stale_generation)
+    assert cache.get(RADIO_CALL, call_id) is None
+
+    cache.set(RADIO_CALL, call_id, "fresh", cache.generation(call_id))
+    assert cache.get(RADIO_CALL, call_id) == "fresh"
+
+
+def test_record_cache_generation_survives_forgetting_the_call():
+    """Test a generation taken before an invalidation stays stale after the call's stamp is evicted."""
+    cache = RecordCache(max_entries=1, ttl_seconds=60)
+    call_id, other_id = uuid4(), uuid4()
+
+    stale_generation = cache.generation(call_id)
+    cache.invalidate(call_id)
+    cache.invalidate(other_id)  # Evicts call_id's stamp
+    cache.set(RADIO_CALL, call_id, "stale", stale_generation)
+
+    assert cache.get(RADIO_CALL, call_id) is None
+
+
+def test_record_cache_clear_skips_values_being_fetched():
+    """Test clearing the cache also drops values whose fetch started before the clear."""
+    cache = RecordCache(max_entries=10, ttl_seconds=60)
+    call_id = uuid4()
+
+    generation = cache.generation(call_id)
+    cache.clear()
+    cache.set(TRANSCRIPTION, call_id, "stale", generation)
+
+    assert len(cache) == 0
@@ -0,0 +1,276 @@
+"""Tests for the database schema DDL."""
+
+import re
+
+import pytest
+
+from stable_squirrel.database.schema import create_schema, ensure_rum_index, ensure_timescale_setup
+
+
+class RecordingDatabaseManager:
+    """Captures every DDL statement create_schema() executes."""
+
+    def __init__(
+        self,
+        available_extensions=(),
+        installed_extensions=(),
+        invalid_indexes=(),
+        build_error=None,
+        compression_settings=None,
+        failing_statements=(),
+    ):
+        self.statements = []
+        self.executed = 0
+        self.sessions = []
+        self.available_extensions = available_extensions
+        self.installed_extensions = installed_extensions
+        self.invalid_indexes = set(invalid_indexes)
+        # Raised by every concurrent index build, as (exception, whether it leaves an INVALID index)
+        self.build_error = build_error
+        # Current (segmentby, orderby) per hypertable, as TimescaleDB reports them
+        self.compression_settings = compression_settings or {}
+        # Statement prefixes the database rejects
+        self.failing_statements = failing_statements
+
+    async def execute(self, query: str, *args) -> str:
+        self.executed += 1
+        # Scripts are recorded statement by statement
+        statements = [" ".join(s.split()) for s in re.findall(r"[^;]*[^;\s][^;]*;?", query)]
+        if self.failing_statements and any(s.startswith(self.failing_statements) for s in statements):
+            raise RuntimeError("statement rejected")
+        self.statements.extend(statements)
+        return "OK"
+
+    async def execute_session(self, *queries: str) -> None:
+        self.sessions.append(queries)
+        if self.build_error:
+            error, leaves_invalid = self.build_error
+            if leaves_invalid:
+                self.invalid_indexes.add(re.search(r"EXISTS (\w+)", queries[-1]).group(1))
+            raise error
+        for query in queries:
+            await self.execute(query)
+
+    async def fetchval(self, query: str, *args) -> int:
+        if "indisvalid" in query:
+            return args[0] in self.invalid_indexes
+        if "pg_available_extensions" in query:
+            return sum(name in query for name in self.available_extensions)
+        if "pg_extension" in query:
+            return sum(name in query for name in self.installed_extensions)
+        return 0
+
+    async def fetchrow(self, query: str, *args):
+        if "compression_settings" in query and args[0] in self.compression_settings:
+            segmentby, orderby = self.compression_settings[args[0]]
+            return {"segmentby": segmentby, "orderby": orderby}
+        return None
+
+
+async def schema_ddl() -> list[str]:
+    """Run create_schema() against a recorder and return the normalized statements."""
+    db = RecordingDatabaseManager()
+    await create_schema(db)
+    return db.statements
+
+
+@pytest.mark.asyncio
+async def test_transcript_search_uses_stored_tsvector():
+    """Test full-text search is indexed on the stored tsv column, not an expression."""
+    ddl = await schema_ddl()
+    transcriptions = next(s for s in ddl if s.startswith("CREATE TABLE IF NOT EXISTS transcriptions"))
+    assert "tsv TSVECTOR GENERATED ALWAYS AS (to_tsvector('english', full_transcript)) STORED" in transcriptions
+
+    assert "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_transcriptions_tsv ON transcriptions USING GIN(tsv)" in ddl
+    assert not any(re.search(r"CREATE INDEX.*to_tsvector", statement) for statement in ddl)
+
+
+@pytest.mark.asyncio
+async def test_rum_index_created_when_extension_available():
+    """Test the RUM index is only created, and reported usable, when the extension can be installed."""
+    missing = RecordingDatabaseManager()
+    assert await ensure_rum_index(missing) is False
+    assert missing.statements == []
+
+    db = RecordingDatabaseManager(available_extensions=("rum",))
+    assert await ensure_rum_index(db) is True
+    assert db.statements[0] == "CREATE EXTENSION IF NOT EXISTS rum"
+    assert db.statements[-1] == (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_transcriptions_tsv_rum "
+        "ON transcriptions USING rum (tsv rum_tsvector_ops)"
+    )
+
+
+@pytest.mark.asyncio
+async def test_timestamp_indexes_match_newest_first_ordering():
+    """Test every index that includes timestamp orders it DESC, matching ORDER BY timestamp DESC."""
+    ddl = await schema_ddl()
+    timestamp_indexes = [s for s in ddl if s.startswith("CREATE INDEX") and "timestamp" in s and "BRIN" not in s]
+
+    assert timestamp_indexes
+    for statement in timestamp_indexes:
+        assert "timestamp DESC" in statement, statement
+
+
+@pytest.mark.asyncio
+async def test_search_indexes_cover_every_listing_column():
+    """Test each filtered search index holds all columns the radio call listing selects."""
+    from stable_squirrel.database.records import RADIO_CALL_COLUMNS
+
+    ddl = await schema_ddl()
+    for name, key in (
+        ("idx_calls_frequency_search", "frequency"),
+        ("idx_calls_talkgroup_search", "talkgroup_id"),
+        ("idx_calls_system_search", "system_id"),
+    ):
+        statement = next(s for s in ddl if f" {name} " in s)
+        keys, include = re.search(r"\((.*?)\) INCLUDE \((.*?)\)", statement).groups()
+        assert keys == f"{key}, timestamp DESC"
+        assert {key, "timestamp", *include.split(", ")} == set(RADIO_CALL_COLUMNS)
+
+
+@pytest.mark.asyncio
+async def test_hypertables_compress_newest_first_with_policies():
+    """Test both hypertables compress ordered by timestamp DESC, with a policy and a backfill each."""
+    db = RecordingDatabaseManager(installed_extensions=("timescaledb",))
+    await ensure_timescale_setup(db)
+
+    for table in ("radio_calls", "security_events"):
+        settings = next(s for s in db.statements if s.startswith(f"ALTER TABLE {table} SET"))
+        assert "timescaledb.compress_orderby = 'timestamp DESC'" in settings
+        assert f"SELECT add_compression_policy('{table}', INTERVAL '30 days', if_not_exists => TRUE)" in db.statements
+        assert any(f"FROM show_chunks('{table}', older_than => INTERVAL '30 days')" in s for s in db.statements)
+
+
+@pytest.mark.asyncio
+async def test_matching_compression_settings_not_altered_again():
+    """Test compression settings are only re-applied to hypertables whose settings differ."""
+    db = RecordingDatabaseManager(
+        installed_extensions=("timescaledb",),
+        compression_settings={
+            "radio_calls": ("frequency, talkgroup_id", "timestamp DESC"),
+            "security_events": ("event_type, severity", "timestamp"),
+        },
+    )
+    await ensure_timescale_setup(db)
+
+    altered = [s for s in db.statements if s.startswith("ALTER TABLE")]
+    assert len(altered) == 1
+    assert altered[0].startswith("ALTER TABLE security_events SET")
+
+
+@pytest.mark.asyncio
+async def test_rejected_compression_settings_do_not_skip_later_steps():
+    """Test a rejected compression ALTER still leaves the policies, history sweep and rollup set up."""
+    db = RecordingDatabaseManager(installed_extensions=("timescaledb",), failing_statements=("ALTER TABLE",))
+    await ensure_timescale_setup(db)
+
+    for table in ("radio_calls", "security_events"):
+        assert f"SELECT add_compression_policy('{table}', INTERVAL '30 days', if_not_exists => TRUE)" in db.statements
+        assert any(f"FROM show_chunks('{table}', older_than => INTERVAL '30 days')" in s for s in db.statements)
+    assert any(s.startswith("CREATE MATERIALIZED VIEW IF NOT EXISTS security_events_by_system") for s in db.statements)
+    assert any(s.startswith("SELECT add_continuous_aggregate_policy") for s in db.statements)
+
+
+@pytest.mark.asyncio
+async def test_create_schema_is_a_single_round_trip():
+    """Test tables and hypertable indexes go as one script; only concurrent builds run separately."""
+    db = RecordingDatabaseManager()
+    await create_schema(db)
+
+    assert db.executed == 1 + sum(len(session) for session in db.sessions)
+    assert db.statements[0].startswith("CREATE TABLE IF NOT EXISTS radio_calls")
+
+
+@pytest.mark.asyncio
+async def test_plain_table_indexes_built_concurrently():
+    """Test transcriptions/speaker_segments indexes build CONCURRENTLY, each in its own session."""
+    db = RecordingDatabaseManager()
+    await create_schema(db)
+
+    builds = [session[-1] for session in db.sessions]
+    assert {re.search(r"EXISTS (\w+)", build).group(1) for build in builds} == {
+        "idx_transcriptions_tsv",
+        "idx_segments_speaker",
+        "idx_segments_timing",
+    }
+    for session in db.sessions:
+        assert session[0] == "SET max_parallel_maintenance_workers = 4"
+        assert session[-1].startswith("CREATE INDEX CONCURRENTLY IF NOT EXISTS")
+
+    hypertable_indexes = [s for s in db.statements if s.startswith("CREATE INDEX") and "CONCURRENTLY" not in s]
+    assert all(" ON radio_calls " in s or " ON security_events " in s for s in hypertable_indexes)
+
+
+@pytest.mark.asyncio
+async def test_invalid_index_from_earlier_build_is_rebuilt():
+    """Test an INVALID index left by an interrupted build is dropped before building, and valid ones are kept."""
+    db = RecordingDatabaseManager(invalid_indexes=("idx_segments_speaker",))
+    await create_schema(db)
+
+    drops = [s for s in db.statements if s.startswith("DROP INDEX CONCURRENTLY")]
+    assert drops == ["DROP INDEX CONCURRENTLY IF EXISTS idx_segments_speaker"]
+    assert len(db.sessions) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("leaves_invalid", [False, True])
+async def test_failed_index_build_only_drops_invalid_index(leaves_invalid):
+    """Test a failed build drops the index only when it left an INVALID one, never a valid existing index."""
+    db = RecordingDatabaseManager(
+        available_extensions=("rum",), build_error=(ConnectionError("connection lost"), leaves_invalid)
+    )
+    assert await ensure_rum_index(db) is False
+
+    drops = [s for s in db.statements if s.startswith("DROP INDEX CONCURRENTLY")]
+    assert drops == (["DROP INDEX CONCURRENTLY IF EXISTS idx_transcriptions_tsv_rum"] if leaves_invalid else [])
+
+
+@pytest.mark.asyncio
+async def test_radio_calls_time_ranges_have_brin_index():
+    """Test radio_calls carries a BRIN summary on timestamp for wide range scans."""
+    ddl = await schema_ddl()
+
+    assert (
+        "CREATE INDEX IF NOT EXISTS idx_calls_timestamp_brin "
+        "ON radio_calls USING BRIN (timestamp) WITH (pages_per_range = 16);"
+    ) in ddl
+
+
+@pytest.mark.asyncio
+async def test_security_event_time_index_is_brin():
+    """Test security_events relies on its primary key plus BRIN for time, not another B-tree."""
+    ddl = await schema_ddl()
+    security_indexes = [s for s in ddl if s.startswith("CREATE INDEX") and " ON security_events " in s]
+
+    assert (
+        "CREATE INDEX IF NOT EXISTS idx_security_events_timestamp_brin "
+        "ON security_events USING BRIN (timestamp) WITH (pages_per_range = 32);"
+    ) in security_indexes
+    assert not any("ON security_events (timestamp" in s for s in security_indexes)
+    for column in ("source_ip", "source_system"):
+        assert any(s.endswith(f"WHERE {column} IS NOT NULL;") for s in security_indexes)
+
+
+@pytest.mark.asyncio
+async def test_status_index_only_covers_unfinished_calls():
+    """Test the transcription status index excludes completed calls."""
+    ddl = await schema_ddl()
+
+    assert "DROP INDEX IF EXISTS idx_calls_status;" in ddl
+    status_index = next(s for s in ddl if " idx_calls_unfinished " in s)
+    assert status_index.endswith("WHERE transcription_status IN ('pending', 'processing', 'failed');")
+
+
+@pytest.mark.asyncio
+async def test_security_rollup_is_a_real_time_continuous_aggregate():
+    """Test the per-system security rollup is a refreshed, real-time continuous aggregate."""
+    db = RecordingDatabaseManager(installed_extensions=("timescaledb",))
+    await ensure_timescale_setup(db)
+
+    view = next(s for s in db.statements if s.startswith("CREATE MATERIALIZED VIEW"))
+    assert "security_events_by_system" in view
+    assert "timescaledb.continuous, timescaledb.materialized_only = false" in view
+    assert "GROUP BY bucket, source_system, event_type, severity" in view
+    policy = "SELECT add_continuous_aggregate_policy('security_events_by_system'"
+    assert any(s.startswith(policy) for s in db.statements)
@@ -110,6 +110,20 @@ def test_get_security_events_with_filters(client, app, sample_security_event):
     assert call_args.kwargs["limit"] == 50
 
 
+def test_get_security_events_metadata_filter(client, app, sample_security_event):
+    """Test the metadata filter is parsed as a JSON object and rejected otherwise."""
+    app.state.mock_security_ops.get_security_events.return_value = [sample_security_event]
+
+    response = client.get('/events?metadata={"limit_type": "per_minute"}')
+
+    assert response.status_code == 200
+    call_args = app.state.mock_security_ops.get_security_events.call_args
+    assert call_args.kwargs["metadata_contains"] == {"limit_type": "per_minute"}
+
+    for bad in ("not-json", "[1, 2]"):
+        assert client.get(f"/events?metadata={bad}").status_code == 400
+
+
 def test_get_upload_source_analysis(client, app, sample_security_event):
     """Test getting upload source analysis."""
     analysis_data = {
@@ -138,13 +152,23 @@ def test_get_upload_source_analysis(client, app, sample_security_event):
 
 def test_get_security_summary(client, app, sample_security_event):
     """Test getting security summary."""
-    app.state.mock_security_ops.get_security_events.return_value = [sample_security_event]
+    critical_event = sample_security_event.model_copy(update={"severity": "critical", "source_ip": "10.0.0.1"})
+
+    async def stream_events(**kwargs):
+        for event in (critical_event, sample_security_event):
+            yield event
+
+    app.state.mock_security_ops.iter_security_events = MagicMock(side_effect=stream_events)
 
     response = client.get("/summary?hours=24")
 
     assert response.status_code == 200
     data = response.json()
 
+    assert data["total_events"] == 2
+    assert data["events_by_severity"] == {"critical": 1, "info": 1}
+    assert [event["severity"] for event in data["recent_violations"]] == ["critical"]
+    assert data["top_source_systems"] == [{"system_id": "test-system", "event_count": 2}]
     assert "total_events" in data
     assert "events_by_severity" in data
     assert "recent_violations" in data
@@ -0,0 +1,127 @@
+"""Tests for the batched security event writer."""
+
+import asyncio
+import json
+
+import pytest
+
+from stable_squirrel.database.event_writer import SecurityEventWriter
+from stable_squirrel.database.models import SecurityEvent
+
+
+class RecordingDatabaseManager:
+    """Captures the statements the writer executes."""
+
+    def __init__(self, delay: float = 0.0):
+        self.executed = []
+        self.delay = delay
+
+    async def fetchrow_hot(self, key: str, *args):
+        await asyncio.sleep(self.delay)
+        self.executed.append((key, args))
+        return None
+
+
+def make_event(index: int, **overrides) -> SecurityEvent:
+    return SecurityEvent(
+        event_type="api_key_used",
+        source_ip="10.0.0.1",
+        description=f"Event {index}",
+        **overrides,
+    )
+
+
+@pytest.mark.asyncio
+async def test_writer_batches_queued_events_into_one_insert():
+    """Test events submitted together are written by a single multi-row insert."""
+    db = RecordingDatabaseManager()
+    writer = SecurityEventWriter(db)
+    writer.start()
+
+    events = [make_event(i, metadata={"n": i} if i else None) for i in range(3)]
+    assert all(writer.submit(event) for event in events)
+    await asyncio.sleep(0.2)
+    await writer.stop()
+
+    (key, columns), *rest = db.executed
+    assert rest == []
+    assert key == "insert_security_events"
+    assert columns[0] == [event.event_id for event in events]
+    assert columns[8] == ["Event 0", "Event 1", "Event 2"]
+    assert columns[9] == [None, '{"n":1}', '{"n":2}']
+    assert writer.written == 3
+
+
+@pytest.mark.asyncio
+async def test_writer_stop_flushes_pending_events():
+    """Test stopping the writer writes events that were queued but not yet flushed."""
+    db = RecordingDatabaseManager()
+    writer = SecurityEventWriter(db)
+
+    writer.submit(make_event(0))
+    await writer.stop()
+
+    assert len(db.executed) == 1
+    assert writer.written == 1
+
+
+@pytest.mark.asyncio
+async def test_writer_stop_writes_batch_being_collected():
+    """Test events already taken off the queue for a batch are written when stopping mid-window."""
+    db = RecordingDatabaseManager()
+    writer = SecurityEventWriter(db)
+    writer.start()
+
+    for i in range(5):
+        writer.submit(make_event(i))
+    await asyncio.sleep(0.01)
+    await writer.stop()
+
+    assert writer.written == 5
+    assert len(db.executed[0][1][0]) == 5
+
+
+@pytest.mark.asyncio
+async def test_writer_stop_waits_for_insert_in_progress():
+    """Test stopping during a batch insert lets it finish instead of cancelling it."""
+    db = RecordingDatabaseManager(delay=0.1)
+    writer = SecurityEventWriter(db)
+    writer.start()
+
+    for i in range(3):
+        writer.submit(make_event(i))
+    await asyncio.sleep(0.15)  # Past the flush window, with the insert still running
+    writer.submit(make_event(3))
+    await writer.stop()
+
+    assert writer.written == 4
+    assert [len(columns[0]) for _, columns in db.executed] == [3, 1]
+
+
+@pytest.mark.asyncio
+async def test_writer_drops_events_when_queue_full():
+    """Test submit never blocks: overflow is dropped and counted."""
+    writer = SecurityEventWriter(RecordingDatabaseManager(), max_queued=2)
+
+    results = [writer.submit(make_event(i)) for i in range(3)]
+
+    assert results == [True, True, False]
+    assert writer.dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_tallied_events_written_as_one_summary_per_source():
+    """Test tallied events become a single counted event per source when flushed."""
+    db = RecordingDatabaseManager()
+    writer = SecurityEventWriter(db)
+
+    for _ in range(3):
+        writer.tally("api_key_used", "10.0.0.1", "100", "station-...")
+    writer.tally("api_key_used", "10.0.0.2", "200", "station-...")
+    await writer.stop()
+
+    (key, columns), *rest = db.executed
+    assert rest == []
+    assert columns[2] == ["api_key_used", "api_key_used"]
+    assert columns[4] == ["10.0.0.1", "10.0.0.2"]
+    assert [json.loads(metadata)["count"] for metadata in columns[9]] == [3, 1]
@@ -1,10 +1,12 @@
 """Tests for security validation."""
 
+import re
 from unittest.mock import MagicMock
 
 import pytest
 
 from stable_squirrel.security import AudioFileValidator, SecurityConfig, ValidationError
+from stable_squirrel.security.upload_validation import CONTENT_PREFIX_BYTES
 
 
 def create_async_mock_file(filename, content_type, content):
@@ -15,8 +17,8 @@ def create_async_mock_file(filename, content_type, content):
     mock_file.size = len(content)
 
     # Make read() async
-    async def async_read():
-        return content
+    async def async_read(size=-1):
+        return content if size < 0 else content[:size]
 
     mock_file.read = async_read
 
@@ -49,7 +51,7 @@ def validator(security_config):
 def mock_mp3_file_for_rejection():
     """Create a mock MP3 file for testing WAV rejection (now contains valid MP3 content)."""
     # Create a minimal valid MP3 file with ID3 header
-    content = b"ID3\x03\x00\x00\x00\x00\x00\x00" + b"\x00" * 1100  # Make it large enough
+    content = b"ID3\x03\x00\x00\x00\x00\x00\x00\xff\xfb\x90\x00" + b"\x00" * 1100  # Make it large enough
 
     mock_file = MagicMock()
     mock_file.filename = "test.wav"  # Keep .wav to test rejection
@@ -57,8 +59,8 @@ def mock_mp3_file_for_rejection():
     mock_file.size = len(content)
 
     # Make read() async
-    async def async_read():
-        return content
+    async def async_read(size=-1):
+        return content if size < 0 else content[:size]
 
     mock_file.read = async_read
 
@@ -74,7 +76,7 @@ def mock_mp3_file_for_rejection():
 def mock_mp3_file():
     """Create a mock MP3 file."""
     # Create a minimal MP3 file with ID3 header
-    content = b"ID3\x03\x00\x00\x00\x00\x00\x00" + b"\x00" * 100
+    content = b"ID3\x03\x00\x00\x00\x00\x00\x00\xff\xfb\x90\x00" + b"\x00" * 100
 
     mock_file = MagicMock()
     mock_file.filename = "test.mp3"
@@ -82,8 +84,8 @@ def mock_mp3_file():
     mock_file.size = len(content)
 
     # Make read() async
-    async def async_read():
-        return content
+    async def async_read(size=-1):
+        return content if size < 0 else content[:size]
 
     mock_file.read = async_read
 
@@ -213,7 +215,7 @@ async def test_empty_file_content(validator):
 @pytest.mark.asyncio
 async def test_rate_limiting_per_minute(validator):
     """Test per-minute rate limiting."""
-    content = b"ID3\x03\x00\x00\x00\x00\x00\x00" + b"\x00" * 1100  # Valid MP3 header
+    content = b"ID3\x03\x00\x00\x00\x00\x00\x00\xff\xfb\x90\x00" + b"\x00" * 1100  # Valid MP3 header
     mock_file = create_async_mock_file("test.mp3", "audio/mpeg", content)
 
     client_ip = "192.168.1.100"
@@ -230,7 +232,7 @@ async def test_rate_limiting_per_minute(validator):
 @pytest.mark.asyncio
 async def test_rate_limiting_different_ips(validator):
     """Test that rate limiting is per-IP."""
-    content = b"ID3\x03\x00\x00\x00\x00\x00\x00" + b"\x00" * 1100  # Valid MP3 header
+    content = b"ID3\x03\x00\x00\x00\x00\x00\x00\xff\xfb\x90\x00" + b"\x00" * 1100  # Valid MP3 header
     mock_file = create_async_mock_file("test.mp3", "audio/mpeg", content)
 
     # Upload 5 files from first IP
@@ -340,3 +342,190 @@ async def test_ogg_file_rejection(validator):
 
     with pytest.raises(ValidationError, match="Invalid file extension '.ogg'"):
         await validator.validate_upload_file(mock_file, "192.168.1.1")
+
+
+@pytest.mark.asyncio
+async def test_content_validation_reads_only_file_prefix(validator):
+    """Test content checks read a bounded prefix rather than the whole upload."""
+    content = b"ID3\x03\x00\x00\x00\x00\x00\x00\xff\xfb\x90\x00" + b"\x00" * 100_000
+    mock_file = create_async_mock_file("large.mp3", "audio/mpeg", content)
+    read_sizes = []
+
+    async def recording_read(size=-1):
+        read_sizes.append(size)
+        return content if size < 0 else content[:size]
+
+    mock_file.read = recording_read
+    validator.config.max_file_size = len(content)
+
+    await validator.validate_upload_file(mock_file, "192.168.1.1")
+
+    assert read_sizes == [CONTENT_PREFIX_BYTES]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_weights_previous_minute_by_overlap(validator, monkeypatch):
+    """Test the previous minute's uploads count only for the part still inside the trailing minute."""
+    content = b"ID3\x03\x00\x00\x00\x00\x00\x00\xff\xfb\x90\x00" + b"\x00" * 1100  # Valid MP3 header
+    mock_file = create_async_mock_file("test.mp3", "audio/mpeg", content)
+    now = [60_000.0 + 30]
+    monkeypatch.setattr("stable_squirrel.security.upload_validation.time.time", lambda: now[0])
+
+    for _ in range(5):
+        await validator.validate_upload_file(mock_file, "192.168.1.50")
+
+    # 10s into the next minute, 5 * 50/60 of the previous uploads still count
+    now[0] = 60_060.0 + 10
+    await validator.validate_upload_file(mock_file, "192.168.1.50")
+    with pytest.raises(ValidationError, match="Rate limit exceeded.*per minute"):
+        await validator.validate_upload_file(mock_file, "192.168.1.50")
+
+    # Two minutes later the old window no longer counts at all
+    now[0] = 60_180.0
+    await validator.validate_upload_file(mock_file, "192.168.1.50")
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_counters_expire_idle_ips(validator, monkeypatch):
+    """Test IPs idle for two full windows are swept from the rate limit counters, but only periodically."""
+    content = b"ID3\x03\x00\x00\x00\x00\x00\x00\xff\xfb\x90\x00" + b"\x00" * 1100  # Valid MP3 header
+    mock_file = create_async_mock_file("test.mp3", "audio/mpeg", content)
+    now = [60_000.0]
+    monkeypatch.setattr("stable_squirrel.security.upload_validation.time.time", lambda: now[0])
+    validator._last_sweep = now[0]
+
+    await validator.validate_upload_file(mock_file, "192.168.1.1")
+    await validator.validate_upload_file(mock_file, "192.168.1.2")
+
+    now[0] += 120
+    await validator.validate_upload_file(mock_file, "192.168.1.2")
+    assert list(validator._minute_counters) == ["192.168.1.1", "192.168.1.2"]
+
+    now[0] += 180
+    await validator.validate_upload_file(mock_file, "192.168.1.2")
+    assert list(validator._minute_counters) == ["192.168.1.2"]
+    assert list(validator._hour_counters) == ["192.168.1.1", "192.168.1.2"]
+
+
+@pytest.mark.asyncio
+async def test_dangerous_pattern_anywhere_in_filename_reported(validator):
+    """Test dangerous patterns match anywhere in the name and the matched pattern is reported."""
+    for filename, pattern in (("call.company.mp3", ".com"), ("call|1.mp3", "|"), ("a..b.mp3", "..")):
+        mock_file = MagicMock()
+        mock_file.filename = filename
+        mock_file.content_type = "audio/mpeg"
+        mock_file.size = 1000
+
+        with pytest.raises(ValidationError, match=re.escape(f"dangerous pattern '{pattern}'")):
+            await validator.validate_upload_file(mock_file, "192.168.1.1")
+
+
+@pytest.mark.asyncio
+async def test_mp3_frame_sync_headers_accepted(validator):
+    """Test bare MPEG-1 and MPEG-2 Layer III frame headers pass without an ID3 tag."""
+    for second_byte in (0xFB, 0xFA, 0xF3, 0xF2):
+        content = bytes((0xFF, second_byte)) + b"\x90\x00" + b"\x00" * 1100
+        mock_file = create_async_mock_file("frame.mp3", "audio/mpeg", content)
+        await validator.validate_upload_file(mock_file, f"192.168.2.{second_byte}")
+
+    content = b"\xff\xe3\x90\x00" + b"\x00" * 1100  # MPEG-2.5, not accepted
+    mock_file = create_async_mock_file("frame.mp3", "audio/mpeg", content)
+    with pytest.raises(ValidationError, match="Invalid MP3 file header"):
+        await validator.validate_upload_file(mock_file, "192.168.2.1")
+
+
+@pytest.mark.asyncio
+async def test_id3_tag_skipped_to_first_frame(validator):
+    """Test the synchsafe ID3 size is followed to the first frame, which must be a real frame header."""
+    tag = b"ID3\x03\x00\x00\x00\x00\x01\x04" + b"T" * 132  # 132-byte tag body: 0x01 << 7 | 0x04
+    cases = [
+        (tag + b"\xff\xfb\x90\x00" + b"\x00" * 1100, None),
+        (tag + b"\x00" * 1100, "Invalid MP3 file header"),
+        (b"ID3\x03\x00\x00\x00\x80\x00\x00" + b"\xff\xfb" + b"\x00" * 1100, "Invalid MP3 file header"),
+        # Artwork-sized tag reaching past the validated prefix
+        (b"ID3\x03\x00\x00\x00\x01\x00\x00" + b"\x00" * 20_000, None),
+    ]
+
+    for index, (content, error) in enumerate(cases):
+        mock_file = create_async_mock_file("tagged.mp3", "audio/mpeg", content)
+        validator.config.max_file_size = len(content)
+        if error is None:
+            await validator.validate_upload_file(mock_file, f"192.168.3.{index}")
+        else:
+            with pytest.raises(ValidationError, match=error):
+                await validator.validate_upload_file(mock_file, f"192.168.3.{index}")
+
+
+@pytest.mark.asyncio
+async def test_generic_content_type_accepted_for_mp3_extension(validator):
+    """Test a generic declared MIME type is accepted when the validated extension implies an allowed one."""
+    content = b"ID3\x03\x00\x00\x00\x00\x00\x00\xff\xfb\x90\x00" + b"\x00" * 1100
+    mock_file = create_async_mock_file("call.mp3", "application/octet-stream", content)
+
+    await validator.validate_upload_file(mock_file, "192.168.4.1")
+
+    validator.config.allowed_mime_types = {"audio/mp3"}
+    with pytest.raises(ValidationError, match="Invalid content type"):
+        await validator.validate_upload_file(mock_file, "192.168.4.1")
+
+
+def test_security_config_allowed_lists_frozen_and_rendered_once():
+    """Test allowed types are frozensets and their error-message text follows reassignment."""
+    config = SecurityConfig()
+
+    assert isinstance(config.allowed_extensions, frozenset)
+    assert config.allowed_mime_types_text == "audio/mp3, audio/mpeg"
+
+    config.allowed_mime_types = frozenset({"audio/mpeg"})
+    assert config.allowed_mime_types_text == "audio/mpeg"
+
+
+@pytest.mark.asyncio
+async def test_script_markers_detected_only_in_leading_bytes(validator):
+    """Test script markers are caught in any case within the first 64 bytes and ignored after them."""
+    tag = b"ID3\x03\x00\x00\x00\x00\x00\x00"
+    frame = b"\xff\xfb\x90\x00"
+
+    mock_file = create_async_mock_file("script.mp3", "audio/mpeg", tag + b"<ScRiPt>" + b"\x00" * 1100)
+    with pytest.raises(ValidationError, match="Script content detected"):
+        await validator.validate_upload_file(mock_file, "192.168.5.1")
+
+    content = tag + frame + b"\x00" * 60 + b"JavaScript:" + b"\x00" * 1100
+    mock_file = create_async_mock_file("late.mp3", "audio/mpeg", content)
+    await validator.validate_upload_file(mock_file, "192.168.5.2")
+
+
+@pytest.mark.parametrize(
+    "header, message",
+    [
+        (b"\x7fELF\x02\x01\x01" + b"\x00" * 20, "Executable file detected"),
+        (b"\xca\xfe\xba\xbe" + b"\x00" * 20, "Java class file detected"),
+        (b"%PDF-1.7" + b"\x00" * 20, "PDF file detected"),
+        (b"ID3\x03" + b"\x00" * 20 + b"javascript:", "Script content detected"),
+    ],
+)
+def test_signature_scan_reports_matching_signature(validator, header, message):
+    """Test each malicious signature is reported by its own message."""
+    with pytest.raises(ValidationError, match=message):
+        validator._scan_malicious_content(header)
+
+
+def test_file_signatures_only_match_at_start(validator):
+    """Test executable signatures later in the header are not flagged."""
+    validator._scan_malicious_content(b"ID3\x03" + b"\x00" * 8 + b"\x7fELF%PDF" + b"\x00" * 20)
+
+
+@pytest.mark.asyncio
+async def test_size_falls_back_to_content_length_bound(validator):
+    """Test a file without a recorded size is bounded by Content-Length, and rejected without either."""
+    content = b"ID3\x03\x00\x00\x00\x00\x00\x00\xff\xfb\x90\x00" + b"\x00" * 1100
+    mock_file = create_async_mock_file("unsized.mp3", "audio/mpeg", content)
+    mock_file.size = None
+
+    await validator.validate_upload_file(mock_file, "192.168.6.1", content_length=len(content) + 300)
+
+    with pytest.raises(ValidationError, match="File too large"):
+        await validator.validate_upload_file(mock_file, "192.168.6.1", content_length=2 * 1024 * 1024)
+
+    with pytest.raises(ValidationError, match="Upload size unknown"):
+        await validator.validate_upload_file(mock_file, "192.168.6.1")
@@ -0,0 +1,124 @@
+"""Tests for the transcription task queue."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from stable_squirrel.services.task_queue import QueueStats, TaskStatus, TranscriptionTask, TranscriptionTaskQueue
+
+
+def finished_task(age: timedelta) -> TranscriptionTask:
+    age_ns = int(age.total_seconds() * 1_000_000_000)
+    return TranscriptionTask(status=TaskStatus.COMPLETED, completed_at=time.monotonic_ns() - age_ns)
+
+
+@pytest.mark.asyncio
+async def test_cleanup_expires_only_tasks_older_than_cutoff():
+    """Test cleanup drops finished tasks past the age limit and keeps newer ones in order."""
+    queue = TranscriptionTaskQueue()
+    tasks = [finished_task(timedelta(hours=hours)) for hours in (30, 25, 2, 1)]
+    for task in tasks:
+        queue.completed_tasks[task.task_id] = task
+    failed = finished_task(timedelta(hours=48))
+    queue.failed_tasks[failed.task_id] = failed
+
+    await queue.cleanup_old_tasks(max_age_hours=24)
+
+    assert list(queue.completed_tasks) == [tasks[2].task_id, tasks[3].task_id]
+    assert not queue.failed_tasks
+
+
+def test_finished_tasks_capped_oldest_evicted():
+    """Test finished task tracking never exceeds its capacity, forgetting the oldest first."""
+    queue = TranscriptionTaskQueue(max_finished_tasks=2)
+    tasks = [finished_task(timedelta(minutes=minutes)) for minutes in (3, 2, 1)]
+
+    for task in tasks:
+        queue._mark_task_failed(task)
+
+    assert list(queue.failed_tasks) == [tasks[1].task_id, tasks[2].task_id]
+    assert queue.stats["total_failed"] == 3
+
+
+def test_task_id_serialized_as_hex():
+    """Test task IDs are tracked as raw bytes and only rendered as hex when serialized."""
+    task = TranscriptionTask()
+
+    assert len(task.task_id) == 16
+    assert task.to_dict()["task_id"] == task.task_id.hex()
+
+
+def test_task_times_serialized_as_wall_clock():
+    """Test monotonic task times are rendered as current local timestamps."""
+    task = finished_task(timedelta(minutes=5))
+
+    completed_at = datetime.fromisoformat(task.to_dict()["completed_at"])
+
+    assert abs(datetime.now() - timedelta(minutes=5) - completed_at) < timedelta(seconds=5)
+    assert task.to_dict()["started_at"] is None
+
+
+@pytest.mark.asyncio
+async def test_workers_take_retries_directly_and_first():
+    """Test retried tasks are taken straight from the retry queue, ahead of new tasks."""
+    queue = TranscriptionTaskQueue()
+    new_task, retried = TranscriptionTask(), TranscriptionTask()
+    queue.task_queue.put_nowait(new_task)
+    queue.retry_queue.put_nowait(retried)
+
+    assert await queue._next_tasks(timeout=0.1) == [(queue.retry_queue, retried)]
+    assert await queue._next_tasks(timeout=0.1) == [(queue.task_queue, new_task)]
+    assert await queue._next_tasks(timeout=0.05) == []
+
+    waiting = asyncio.create_task(queue._next_tasks(timeout=1.0))
+    await asyncio.sleep(0)
+    queue.retry_queue.put_nowait(retried)
+    assert await waiting == [(queue.retry_queue, retried)]
+    assert queue.task_queue.empty() and queue.retry_queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_average_processing_time_is_running_mean(monkeypatch):
+    """Test the reported average is the plain mean of every processed task, zero-length ones included."""
+    queue = TranscriptionTaskQueue()
+    readings = iter([0, 0, 0, 2_000_000_000, 0, 4_000_000_000])
+    monkeypatch.setattr("stable_squirrel.services.task_queue.time.monotonic_ns", lambda: next(readings))
+
+    for _ in range(3):
+        task = TranscriptionTask()
+        queue.active_tasks[task.task_id] = task
+        await queue._process_task(task, "worker-1")
+
+    assert queue.stats["total_processed"] == 3
+    assert queue.stats["average_processing_time"] == pytest.approx(2.0)
+
+
+def test_failed_attempts_retry_until_limit():
+    """Test a failing task is marked for retry until max_retries, then failed for good."""
+    queue = TranscriptionTaskQueue()
+    task = TranscriptionTask(max_retries=1)
+
+    assert task.mark_attempt_failed(RuntimeError("boom")) is True
+    assert task.status == TaskStatus.RETRYING
+    assert task.mark_attempt_failed(RuntimeError("boom again")) is False
+
+    queue._mark_task_failed(task)
+    assert task.status == TaskStatus.FAILED
+    assert task.error_message == "boom again"
+    assert not hasattr(task, "__dict__")
+
+
+def test_queue_stats_merge_counters_with_current_sizes():
+    """Test queue stats report the running counters alongside the live queue sizes."""
+    queue = TranscriptionTaskQueue()
+    queue.stats["total_enqueued"] = 2
+    queue.task_queue.put_nowait(TranscriptionTask())
+
+    stats = queue.get_queue_stats()
+
+    assert stats["total_enqueued"] == 2
+    assert stats["queue_size"] == 1
+    assert stats["is_running"] is False
+    assert set(stats) == set(QueueStats.__annotations__)
@@ -1,6 +1,9 @@
 """Tests for transcription service."""
 
+import asyncio
 import tempfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -136,6 +139,41 @@ async def test_transcription_service_start(mock_cuda_available, mock_whisperx, t
     mock_whisperx.DiarizationPipeline.assert_called_once()
 
 
+@pytest.mark.parametrize(
+    "device,compute_type,expected",
+    [("cuda", "auto", "int8_float16"), ("cpu", "auto", "int8"), ("cuda", "float16", "float16")],
+)
+def test_load_model_compute_type(device, compute_type, expected, mock_db_manager):
+    """Test compute_type "auto" picks int8 weights per device and explicit values pass through."""
+    with patch("stable_squirrel.services.transcription.whisperx") as mock_whisperx:
+        mock_whisperx.load_align_model.return_value = (MagicMock(), MagicMock())
+        config = TranscriptionConfig(model_name="base", device=device, compute_type=compute_type)
+        service = TranscriptionService(config, mock_db_manager)
+
+        service._load_model_sync()
+
+        mock_whisperx.load_model.assert_called_once_with("base", device=device, compute_type=expected)
+
+
+def test_load_model_warms_up_models(transcription_config, mock_db_manager):
+    """Test loading runs a silent clip through transcription and alignment, tolerating failures."""
+    with patch("stable_squirrel.services.transcription.whisperx") as mock_whisperx:
+        mock_whisperx.load_align_model.return_value = (MagicMock(), MagicMock())
+        service = TranscriptionService(transcription_config, mock_db_manager)
+
+        service._load_model_sync()
+
+        (silence,), kwargs = service._model.transcribe.call_args
+        assert len(silence) == 16000 * 15 and not silence.any()
+        assert kwargs == {"batch_size": 8, "language": "en"}
+        mock_whisperx.align.assert_called_once()
+
+        # A failed warmup must not fail model loading
+        mock_whisperx.load_model.return_value.transcribe.side_effect = RuntimeError("CUDA error")
+        service._load_model_sync()
+        assert service._model is not None
+
+
 @pytest.mark.asyncio
 async def test_transcription_service_stop(transcription_config, mock_db_manager):
     """Test stopping the transcription service."""
@@ -269,6 +307,65 @@ async def test_transcribe_rdioscanner_call(
             service.db_ops.store_complete_transcription.assert_called_once()
 
 
+@pytest.mark.asyncio
+@patch("stable_squirrel.services.transcription.whisperx")
+async def test_run_pipeline_serializes_inference(
+    mock_whisperx, transcription_config, mock_db_manager, mock_whisperx_result
+):
+    """Test concurrent callers share the model one inference at a time."""
+    active, peak = [0], [0]
+
+    def transcribe(audio, **kwargs):
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        active[0] -= 1
+        return dict(mock_whisperx_result)
+
+    service = TranscriptionService(transcription_config, mock_db_manager)
+    service._model = MagicMock(device="cpu")
+    service._model.transcribe.side_effect = transcribe
+    service._diarize_model = None
+
+    results = await asyncio.gather(*(service._run_pipeline(Path(f"/tmp/call{i}.wav")) for i in range(3)))
+
+    assert peak[0] == 1
+    assert [language for _, language in results] == ["en", "en", "en"]
+    assert mock_whisperx.load_audio.call_count == 3
+
+
+@pytest.mark.asyncio
+@patch("stable_squirrel.services.transcription.whisperx")
+async def test_alignment_overlaps_next_transcription(
+    mock_whisperx, transcription_config, mock_db_manager, mock_whisperx_result
+):
+    """Test one call's alignment runs while the next call is being transcribed."""
+    second_transcribing = threading.Event()
+    overlapped = []
+
+    def transcribe(audio, **kwargs):
+        if audio == "second":
+            second_transcribing.set()
+        return dict(mock_whisperx_result)
+
+    def align(segments, model, metadata, audio, device):
+        if audio == "first":
+            overlapped.append(second_transcribing.wait(timeout=2))
+        return dict(mock_whisperx_result)
+
+    mock_whisperx.load_audio.side_effect = lambda path: Path(path).stem
+    mock_whisperx.align.side_effect = align
+    service = TranscriptionService(transcription_config, mock_db_manager)
+    service._model = MagicMock(device="cpu")
+    service._model.transcribe.side_effect = transcribe
+    service._align_model, service._metadata = MagicMock(), {"language": "en"}
+    service._diarize_model = None
+
+    await asyncio.gather(service._run_pipeline(Path("/tmp/first.wav")), service._run_pipeline(Path("/tmp/second.wav")))
+
+    assert overlapped == [True]
+
+
 @pytest.mark.asyncio
 @patch("librosa.get_duration", side_effect=ImportError("librosa not available"))
 async def test_extract_audio_metadata_without_librosa(
@@ -0,0 +1,35 @@
+"""Tests for buffered UUID generation."""
+
+import time
+from uuid import UUID
+
+from stable_squirrel.utils.uuid_pool import next_uuid
+
+
+def test_next_uuid_is_time_ordered_version_7():
+    """Test generated IDs are RFC 9562 version 7 UUIDs carrying the current millisecond timestamp."""
+    before_ms = time.time_ns() // 1_000_000
+    value = next_uuid()
+    after_ms = time.time_ns() // 1_000_000
+
+    assert isinstance(value, UUID)
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+    assert before_ms <= value.int >> 80 <= after_ms
+
+
+def test_next_uuid_sorts_after_earlier_ids():
+    """Test an ID from a later millisecond always sorts after an earlier one."""
+    first = next_uuid()
+    time.sleep(0.002)
+    second = next_uuid()
+
+    assert first < second
+    assert str(first) < str(second)
+
+
+def test_next_uuid_unique_across_buffer_refills():
+    """Test IDs stay unique when generation spans several entropy buffers."""
+    values = {next_uuid() for _ in range(1000)}  # ~3 refills of the 409-ID buffer
+
+    assert len(values) == 1000